@@ -1,13 +1,27 @@
 from flask import Flask
 import os
 
+from .utils.json_provider import NumpyJSONProvider
+
 def create_app(test_config=None):    # Create and configure the app
     app = Flask(__name__, instance_relative_config=True)
+    # Serializar ndarray y escalares de NumPy directamente en jsonify/tojson
+    app.json = NumpyJSONProvider(app)
     
     app.config.from_mapping(
         SECRET_KEY='dev',
         # Configure the upload folder for JSON files
         UPLOAD_FOLDER=os.path.join(os.path.dirname(os.path.dirname(__file__)), 'uploads'),
+        # SQLite case store (None = manim_anim/casos.db next to casos.json)
+        CASOS_DB=None,
+        # Resolver en segundo plano los casos que se guardan o importan
+        SOLVE_ON_INSERT=True,
+        # Problemas registrados en /api/problems (None = UPLOAD_FOLDER/problems)
+        PROBLEMS_FOLDER=None,
+        # Resultados descargables (None = UPLOAD_FOLDER/results), caducidad y tamaño total
+        RESULTS_FOLDER=None,
+        RESULTS_TTL=3600,
+        RESULTS_MAX_BYTES=256 * 1024 * 1024,
     )
 
     if test_config is None:
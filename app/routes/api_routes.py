@@ -2,22 +2,36 @@
 Rutas de la API REST.
 """
 
+import io
 import json
 import os
+import hashlib
 import logging
 import uuid
-from flask import Blueprint, request, jsonify, send_from_directory, current_app
+import numpy as np
+from flask import Blueprint, Response, request, jsonify, send_from_directory, current_app, stream_with_context, url_for
 
 from ..solvers import simplex, granm_solver, dosfases_solver
 from ..solvers import SimplexError, GranMError, DosFasesError, UnboundedError, DimensionError, InfeasibleError
+from ..solvers import solve_from_basis, DualInfeasibleError, NO_SOLUTION_MESSAGES
 from ..utils import (
-    convert_numpy_types, 
-    load_casos, 
-    save_casos,
+    case_store,
     detect_multiple_solutions,
     format_multiple_solutions_result,
+    iter_solver_events,
+    iter_pivot_events,
+    sse_message,
+    BINARY_ENCODERS,
+    available_binary_mimetypes,
+    import_cases,
+    schedule_case_solutions,
+    get_problem_registry,
+    senses_from_indices,
+    apply_changes,
+    transfer_basis,
     _to_list
 )
+from ..utils.binary_encoding import NPZ_MIMETYPE
 
 logger = logging.getLogger(__name__)
 
@@ -27,20 +41,106 @@ api_bp = Blueprint('api', __name__, url_prefix='/api')
 
 # ===== GESTIÓN DE CASOS =====
 
+def _casos():
+    """Case store configured for the current app"""
+    return case_store(current_app.config.get('CASOS_DB'))
+
+
+def _solve_new_casos(store):
+    """Precompute solutions for newly saved cases in the background"""
+    if current_app.config.get('SOLVE_ON_INSERT'):
+        schedule_case_solutions(store)
+
+
+CASOS_PAGE_SIZE = 100
+CASOS_MAX_PAGE_SIZE = 1000
+
+
+def _conditional_json(payload_fn, etag):
+    """jsonify con ETag fuerte; responde 304 si coincide con If-None-Match.
+
+    `payload_fn` solo se evalúa si hay que enviar el cuerpo.
+    """
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = jsonify(payload_fn())
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def _casos_filters(args):
+    """Filtros de /api/casos a partir de la query string."""
+    filters = {}
+    if args.get('method'):
+        filters['method'] = args['method'].lower()
+    for key in ('n_vars', 'n_constraints'):
+        if args.get(key):
+            filters[key] = int(args[key])
+    if args.get('minimize'):
+        filters['minimize'] = 1 if args['minimize'].lower() in ('1', 'true', 'on') else 0
+    return filters
+
+
 @api_bp.route('/casos', methods=['GET'])
 def get_casos():
-    """Get all optimization examples"""
-    casos = load_casos()
-    return jsonify(casos)
+    """List saved examples with cursor pagination, filters and field projection
+
+    Query params: limit, cursor (last id of the previous page), fields
+    (comma-separated), method, n_vars, n_constraints, minimize. The next
+    cursor is returned in the X-Next-Cursor and Link headers.
+    """
+    try:
+        filters = _casos_filters(request.args)
+        limit = min(int(request.args.get('limit', CASOS_PAGE_SIZE)), CASOS_MAX_PAGE_SIZE)
+        cursor = int(request.args['cursor']) if request.args.get('cursor') else None
+    except ValueError:
+        return jsonify({'error': 'Parámetros de consulta inválidos'}), 400
+    if limit < 1:
+        return jsonify({'error': 'limit debe ser mayor que 0'}), 400
+    fields = [f for f in request.args.get('fields', '').split(',') if f.strip()]
+
+    store = _casos()
+    canonical = json.dumps([store.version(), filters, limit, cursor, fields], sort_keys=True)
+    etag = hashlib.sha256(canonical.encode()).hexdigest()[:32]
+    page, next_cursor = store.query(filters, after=cursor, limit=limit)
+
+    def payload():
+        if not fields:
+            return page
+        return [{k: caso[k] for k in ['id'] + fields if k in caso} for caso in page]
+
+    response = _conditional_json(payload, etag)
+    if next_cursor is not None:
+        args = request.args.to_dict()
+        args['cursor'] = next_cursor
+        response.headers['X-Next-Cursor'] = str(next_cursor)
+        response.headers['Link'] = f'<{url_for("api.get_casos", **args)}>; rel="next"'
+    return response
 
 
 @api_bp.route('/casos/<int:caso_id>', methods=['GET'])
 def get_caso(caso_id):
-    """Get a specific example by index"""
-    casos = load_casos()
-    if 0 <= caso_id < len(casos):
-        return jsonify(casos[caso_id])
-    return jsonify({'error': 'Caso no encontrado'}), 404
+    """Get a specific example by id
+
+    With ?with_solution=1 the precomputed solutions are included under
+    'solutions' ({method: result}); 'solution_status' is 'pending' until
+    the background solver has stored them.
+    """
+    store = _casos()
+    caso = store.get(caso_id)
+    if caso is None:
+        return jsonify({'error': 'Caso no encontrado'}), 404
+
+    tag = f'{caso_id}:{store.version()}'
+    if request.args.get('with_solution', '').lower() in ('1', 'true', 'yes'):
+        solutions, solved_at = store.solutions(caso_id)
+        caso = {**caso, 'solutions': solutions,
+                'solution_status': 'ready' if solutions else 'pending'}
+        tag += f':{solved_at}'
+    etag = hashlib.sha256(tag.encode()).hexdigest()[:32]
+    return _conditional_json(lambda: caso, etag)
 
 
 @api_bp.route('/casos', methods=['POST'])
@@ -51,11 +151,11 @@ def add_caso():
         if not new_caso:
             return jsonify({'error': 'No se recibieron datos'}), 400
             
-        casos = load_casos()
-        casos.append(new_caso)
-        save_casos(casos)
+        store = _casos()
+        caso_id = store.insert(new_caso)
+        _solve_new_casos(store)
         
-        return jsonify({'message': 'Caso agregado exitosamente', 'id': len(casos) - 1}), 201
+        return jsonify({'message': 'Caso agregado exitosamente', 'id': caso_id}), 201
         
     except Exception as e:
         logger.error(f"Error al agregar caso: {e}")
@@ -65,23 +165,240 @@ def add_caso():
 @api_bp.route('/casos/<int:caso_id>', methods=['DELETE'])
 def delete_caso(caso_id):
     """Delete an example"""
-    casos = load_casos()
-    if 0 <= caso_id < len(casos):
-        deleted_caso = casos.pop(caso_id)
-        save_casos(casos)
+    deleted_caso = _casos().delete(caso_id)
+    if deleted_caso is not None:
         return jsonify({'message': 'Caso eliminado exitosamente', 'deleted': deleted_caso})
     return jsonify({'error': 'Caso no encontrado'}), 404
 
 
+# ===== REGISTRO DE PROBLEMAS =====
+
+def _problems():
+    """Problem registry configured for the current app"""
+    root = current_app.config.get('PROBLEMS_FOLDER') or \
+        os.path.join(current_app.config['UPLOAD_FOLDER'], 'problems')
+    return get_problem_registry(root)
+
+
+def _with_registered_problem(data):
+    """Completa `data` con el problema registrado si trae problem_id.
+
+    Los campos enviados junto al id (c, b, sense, eq/ge_constraints,
+    minimize, M, ...) sustituyen a los guardados; `A_updates`
+    ([[fila, columna, valor], ...]) cambia entradas sueltas de A.
+
+    Raises:
+        KeyError: Si el problem_id no está registrado
+    """
+    if 'problem_id' not in data:
+        return data
+    problem = _problems().load(data['problem_id'])
+    merged = {'c': problem['c'], 'A': problem['A'], 'b': problem['b']}
+    merged.update((k, v) for k, v in data.items() if k not in ('problem_id', 'A_updates'))
+
+    if data.get('A_updates'):
+        A = np.array(merged['A'], dtype=float)
+        for i, j, value in data['A_updates']:
+            A[int(i), int(j)] = float(value)
+        merged['A'] = A
+
+    m = len(merged['b'])
+    has_indices = 'eq_constraints' in data or 'ge_constraints' in data
+    if 'sense' not in data:
+        if has_indices:
+            merged['sense'] = senses_from_indices(m, data.get('eq_constraints'), data.get('ge_constraints'))
+        elif len(problem['sense']) == m:
+            merged['sense'] = list(problem['sense'])
+    if not has_indices and 'sense' in merged:
+        merged['eq_constraints'] = [i for i, s in enumerate(merged['sense']) if s == '=']
+        merged['ge_constraints'] = [i for i, s in enumerate(merged['sense']) if s == '≥']
+    return merged
+
+
+def _resolve_problem(data):
+    """(data, None) con el problema registrado aplicado, o (None, respuesta de error)"""
+    try:
+        return _with_registered_problem(data), None
+    except KeyError:
+        return None, (jsonify({'error': f"Problema no registrado: {data.get('problem_id')}"}), 404)
+    except (IndexError, ValueError, TypeError) as e:
+        return None, (jsonify({'error': f'A_updates inválido: {str(e)}'}), 400)
+
+
+def _request_problem():
+    """JSON body of a solve request, with problem_id resolved"""
+    data = request.get_json(silent=True)
+    if not data:
+        return None, (jsonify({'error': 'No se recibieron datos JSON'}), 400)
+    return _resolve_problem(data)
+
+
+def _has_problem(data):
+    """c, A y b presentes y no vacíos (listas o arreglos)"""
+    return all(data.get(k) is not None and len(data[k]) > 0 for k in ('c', 'A', 'b'))
+
+
+PIVOT_STATS = ('iterations', 'degenerate_pivots', 'cycles_detected', 'bland_switches', 'refreshes',
+               'refresh_seconds')
+
+
+# Solo los informan algunos solvers (arranque dual y formulación de simplex,
+# crash de Dos Fases y Gran M, caché de Fase 1 de Dos Fases)
+START_STATS = ('start', 'formulation', 'crash_columns', 'artificials', 'phase1_cache')
+
+
+def _pivot_stats(stats):
+    """Pivotes, pivotes degenerados, ciclos, cambios a Bland y reinversiones de un solve"""
+    result = {key: stats.get(key, 0) for key in PIVOT_STATS}
+    result.update({key: stats[key] for key in START_STATS if key in stats})
+    return result
+
+
+# Código HTTP según el motivo de un solve sin solución (stats['status'])
+NO_SOLUTION_CODES = {'infeasible': 400, 'unbounded': 400, 'iteration_limit': 422}
+
+
+def _no_solution(stats):
+    """Cuerpo y código HTTP de un solve sin solución, según stats['status']"""
+    status = stats.get('status', 'infeasible')
+    body = {'error': NO_SOLUTION_MESSAGES[status], 'status': status, 'success': False,
+            'pivot_stats': _pivot_stats(stats)}
+    return body, NO_SOLUTION_CODES[status]
+
+
+@api_bp.route('/problems', methods=['POST'])
+def register_problem():
+    """Register c, A, b (and senses) once and get a content-hash problem_id
+
+    Accepts a JSON body {c, A, b, sense | eq_constraints/ge_constraints} or
+    an .npz with arrays c, A, b (and optionally sense), either as the raw
+    body (Content-Type application/x-npz) or as the 'file' upload.
+    """
+    try:
+        if request.mimetype == NPZ_MIMETYPE or 'file' in request.files:
+            stream = request.files['file'].stream if 'file' in request.files else request.stream
+            with np.load(io.BytesIO(stream.read()), allow_pickle=False) as npz:
+                data = {k: npz[k] for k in ('c', 'A', 'b')}
+                if 'sense' in npz:
+                    data['sense'] = [str(s) for s in npz['sense']]
+        else:
+            data = request.get_json(silent=True)
+            if not data:
+                return jsonify({'error': 'No se recibieron datos'}), 400
+        if not _has_problem(data):
+            return jsonify({'error': 'Faltan datos requeridos (c, A, b)'}), 400
+
+        sense = data.get('sense')
+        if sense is None and ('eq_constraints' in data or 'ge_constraints' in data):
+            sense = senses_from_indices(len(data['b']), data.get('eq_constraints'), data.get('ge_constraints'))
+        problem_id, info, created = _problems().register(data['c'], data['A'], data['b'], sense)
+    except (ValueError, KeyError, IndexError, DimensionError) as e:
+        return jsonify({'error': f'Problema inválido: {str(e)}'}), 400
+
+    response = jsonify(info)
+    response.status_code = 201 if created else 200
+    response.headers['Location'] = url_for('api.get_problem', problem_id=problem_id)
+    return response
+
+
+@api_bp.route('/problems/<problem_id>', methods=['GET'])
+def get_problem(problem_id):
+    """Registered problem metadata; ?include=data also returns c, A and b"""
+    registry = _problems()
+    include_data = request.args.get('include') == 'data'
+    try:
+        problem = registry.load(problem_id) if include_data else registry.info(problem_id)
+    except KeyError:
+        return jsonify({'error': 'Problema no encontrado'}), 404
+    # El id es el hash del contenido: sirve de ETag mientras exista
+    return _conditional_json(lambda: problem, f"{problem_id}{'-data' if include_data else ''}")
+
+
+@api_bp.route('/problems/<problem_id>', methods=['PATCH'])
+def patch_problem(problem_id):
+    """Apply a small delta to a registered problem and re-solve warm
+
+    Body: {"changes": [...], "minimize": false}. The modified problem is
+    registered under its own id and solved starting from the last optimal
+    basis of `problem_id` (dual simplex after adding rows or changing b,
+    primal pricing after adding columns or changing c). An empty change
+    list just solves the problem and records its basis. If the warm start
+    hits the iteration limit the problem is re-solved cold; if that also
+    fails the response is 422 with status 'iteration_limit'.
+    """
+    data = request.get_json(silent=True) or {}
+    minimize = bool(data.get('minimize', False))
+    registry = _problems()
+    try:
+        problem = registry.load(problem_id)
+    except KeyError:
+        return jsonify({'error': 'Problema no encontrado'}), 404
+
+    try:
+        c, A, b, sense, row_ids = apply_changes(problem, data.get('changes', []))
+        new_id, info, _ = registry.register(c, A, b, sense)
+    except (ValueError, IndexError, KeyError, TypeError, DimensionError) as e:
+        return jsonify({'error': f'Cambio inválido: {str(e)}'}), 400
+
+    basis = registry.load_basis(problem_id, minimize)
+    if basis is not None:
+        basis = transfer_basis(basis, len(problem['c']), problem['sense'], len(c), sense, row_ids)
+
+    stats = {}
+    try:
+        try:
+            solution, optimal_value = solve_from_basis(c, A, b, sense, minimize, basis=basis, stats=stats)
+        except RuntimeError:
+            if basis is None:
+                raise
+            # El arranque desde la base anterior no convergió: se reintenta en frío
+            logger.warning(f"Arranque en caliente de {new_id} sin converger; se resuelve en frío")
+            basis = None
+            stats = {}
+            solution, optimal_value = solve_from_basis(c, A, b, sense, minimize, stats=stats)
+    except UnboundedError as e:
+        return jsonify({**info, 'parent_id': problem_id, 'error': str(e), 'status': 'unbounded'}), 400
+    except DualInfeasibleError as e:
+        return jsonify({**info, 'parent_id': problem_id, 'error': str(e), 'status': 'infeasible'}), 400
+    except RuntimeError as e:
+        return jsonify({**info, 'parent_id': problem_id, 'error': str(e), 'status': 'iteration_limit'}), 422
+    registry.save_basis(new_id, minimize, stats['basis'])
+
+    response = jsonify({
+        **info,
+        'parent_id': problem_id,
+        'solution': solution,
+        'optimal_value': optimal_value,
+        'iterations': stats['iterations'],
+        'warm_start': stats['warm_start'] if basis is not None else 'cold',
+        'success': True
+    })
+    response.headers['Location'] = url_for('api.get_problem', problem_id=new_id)
+    return response
+
+
+@api_bp.route('/problems/<problem_id>', methods=['DELETE'])
+def delete_problem(problem_id):
+    """Delete a registered problem"""
+    try:
+        deleted = _problems().delete(problem_id)
+    except KeyError:
+        deleted = False
+    if deleted:
+        return jsonify({'message': 'Problema eliminado exitosamente', 'problem_id': problem_id})
+    return jsonify({'error': 'Problema no encontrado'}), 404
+
+
 # ===== RESOLUCIÓN DE MÉTODOS =====
 
 @api_bp.route('/resolver/simplex', methods=['POST'])
 def resolver_simplex_api():
     """Solve using Simplex method"""
+    stats = {}
     try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No se recibieron datos JSON'}), 400
+        data, error = _request_problem()
+        if error is not None:
+            return error
 
         # Extraer datos
         c = data.get('c', [])
@@ -89,50 +406,56 @@ def resolver_simplex_api():
         b = data.get('b', [])
         minimize = data.get('minimize', False)
         track_iterations = data.get('track_iterations', False)
+        formulation = data.get('formulation', 'auto')
+
+        if not _has_problem(data):
+            return jsonify({'error': 'Faltan datos requeridos (c, A, b)'}), 400
+
+        negotiated = _negotiated_response('simplex', data)
+        if negotiated is not None:
+            return negotiated
 
-        if not all([c, A, b]):
-            return jsonify({'error': 'Faltan datos requeridos (c, A, b)'}), 400        # Resolver
+        # Resolver
         if track_iterations:
             solution, optimal_value, tableau_history, pivot_history = simplex(
-                c, A, b, minimize=minimize, track_iterations=True
+                c, A, b, minimize=minimize, track_iterations=True, stats=stats, formulation=formulation
             )
-            # Convertir valores numpy a tipos nativos de Python antes de serializar
             resultado = {
-                'solution': [float(x) for x in solution],
-                'optimal_value': float(optimal_value),
-                'tableau_history': [t.tolist() for t in tableau_history],
-                'pivot_history': [[int(r), int(c)] for r, c in pivot_history],
+                'solution': solution,
+                'optimal_value': optimal_value,
+                'tableau_history': tableau_history,
+                'pivot_history': pivot_history,
                 'success': True
             }
-            # ─ Detectar soluciones múltiples óptimas con nuevo detector ─
+            # ─ Detectar soluciones múltiples con la base del solver ─
             final_tableau = tableau_history[-1]
             n_vars = len(c)
-            
-            # Usar el nuevo detector mejorado
-            multiple_solutions_result = detect_multiple_solutions(final_tableau, n_vars, c, minimize)
+            multiple_solutions_result = detect_multiple_solutions(final_tableau, n_vars, c, minimize,
+                                                                  basis=stats.get('basis'))
             formatted_result = format_multiple_solutions_result(multiple_solutions_result)
             
-            # Convertir cualquier tipo numpy en los resultados de soluciones múltiples
-            formatted_result = convert_numpy_types(formatted_result)
-            
             # Agregar información de soluciones múltiples al resultado
             resultado.update(formatted_result)
         else:
-            solution, optimal_value = simplex(c, A, b, minimize=minimize)
+            solution, optimal_value = simplex(c, A, b, minimize=minimize, stats=stats, formulation=formulation)
             resultado = {
-                'solution': [float(x) for x in solution],
-                'optimal_value': float(optimal_value),
+                'solution': solution,
+                'optimal_value': optimal_value,
                 'success': True
             }
-
-        # Convertir tipos numpy
-        resultado = convert_numpy_types(resultado)
+        resultado['pivot_stats'] = _pivot_stats(stats)
         return jsonify(resultado)
 
     except (SimplexError, DimensionError, UnboundedError) as e:
         logger.error(f"Error en método Simplex: {str(e)}")
         return jsonify({'error': f'Error en método Simplex: {str(e)}'}), 400
 
+    except RuntimeError as e:
+        # Límite de iteraciones: no es un fallo del servidor
+        logger.warning(f"Simplex sin converger: {str(e)}")
+        body, code = _no_solution({**stats, 'status': 'iteration_limit'})
+        return jsonify(body), code
+
     except Exception as e:
         logger.error(f"Error inesperado en Simplex API: {str(e)}", exc_info=True)
         return jsonify({'error': f'Error inesperado: {str(e)}'}), 500
@@ -141,10 +464,11 @@ def resolver_simplex_api():
 @api_bp.route('/resolver/granm', methods=['POST'])
 def resolver_granm_api():
     """Solve using Gran M method"""
+    stats = {}
     try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No se recibieron datos JSON'}), 400
+        data, error = _request_problem()
+        if error is not None:
+            return error
 
         # Extraer datos
         c = data.get('c', [])
@@ -155,44 +479,54 @@ def resolver_granm_api():
         track_iterations = data.get('track_iterations', False)
         M = data.get('M', 1e6)
 
-        if not all([c, A, b]):
+        if not _has_problem(data):
             return jsonify({'error': 'Faltan datos requeridos (c, A, b)'}), 400
 
+        negotiated = _negotiated_response('granm', data)
+        if negotiated is not None:
+            return negotiated
+
         if track_iterations:
             sol, z, T_hist, piv_hist = granm_solver(
                 c, A, b, sense,
-                minimize=minimize, track_iterations=True, M=M
+                minimize=minimize, track_iterations=True, M=M, stats=stats
             )
             resultado = {
-                'solution': sol.tolist(),
-                'optimal_value': float(z),
-                'tableau_history': [t.tolist() for t in T_hist],
-                'pivot_history': [[int(r), int(c)] for r, c in piv_hist],
+                'solution': sol,
+                'optimal_value': z,
+                'tableau_history': T_hist,
+                'pivot_history': piv_hist,
                 'success': True
             }
 
             # Detectar soluciones múltiples
             final_tableau = T_hist[-1]
             n_vars = len(c)
-            mult_result = detect_multiple_solutions(final_tableau, n_vars)
+            mult_result = detect_multiple_solutions(final_tableau, n_vars, c, minimize,
+                                                    basis=stats.get('basis'))
             formatted_mult = format_multiple_solutions_result(mult_result)
-            resultado.update(convert_numpy_types(formatted_mult))
+            resultado.update(formatted_mult)
 
         else:
-            sol, z = granm_solver(c, A, b, sense, minimize=minimize, M=M)
+            sol, z = granm_solver(c, A, b, sense, minimize=minimize, M=M, stats=stats)
             resultado = {
-                'solution': sol.tolist(),
-                'optimal_value': float(z),
+                'solution': sol,
+                'optimal_value': z,
                 'success': True
             }
-
-        resultado = convert_numpy_types(resultado)
+        resultado['pivot_stats'] = _pivot_stats(stats)
         return jsonify(resultado)
 
     except (GranMError, DimensionError, UnboundedError) as e:
         logger.error(f"Error en método Gran M: {str(e)}")
         return jsonify({'error': f'Error en método Gran M: {str(e)}'}), 400
 
+    except RuntimeError as e:
+        # Límite de iteraciones: no es un fallo del servidor
+        logger.warning(f"Gran M sin converger: {str(e)}")
+        body, code = _no_solution({**stats, 'status': 'iteration_limit'})
+        return jsonify(body), code
+
     except Exception as e:
         logger.error(f"Error inesperado en Gran M API: {str(e)}", exc_info=True)
         return jsonify({'error': f'Error inesperado: {str(e)}'}), 500
@@ -202,9 +536,9 @@ def resolver_granm_api():
 def resolver_dosfases_api():
     """Solve using Two-Phase method"""
     try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No se recibieron datos JSON'}), 400
+        data, error = _request_problem()
+        if error is not None:
+            return error
 
         # Extraer datos
         c = data.get('c', [])
@@ -215,30 +549,46 @@ def resolver_dosfases_api():
         minimize = data.get('minimize', False)
         track_iterations = data.get('track_iterations', False)
 
-        if not all([c, A, b]):
-            return jsonify({'error': 'Faltan datos requeridos (c, A, b)'}), 400        # Resolver
+        if not _has_problem(data):
+            return jsonify({'error': 'Faltan datos requeridos (c, A, b)'}), 400
+
+        negotiated = _negotiated_response('dosfases', data)
+        if negotiated is not None:
+            return negotiated
+
+        # Resolver
+        stats = {}
         if track_iterations:
             solution, optimal_value, tableau_history, pivot_history = dosfases_solver(
                 c, A, b, eq_constraints=eq_constraints, ge_constraints=ge_constraints,
-                minimize=minimize, track_iterations=True
+                minimize=minimize, track_iterations=True, stats=stats
             )
         else:
-            resultado = dosfases_solver.solve(
-                c, A, b, eq_constraints, ge_constraints, minimize=minimize
+            solution, optimal_value = dosfases_solver(
+                c, A, b, eq_constraints=eq_constraints, ge_constraints=ge_constraints,
+                minimize=minimize, stats=stats
             )
 
-        # Detectar soluciones múltiples si hay tableau final
-        if 'tableau_final' in resultado:
-            multiple_info = detect_multiple_solutions(
-                resultado['tableau_final'], 
-                len(c), 
-                c, 
-                minimize
-            )
-            resultado['multiple_solutions'] = format_multiple_solutions_result(multiple_info)
+        if solution is None or optimal_value is None:
+            body, code = _no_solution(stats)
+            return jsonify(body), code
 
-        # Convertir tipos numpy
-        resultado = convert_numpy_types(resultado)
+        resultado = {
+            'solution': solution,
+            'optimal_value': optimal_value,
+            'success': True,
+            'pivot_stats': _pivot_stats(stats)
+        }
+
+        # Detectar soluciones múltiples si hay tableau final
+        if track_iterations:
+            resultado['tableau_history'] = tableau_history
+            resultado['pivot_history'] = pivot_history
+            resultado['tableau_phases'] = stats['tableau_phases']
+            resultado['tableau_pivots'] = stats['tableau_pivots']
+            multiple_info = detect_multiple_solutions(tableau_history[-1], len(c), c, minimize,
+                                                      basis=stats.get('basis'), z_row='last')
+            resultado.update(format_multiple_solutions_result(multiple_info))
         return jsonify(resultado)
 
     except (DosFasesError, DimensionError, UnboundedError, InfeasibleError) as e:
@@ -250,11 +600,212 @@ def resolver_dosfases_api():
         return jsonify({'error': f'Error inesperado: {str(e)}'}), 500
 
 
+# ===== STREAMING DE ITERACIONES =====
+
+SOLVER_ERRORS = (SimplexError, GranMError, DosFasesError, UnboundedError, DimensionError, InfeasibleError)
+
+
+def _problem_from_args(args):
+    """Lee un problema desde la query string (EventSource solo admite GET).
+
+    c y b separados por comas, filas de A separadas por ';' o saltos de línea.
+    También admite problem_id de un problema registrado.
+    """
+    def numbers(text):
+        return [float(x) for x in text.split(',') if x.strip()]
+
+    def indices(text):
+        return [int(x) for x in text.split(',') if x.strip()]
+
+    data = {'minimize': args.get('minimize', '').lower() in ('1', 'true', 'on')}
+    for key in ('c', 'b'):
+        if key in args:
+            data[key] = numbers(args[key])
+    if 'A' in args:
+        data['A'] = [numbers(row) for row in args['A'].replace(';', '\n').split('\n') if row.strip()]
+    if 'problem_id' in args:
+        data['problem_id'] = args['problem_id']
+    if 'sense' in args:
+        data['sense'] = [s.strip() for s in args['sense'].split(',')]
+    for key in ('eq_constraints', 'ge_constraints'):
+        if key in args:
+            data[key] = indices(args[key])
+    if 'M' in args:
+        data['M'] = float(args['M'])
+    return data
+
+
+def _build_solver_call(method, data):
+    """Devuelve (solver, args, kwargs) para resolver `data` con `method`."""
+    c = data.get('c', [])
+    A = data.get('A', [])
+    b = data.get('b', [])
+    minimize = data.get('minimize', False)
+
+    if method == 'simplex':
+        return simplex, (c, A, b), {'minimize': minimize, 'formulation': data.get('formulation', 'auto')}
+    if method == 'granm':
+        sense = data.get('sense', ['≤'] * len(b))
+        return granm_solver, (c, A, b, sense), {'minimize': minimize, 'M': data.get('M', 1e6)}
+    if method == 'dosfases':
+        return dosfases_solver, (c, A, b), {
+            'eq_constraints': data.get('eq_constraints'),
+            'ge_constraints': data.get('ge_constraints'),
+            'minimize': minimize
+        }
+    return None
+
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+
+def _negotiated_response(method, data):
+    """Respuesta NDJSON o binaria según la cabecera Accept.
+
+    Devuelve None cuando corresponde la respuesta JSON habitual.
+    """
+    offered = ['application/json', NDJSON_MIMETYPE] + available_binary_mimetypes()
+    mimetype = request.accept_mimetypes.best_match(offered)
+    if mimetype == NDJSON_MIMETYPE:
+        return _ndjson_response(method, data)
+    if mimetype in BINARY_ENCODERS:
+        return _binary_response(method, data, mimetype)
+    return None
+
+
+def _binary_response(method, data, mimetype):
+    """Resuelve y devuelve el resultado codificado como .npz o msgpack."""
+    solver, args, kwargs = _build_solver_call(method, data)
+    track_iterations = data.get('track_iterations', False)
+    stats = {}
+    result = solver(*args, track_iterations=track_iterations, stats=stats, **kwargs)
+    if result[0] is None:
+        body, code = _no_solution(stats)
+        return jsonify(body), code
+    body = BINARY_ENCODERS[mimetype](*result, phases=stats.get('tableau_phases'),
+                                     steps=stats.get('tableau_pivots'))
+    extension = 'npz' if mimetype == 'application/x-npz' else 'msgpack'
+    return Response(body, mimetype=mimetype, headers={
+        'Content-Disposition': f'attachment; filename={method}_resultado.{extension}'
+    })
+
+
+def _ndjson_response(method, data):
+    """Respuesta NDJSON: una línea de cabecera, una por iteración y un resumen.
+
+    Solo se conservan el tableau en curso y el último, así que la memoria no
+    crece con el número de iteraciones.
+    """
+    solver, args, kwargs = _build_solver_call(method, data)
+    c = data['c']
+    minimize = data.get('minimize', False)
+    dumps = current_app.json.dumps
+
+    def generate():
+        yield dumps({
+            'type': 'header',
+            'method': method,
+            'n_vars': len(c),
+            'n_constraints': len(data['b'])
+        }, sort_keys=False) + '\n'
+        final_tableau = None
+        stats = {}
+        for event in iter_solver_events(solver, *args, stats=stats, **kwargs):
+            if event['event'] == 'iteration':
+                final_tableau = event['tableau']
+                pivot = None if event['row'] is None else [int(event['row']), int(event['col'])]
+                yield dumps({
+                    'type': 'iteration',
+                    'iteration': event['iteration'],
+                    'pivot': pivot,
+                    'tableau': final_tableau
+                }, sort_keys=False) + '\n'
+            elif event['event'] == 'error':
+                error = event['error']
+                if not isinstance(error, SOLVER_ERRORS):
+                    logger.error(f"Error inesperado en NDJSON {method}: {error}", exc_info=error)
+                yield dumps({'type': 'summary', 'success': False, 'error': str(error)}, sort_keys=False) + '\n'
+            else:
+                solution, optimal_value = event['result'][:2]
+                if solution is None:
+                    summary, _ = _no_solution(stats)
+                else:
+                    summary = {
+                        'success': True,
+                        'solution': solution,
+                        'optimal_value': optimal_value,
+                        'pivot_stats': _pivot_stats(stats)
+                    }
+                    if final_tableau is not None:
+                        mult = detect_multiple_solutions(
+                            final_tableau, len(c), c, minimize, basis=stats.get('basis'),
+                            z_row='last' if method == 'dosfases' else 'first')
+                        summary.update(format_multiple_solutions_result(mult))
+                yield dumps({'type': 'summary', **summary}, sort_keys=False) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+
+
+@api_bp.route('/stream/<method>', methods=['GET', 'POST'])
+def stream_solver(method):
+    """Stream each pivot as Server-Sent Events while the solver runs"""
+    try:
+        data = request.get_json(silent=True) if request.method == 'POST' else _problem_from_args(request.args)
+    except ValueError as e:
+        return jsonify({'error': f'Datos inválidos: {str(e)}'}), 400
+    if not data:
+        return jsonify({'error': 'No se recibieron datos'}), 400
+    data, error = _resolve_problem(data)
+    if error is not None:
+        return error
+
+    call = _build_solver_call(method, data)
+    if call is None:
+        return jsonify({'error': f'Método desconocido: {method}'}), 404
+    if not _has_problem(data):
+        return jsonify({'error': 'Faltan datos requeridos (c, A, b)'}), 400
+    solver, args, kwargs = call
+    stats = {}
+
+    def generate():
+        yield sse_message('start', {
+            'method': method,
+            'n_vars': len(data['c']),
+            'n_constraints': len(data['b'])
+        })
+        for event in iter_pivot_events(iter_solver_events(solver, *args, stats=stats, **kwargs)):
+            kind = event.pop('event')
+            if kind == 'result':
+                solution, optimal_value = event['result'][:2]
+                if solution is None:
+                    yield sse_message('error', _no_solution(stats)[0])
+                else:
+                    yield sse_message('result', {
+                        'solution': solution.tolist(),
+                        'optimal_value': optimal_value,
+                        'success': True
+                    })
+            elif kind == 'error':
+                error = event['error']
+                if not isinstance(error, SOLVER_ERRORS):
+                    logger.error(f"Error inesperado en stream {method}: {error}", exc_info=error)
+                yield sse_message('error', {'error': str(error)})
+            else:
+                yield sse_message(kind, event)
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
 # ===== ARCHIVOS ESTÁTICOS =====
 
 @api_bp.route('/upload', methods=['POST'])
 def upload_file():
-    """Upload a JSON file with examples"""
+    """Import examples from a JSON array or NDJSON file, case by case
+
+    Valid cases are appended in batches; invalid ones are reported by index.
+    With ?replace=1 the library is replaced only if the whole file was read.
+    """
     if 'file' not in request.files:
         return jsonify({'error': 'No se seleccionó archivo'}), 400
     
@@ -262,18 +813,22 @@ def upload_file():
     if file.filename == '':
         return jsonify({'error': 'No se seleccionó archivo'}), 400
     
-    if file and file.filename.endswith('.json'):
+    if file and file.filename.endswith(('.json', '.ndjson', '.jsonl')):
+        replace = request.args.get('replace', '').lower() in ('1', 'true', 'yes')
+        store = _casos()
         try:
-            data = json.load(file)
-            save_casos(data)
-            return jsonify({'message': 'Archivo cargado exitosamente', 'casos_count': len(data)})
-        except json.JSONDecodeError:
-            return jsonify({'error': 'Archivo JSON inválido'}), 400
+            report = import_cases(store, file.stream, replace=replace)
         except Exception as e:
             logger.error(f"Error al cargar archivo: {e}")
             return jsonify({'error': f'Error al procesar archivo: {str(e)}'}), 500
+
+        if report['imported']:
+            _solve_new_casos(store)
+        if 'aborted' in report and report['imported'] == 0:
+            return jsonify({'error': f"No se importó ningún caso: {report['aborted']}", **report}), 400
+        return jsonify({'message': 'Archivo cargado exitosamente', 'casos_count': report['imported'], **report})
     
-    return jsonify({'error': 'Solo se permiten archivos JSON'}), 400
+    return jsonify({'error': 'Solo se permiten archivos JSON o NDJSON'}), 400
 
 
 # Favicon route (moved from main routes)
@@ -2,16 +2,21 @@
 Rutas principales de la interfaz web.
 """
 
-import json
+import os
 import time
 import logging
-from flask import Blueprint, request, render_template, flash, redirect, url_for, make_response
+from flask import (
+    Blueprint, Response, request, render_template, flash, redirect, url_for, send_file,
+    current_app, stream_with_context, jsonify
+)
 
 from ..solvers import simplex, granm_solver, dosfases_solver
 from ..solvers import SimplexError, GranMError, DosFasesError, UnboundedError, DimensionError, InfeasibleError
+from ..solvers import NO_SOLUTION_MESSAGES
 from ..utils import (
-    convert_numpy_types, validate_dimensions, validate_form_data,
-    detect_multiple_solutions, format_multiple_solutions_result
+    validate_dimensions, validate_form_data, parse_vector, parse_matrix,
+    detect_multiple_solutions, format_multiple_solutions_result, get_result_store,
+    csv_chunks, write_parquet, parquet_available, has_history, iteration_summary, load_iteration
 )
 
 logger = logging.getLogger(__name__)
@@ -20,6 +25,41 @@ logger = logging.getLogger(__name__)
 main_bp = Blueprint('main', __name__)
 
 
+@main_bp.app_context_processor
+def _export_formats():
+    """El botón de Parquet solo se muestra si pyarrow está instalado"""
+    return {'parquet_available': parquet_available()}
+
+
+def _results():
+    """Almacén de resultados descargables configurado para la app"""
+    config = current_app.config
+    root = config.get('RESULTS_FOLDER') or os.path.join(config['UPLOAD_FOLDER'], 'results')
+    return get_result_store(root, config['RESULTS_TTL'], config['RESULTS_MAX_BYTES'])
+
+
+def _store_download(prefix, metodo, datos_entrada, resultado):
+    """Guarda la exportación JSON del resultado (y su historial) y devuelve su id de descarga"""
+    data_export = {
+        'metodo': metodo,
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'datos_entrada': datos_entrada,
+        'resultado': resultado
+    }
+    content = current_app.json.dumps(data_export, indent=2, ensure_ascii=False, sort_keys=False)
+    return _results().put(content, f'{prefix}_resultado_{int(time.time())}.json',
+                          resultado.get('tableau_history'), resultado.get('pivot_history'),
+                          resultado.get('tableau_phases'), resultado.get('tableau_pivots'))
+
+
+def _iteraciones(resultado):
+    """Primera y última iteración para la página (las demás se piden como fragmento)"""
+    if not resultado.get('tableau_history'):
+        return None
+    return iteration_summary(resultado['tableau_history'], resultado.get('pivot_history'),
+                             resultado.get('tableau_phases'), resultado.get('tableau_pivots'))
+
+
 # ===== PÁGINAS PRINCIPALES =====
 
 @main_bp.route('/')
@@ -66,41 +106,44 @@ def resolver_simplex():
         validate_dimensions(A, b, c)
         # Resolver
         if track_iterations:
+            stats = {}
             solution, optimal_value, tableau_history, pivot_history = simplex(
-                c, A, b, minimize=minimize, track_iterations=True
+                c, A, b, minimize=minimize, track_iterations=True, stats=stats
             )
-            # Convertir valores numpy a tipos nativos de Python antes de serializar
             resultado = {
-                'solution': [float(x) for x in solution],
-                'optimal_value': float(optimal_value),
-                'tableau_history': [t.tolist() for t in tableau_history],
-                'pivot_history': [[int(r), int(c)] for r, c in pivot_history],
+                'solution': solution,
+                'optimal_value': optimal_value,
+                'tableau_history': tableau_history,
+                'pivot_history': pivot_history,
                 'success': True
             }
-            # ─ Detectar soluciones múltiples óptimas con nuevo detector ─
+            # ─ Detectar soluciones múltiples con la base del solver ─
             final_tableau = tableau_history[-1]
             n_vars = len(c)
-            
-            # Usar el nuevo detector mejorado
-            multiple_solutions_result = detect_multiple_solutions(final_tableau, n_vars, c, minimize)
+            multiple_solutions_result = detect_multiple_solutions(final_tableau, n_vars, c, minimize,
+                                                                  basis=stats.get('basis'))
             formatted_result = format_multiple_solutions_result(multiple_solutions_result)
             
-            # Convertir cualquier tipo numpy en los resultados de soluciones múltiples
-            formatted_result = convert_numpy_types(formatted_result)
-            
             # Agregar información de soluciones múltiples al resultado
             resultado.update(formatted_result)
         else:
             solution, optimal_value = simplex(c, A, b, minimize=minimize)
             resultado = {
-                'solution': [float(x) for x in solution],
-                'optimal_value': float(optimal_value),
+                'solution': solution,
+                'optimal_value': optimal_value,
                 'success': True
             }
         
-        # Aplicar conversión final de numpy a todos los datos del resultado
-        resultado = convert_numpy_types(resultado)
-        return render_template('simplex.html', resultado=resultado, form_data=form_data)
+        download_id = _store_download('simplex', 'Simplex', {
+            'funcion_objetivo': form_data['c'],
+            'matriz_restricciones': form_data['A'],
+            'vector_recursos': form_data['b'],
+            'minimizar': minimize,
+            'mostrar_iteraciones': track_iterations
+        }, resultado)
+        return render_template('simplex.html', resultado=resultado, form_data=form_data,
+                               download_id=download_id,
+                               iteraciones=_iteraciones(resultado))
         
     except (SimplexError, DimensionError, UnboundedError) as e:
         flash(f'Error en el método Simplex: {str(e)}', 'danger')
@@ -110,54 +153,6 @@ def resolver_simplex():
         return redirect(url_for('main.simplex_page'))
 
 
-@main_bp.route('/descargar/simplex_json', methods=['POST'])
-def descargar_simplex_json():
-    try:
-        # Obtener datos del formulario enviados desde el botón de descarga
-        resultado_json = request.form.get('resultado_json')
-        
-        if not resultado_json:
-            flash('No hay resultado para descargar', 'error')
-            return redirect(url_for('main.simplex_page'))
-        
-        # Parsear los datos del resultado
-        resultado = json.loads(resultado_json)
-        
-        # Recoger los datos del formulario directamente
-        form_data = {
-            'c': request.form.get('c', ''),
-            'A': request.form.get('A', ''),
-            'b': request.form.get('b', ''),
-            'minimize': request.form.get('minimize') == 'on',
-            'track_iterations': request.form.get('track_iterations') == 'on'
-        }
-        
-        # Crear estructura completa para el JSON
-        data_export = {
-            'metodo': 'Simplex',
-            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-            'datos_entrada': {
-                'funcion_objetivo': form_data.get('c', ''),
-                'matriz_restricciones': form_data.get('A', ''),
-                'vector_recursos': form_data.get('b', ''),
-                'minimizar': form_data.get('minimize', False),
-                'mostrar_iteraciones': form_data.get('track_iterations', False)
-            },
-            'resultado': resultado
-        }
-        
-        # Crear respuesta de descarga
-        response = make_response(json.dumps(data_export, indent=2, ensure_ascii=False))
-        response.headers['Content-Type'] = 'application/json'
-        response.headers['Content-Disposition'] = f'attachment; filename=simplex_resultado_{int(time.time())}.json'
-        
-        return response
-    
-    except Exception as e:
-        flash(f'Error al descargar: {str(e)}', 'error')
-        return redirect(url_for('main.simplex_page'))
-
-
 @main_bp.route('/resolver/granm', methods=['POST'])
 def resolver_granm():
     try:
@@ -184,13 +179,9 @@ def resolver_granm():
         }
 
         # ── 2. Parseo de listas numéricas ───────────────
-        c = [float(x) for x in c_str.split(',') if x.strip()]
-        A = [[float(num) for num in row.split(',') if num.strip()]
-             for row in A_str.strip().split('\n') if row.strip()]
-        b = [float(x) for x in b_str.split(',') if x.strip()]
-
-        # Validaciones básicas
-        validate_dimensions(A, b, c)
+        c = parse_vector(c_str, 'c')
+        b = parse_vector(b_str, 'b')
+        A = parse_matrix(A_str, 'A', n_rows=len(b), n_cols=len(c))
 
         # ── 3. Construir vector sense ───────────────────
         m = len(b)
@@ -215,28 +206,34 @@ def resolver_granm():
                 c, A, b, sense,
                 minimize=minimize, track_iterations=True, M=M_val
             )
-            # Convertir valores numpy a tipos nativos de Python antes de serializar
             resultado = {
-                'solution': [float(x) for x in sol],
-                'optimal_value': float(z),
-                'tableau_history': [t.tolist() for t in T_hist],
-                'pivot_history': [[int(r), int(c)] for r, c in piv_hist],
+                'solution': sol,
+                'optimal_value': z,
+                'tableau_history': T_hist,
+                'pivot_history': piv_hist,
                 'success': True
             }
         else:
             sol, z = granm_solver(c, A, b, sense, minimize=minimize, M=M_val)
             resultado = {
-                'solution': [float(x) for x in sol],
-                'optimal_value': float(z),
+                'solution': sol,
+                'optimal_value': z,
                 'success': True
             }
 
-        # Aplicar conversión final de numpy a todos los datos del resultado
-        resultado = convert_numpy_types(resultado)
-
+        download_id = _store_download('granm', 'Gran M', {
+            'funcion_objetivo': c_str,
+            'matriz_restricciones': A_str,
+            'vector_recursos': b_str,
+            'valor_M': M_str,
+            'minimizar': minimize,
+            'mostrar_iteraciones': track_iterations
+        }, resultado)
         return render_template('granm.html',
                                resultado=resultado,
-                               form_data=form_data)
+                               form_data=form_data,
+                               download_id=download_id,
+                               iteraciones=_iteraciones(resultado))
                                
     except (GranMError, DimensionError, UnboundedError) as e:
         flash(f'Error en el método Gran M: {str(e)}', 'danger')
@@ -247,56 +244,6 @@ def resolver_granm():
         return redirect(url_for('main.granm_page'))
 
 
-@main_bp.route('/descargar/granm_json', methods=['POST'])
-def descargar_granm_json():
-    try:
-        # Obtener datos del formulario enviados desde el botón de descarga
-        resultado_json = request.form.get('resultado_json')
-        
-        if not resultado_json:
-            flash('No hay resultado para descargar', 'error')
-            return redirect(url_for('main.granm_page'))
-        
-        # Parsear los datos del resultado
-        resultado = json.loads(resultado_json)
-        
-        # Recoger los datos del formulario directamente
-        form_data = {
-            'c': request.form.get('c', ''),
-            'A': request.form.get('A', ''),
-            'b': request.form.get('b', ''),
-            'M': request.form.get('M', ''),
-            'minimize': request.form.get('minimize') == 'on',
-            'track_iterations': request.form.get('track_iterations') == 'on'
-        }
-        
-        # Crear estructura completa para el JSON
-        data_export = {
-            'metodo': 'Gran M',
-            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-            'datos_entrada': {
-                'funcion_objetivo': form_data.get('c', ''),
-                'matriz_restricciones': form_data.get('A', ''),
-                'vector_recursos': form_data.get('b', ''),
-                'valor_M': form_data.get('M', '1000'),
-                'minimizar': form_data.get('minimize', False),
-                'mostrar_iteraciones': form_data.get('track_iterations', False)
-            },
-            'resultado': resultado
-        }
-        
-        # Crear respuesta de descarga
-        response = make_response(json.dumps(data_export, indent=2, ensure_ascii=False))
-        response.headers['Content-Type'] = 'application/json'
-        response.headers['Content-Disposition'] = f'attachment; filename=granm_resultado_{int(time.time())}.json'
-        
-        return response
-    
-    except Exception as e:
-        flash(f'Error al descargar: {str(e)}', 'error')
-        return redirect(url_for('main.granm_page'))
-
-
 @main_bp.route('/resolver/dosfases', methods=['POST'])
 def resolver_dosfases():
     try:
@@ -324,10 +271,9 @@ def resolver_dosfases():
             flash('El vector b es requerido', 'error')
             return render_template('dosfases.html', form_data=form_data)
         
-        c = list(map(float, form_data['c'].split(',')))
-        A_rows = form_data['A'].strip().split('\n')
-        A = [list(map(float, row.split(','))) for row in A_rows]
-        b = list(map(float, form_data['b'].split(',')))
+        c = parse_vector(form_data['c'], 'c')
+        b = parse_vector(form_data['b'], 'b')
+        A = parse_matrix(form_data['A'], 'A', n_rows=len(b), n_cols=len(c))
         
         eq_constraints = None
         if form_data['eq_constraints'].strip():
@@ -339,22 +285,25 @@ def resolver_dosfases():
         
         minimize = form_data['minimize']
         track_iterations = form_data['track_iterations']        # Resolver
+        stats = {}
         if track_iterations:
             solution, optimal_value, tableau_history, pivot_history = dosfases_solver(
                 c, A, b, eq_constraints=eq_constraints, ge_constraints=ge_constraints, 
-                minimize=minimize, track_iterations=True
+                minimize=minimize, track_iterations=True, stats=stats
             )
             
             # Verificar si la solución es válida
             if solution is None or optimal_value is None:
-                flash('El problema no tiene solución factible', 'warning')
+                flash(NO_SOLUTION_MESSAGES[stats.get('status', 'infeasible')], 'warning')
                 return render_template('dosfases.html', form_data=form_data)
-              # Convertir valores numpy a tipos nativos de Python antes de serializar
+
             resultado = {
-                'solution': [float(x) for x in solution],
-                'optimal_value': float(optimal_value),
-                'tableau_history': [t.tolist() for t in tableau_history] if tableau_history else [],
-                'pivot_history': [[int(r), int(c)] for r, c in pivot_history] if pivot_history else [],
+                'solution': solution,
+                'optimal_value': optimal_value,
+                'tableau_history': tableau_history,
+                'pivot_history': pivot_history,
+                'tableau_phases': stats['tableau_phases'],
+                'tableau_pivots': stats['tableau_pivots'],
                 'success': True
             }
             
@@ -363,32 +312,39 @@ def resolver_dosfases():
                 final_tableau = tableau_history[-1]
                 n_vars = len(c)
                 
-                # Usar el detector de soluciones múltiples
-                multiple_solutions_result = detect_multiple_solutions(final_tableau, n_vars, c, minimize)
+                # Dos Fases deja la fila Z al final del tableau
+                multiple_solutions_result = detect_multiple_solutions(final_tableau, n_vars, c, minimize,
+                                                                      basis=stats.get('basis'), z_row='last')
                 formatted_result = format_multiple_solutions_result(multiple_solutions_result)
                 
-                # Convertir cualquier tipo numpy en los resultados de soluciones múltiples
-                formatted_result = convert_numpy_types(formatted_result)
-                
                 # Agregar información de soluciones múltiples al resultado
                 resultado.update(formatted_result)
         else:
-            solution, optimal_value = dosfases_solver(c, A, b, eq_constraints=eq_constraints, ge_constraints=ge_constraints, minimize=minimize)
+            solution, optimal_value = dosfases_solver(c, A, b, eq_constraints=eq_constraints, ge_constraints=ge_constraints,
+                                                      minimize=minimize, stats=stats)
             
             # Verificar si la solución es válida
             if solution is None or optimal_value is None:
-                flash('El problema no tiene solución factible', 'warning')
+                flash(NO_SOLUTION_MESSAGES[stats.get('status', 'infeasible')], 'warning')
                 return render_template('dosfases.html', form_data=form_data)
                 
             resultado = {
-                'solution': [float(x) for x in solution],
-                'optimal_value': float(optimal_value),
+                'solution': solution,
+                'optimal_value': optimal_value,
                 'success': True
             }
 
-        # Aplicar conversión final de numpy a todos los datos del resultado
-        resultado = convert_numpy_types(resultado)
-        return render_template('dosfases.html', resultado=resultado, form_data=form_data)
+        download_id = _store_download('dosfases', 'Dos Fases', {
+            'funcion_objetivo': form_data['c'],
+            'matriz_restricciones': form_data['A'],
+            'vector_recursos': form_data['b'],
+            'restricciones_igualdad': form_data['eq_constraints'],
+            'minimizar': minimize,
+            'mostrar_iteraciones': track_iterations
+        }, resultado)
+        return render_template('dosfases.html', resultado=resultado, form_data=form_data,
+                               download_id=download_id,
+                               iteraciones=_iteraciones(resultado))
         
     except (DosFasesError, DimensionError, UnboundedError, InfeasibleError) as e:
         flash(f'Error en el método Dos Fases: {str(e)}', 'danger')
@@ -398,51 +354,66 @@ def resolver_dosfases():
         return redirect(url_for('main.dosfases_page'))
 
 
-@main_bp.route('/descargar/dosfases_json', methods=['POST'])
-def descargar_dosfases_json():
+# ===== DESCARGAS =====
+
+@main_bp.route('/descargar/<result_id>')
+def descargar_resultado(result_id):
+    """Descarga el JSON de un resultado guardado al resolver"""
+    entry = _results().get(result_id)
+    if entry is None:
+        flash('El resultado ya no está disponible; vuelve a resolver el problema', 'warning')
+        return redirect(url_for('main.index'))
+    path, filename = entry
+    return send_file(path, mimetype='application/json', as_attachment=True, download_name=filename)
+
+
+def _history_dir(result_id):
+    path = _results().path(result_id)
+    if path is None or not has_history(path):
+        return None
+    return path
+
+
+@main_bp.route('/descargar/<result_id>/iteraciones.csv')
+def descargar_iteraciones_csv(result_id):
+    """Historial de iteraciones en formato largo como CSV (por bloques)"""
+    path = _history_dir(result_id)
+    if path is None:
+        flash('El historial de iteraciones ya no está disponible; vuelve a resolver el problema', 'warning')
+        return redirect(url_for('main.index'))
+    return Response(stream_with_context(csv_chunks(path)), mimetype='text/csv',
+                    headers={'Content-Disposition': f'attachment; filename=iteraciones_{result_id}.csv'})
+
+
+@main_bp.route('/descargar/<result_id>/iteraciones.parquet')
+def descargar_iteraciones_parquet(result_id):
+    """Historial de iteraciones en formato largo como Parquet"""
+    path = _history_dir(result_id)
+    if path is None:
+        flash('El historial de iteraciones ya no está disponible; vuelve a resolver el problema', 'warning')
+        return redirect(url_for('main.index'))
+    if not parquet_available():
+        return 'La exportación a Parquet requiere pyarrow; usa la exportación CSV', 501
+
+    parquet_path = os.path.join(path, 'iteraciones.parquet')
+    if not os.path.exists(parquet_path):
+        write_parquet(path, parquet_path)
+    return send_file(parquet_path, mimetype='application/vnd.apache.parquet', as_attachment=True,
+                     download_name=f'iteraciones_{result_id}.parquet')
+
+
+@main_bp.route('/resultado/<result_id>/iteracion/<int:k>')
+def resultado_iteracion(result_id, k):
+    """Iteración k de un resultado como fragmento HTML (o JSON con ?format=json)"""
+    path = _history_dir(result_id)
+    if path is None:
+        return 'El historial de iteraciones ya no está disponible', 404
     try:
-        # Obtener datos del formulario enviados desde el botón de descarga
-        resultado_json = request.form.get('resultado_json')
-        
-        if not resultado_json:
-            flash('No hay resultado para descargar', 'error')
-            return redirect(url_for('main.dosfases_page'))
-        
-        # Parsear los datos del resultado
-        resultado = json.loads(resultado_json)
-        
-        # Recoger los datos del formulario directamente
-        form_data = {
-            'c': request.form.get('c', ''),
-            'A': request.form.get('A', ''),
-            'b': request.form.get('b', ''),
-            'eq_constraints': request.form.get('eq_constraints', ''),
-            'minimize': request.form.get('minimize') == 'on',
-            'track_iterations': request.form.get('track_iterations') == 'on'
-        }
-        
-        # Crear estructura completa para el JSON
-        data_export = {
-            'metodo': 'Dos Fases',
-            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-            'datos_entrada': {
-                'funcion_objetivo': form_data.get('c', ''),
-                'matriz_restricciones': form_data.get('A', ''),
-                'vector_recursos': form_data.get('b', ''),
-                'restricciones_igualdad': form_data.get('eq_constraints', ''),
-                'minimizar': form_data.get('minimize', False),
-                'mostrar_iteraciones': form_data.get('track_iterations', False)
-            },
-            'resultado': resultado
-        }
-        
-        # Crear respuesta de descarga
-        response = make_response(json.dumps(data_export, indent=2, ensure_ascii=False))
-        response.headers['Content-Type'] = 'application/json'
-        response.headers['Content-Disposition'] = f'attachment; filename=dosfases_resultado_{int(time.time())}.json'
-        
-        return response
-    
-    except Exception as e:
-        flash(f'Error al descargar: {str(e)}', 'error')
-        return redirect(url_for('main.dosfases_page'))
+        iteracion = load_iteration(path, k)
+    except IndexError as e:
+        return str(e), 404
+
+    if request.args.get('format') == 'json' or \
+            request.accept_mimetypes.best_match(['text/html', 'application/json']) == 'application/json':
+        return jsonify(iteracion)
+    return render_template('_tableau.html', iteracion=iteracion)
@@ -6,7 +6,7 @@ import logging
 import numpy as np
 from .solvers import simplex, granm_solver, dosfases_solver
 from .solvers import SimplexError, GranMError, DosFasesError, UnboundedError, DimensionError, InfeasibleError
-from .solvers.multiple_solutions_detector import detect_multiple_solutions, format_multiple_solutions_result
+from .utils.multiple_solutions import detect_multiple_solutions, format_multiple_solutions_result
 from .manim_renderer import generate_manim_animation
 import uuid
 
@@ -1,3 +1,10 @@
-from .simplex_solver import simplex, SimplexError, DimensionError, NegativeBError, UnboundedError
-from .granm_solver import granm_solver, GranMError, DimensionError as GranMDimensionError, UnboundedError as GranMUnboundedError
-from .dosfases_solver import dosfases_solver, DosFasesError, InfeasibleError
+from .simplex_solver import (
+    simplex, SimplexError, DimensionError, NegativeBError, UnboundedError, InfeasibleError as SimplexInfeasibleError
+)
+from .granm_solver import (
+    granm_solver, GranMError, DimensionError as GranMDimensionError, UnboundedError as GranMUnboundedError,
+    InfeasibleError as GranMInfeasibleError
+)
+from .dosfases_solver import dosfases_solver, DosFasesError, InfeasibleError, NO_SOLUTION_MESSAGES
+from .dual_simplex import dual_simplex, primal_simplex, DualSimplexError, InfeasibleError as DualInfeasibleError
+from .warm_start import solve_from_basis, inequality_form, inequality_row_labels, column_labels
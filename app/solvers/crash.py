@@ -0,0 +1,70 @@
+import numpy as np
+
+from .pivoting import PIVOT_TOL
+
+
+# ──────────────────── Base inicial (crash) ────────────────
+# Dos Fases y Gran M necesitan una básica en cada fila ≥ / =. En lugar de
+# poner siempre una artificial se buscan columnas estructurales (o excesos)
+# que puedan ocupar esas filas: una columna sirve para la fila i si, entre
+# las filas aún sin básica, solo tiene entrada en i. Así se toman primero los
+# singletons y, a medida que se cubren filas, la estructura triangular.
+#
+# Holguras y artificiales son columnas e_i, de modo que la base candidata es
+# la identidad con las columnas elegidas en sus filas. Una columna solo se
+# acepta si la base sigue siendo primal factible (B⁻¹·b ≥ 0).
+
+
+def crash_basis(columns, b, rows, tol=PIVOT_TOL):
+    """
+    Columnas que reemplazan a la artificial de cada fila de `rows`.
+
+    Args:
+        columns: matriz m × k de columnas candidatas (variables y excesos)
+        b: lado derecho (≥ 0)
+        rows: filas ≥ / = que necesitarían una artificial
+
+    Returns:
+        dict: fila -> índice de columna en `columns`; las filas ausentes
+        siguen necesitando artificial
+    """
+    columns = np.asarray(columns, dtype=float)
+    b = np.asarray(b, dtype=float)
+    m, k = columns.shape
+    chosen = {}
+    if k == 0 or not len(rows):
+        return chosen
+
+    scale = np.abs(columns).max(axis=0)
+    nonzero = np.abs(columns) > tol * np.maximum(scale, 1.0)
+    pending = np.zeros(m, dtype=bool)
+    pending[list(rows)] = True
+    B = np.eye(m)
+    used = np.zeros(k, dtype=bool)
+    # Primero las columnas con menos entradas
+    order = np.argsort(nonzero.sum(axis=0), kind='stable')
+
+    progress = True
+    while progress and pending.any():
+        progress = False
+        for j in order:
+            if used[j]:
+                continue
+            open_rows = np.flatnonzero(nonzero[:, j] & pending)
+            if open_rows.size != 1:
+                continue
+            i = int(open_rows[0])
+            trial = B.copy()
+            trial[:, i] = columns[:, j]
+            try:
+                x = np.linalg.solve(trial, b)
+            except np.linalg.LinAlgError:
+                continue
+            if np.any(x < -tol):
+                continue
+            B = trial
+            chosen[i] = int(j)
+            used[j] = True
+            pending[i] = False
+            progress = True
+    return chosen
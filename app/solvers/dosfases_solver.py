@@ -1,5 +1,15 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
 import numpy as np
 
+from .crash import crash_basis
+from .scaling import scale_problem, column_scale, unscale_tableau
+from .pivoting import (
+    PIVOT_TOL, FEAS_TOL, REFRESH_EVERY, RESIDUAL_TOL, PivotMonitor, Reinverter, entering_column, leaving_row
+)
+
 # Exception classes for Two-Phase method
 class DosFasesError(Exception):
     """Base exception for Two-Phase method errors."""
@@ -17,7 +27,85 @@ class InfeasibleError(DosFasesError):
     """Exception raised when problem is infeasible."""
     pass
 
-def dosfases_solver(c, A, b, eq_constraints=None, ge_constraints=None, minimize=False, track_iterations=False):
+# Message for each stats['status'] left by a solve without solution
+NO_SOLUTION_MESSAGES = {
+    'infeasible': 'El problema no tiene solución factible',
+    'unbounded': 'El problema no está acotado',
+    'iteration_limit': 'Se alcanzó el límite de iteraciones sin converger',
+}
+
+# ──────────────────── Phase 1 basis cache ─────────────────
+# Feasible bases found by Phase 1, keyed by a hash of the feasible region.
+# Each entry is (kept rows, basic column of each kept row, start stats) in
+# the layout of the Phase 2 tableau: variables, then slack/surplus columns.
+# The start stats ('crash_columns', 'artificials') of the solve that ran
+# Phase 1 are restored on a hit, so repeated solves report the same stats.
+PHASE1_CACHE_SIZE = 128
+_phase1_cache = OrderedDict()
+_phase1_lock = threading.Lock()
+
+
+def phase1_cache_key(A, b, eq_constraints, ge_constraints, scale=True, crash=True):
+    """SHA-256 of A, b, the row types and the options that change the layout."""
+    h = hashlib.sha256()
+    for name, arr in (('A', A), ('b', b)):
+        arr = np.ascontiguousarray(arr, dtype=float)
+        h.update(f'{name}:{arr.shape}:'.encode())
+        h.update(arr.data)
+    for name, rows in (('eq', eq_constraints), ('ge', ge_constraints)):
+        h.update(f'{name}:{sorted(int(i) for i in rows or [])}'.encode())
+    h.update(f'scale={bool(scale)}:crash={bool(crash)}'.encode())
+    return h.hexdigest()
+
+
+def _phase1_cache_get(key):
+    with _phase1_lock:
+        entry = _phase1_cache.get(key)
+        if entry is not None:
+            _phase1_cache.move_to_end(key)
+        return entry
+
+
+def _phase1_cache_put(key, entry):
+    with _phase1_lock:
+        _phase1_cache[key] = entry
+        _phase1_cache.move_to_end(key)
+        while len(_phase1_cache) > PHASE1_CACHE_SIZE:
+            _phase1_cache.popitem(last=False)
+
+
+def clear_phase1_cache():
+    """Empty the Phase 1 basis cache."""
+    with _phase1_lock:
+        _phase1_cache.clear()
+
+
+def phase2_tableau(A_with_slack, b_std, keep, basis, tol=FEAS_TOL):
+    """
+    Phase 2 tableau (objective row left at zero) for a cached Phase 1 basis.
+
+    Returns:
+        ndarray, or None if the basis is singular or not primal feasible for
+        this data
+    """
+    rows = np.hstack([A_with_slack, b_std[:, None]])[keep]
+    B = rows[:, basis]
+    try:
+        body = np.linalg.solve(B, rows)
+    except np.linalg.LinAlgError:
+        return None
+    if np.any(body[:, -1] < -tol * (1.0 + np.abs(rows[:, -1]).max())):
+        return None
+    body[:, basis] = np.eye(len(basis))
+    tableau = np.zeros((len(keep) + 1, rows.shape[1]))
+    tableau[:-1] = body
+    return tableau
+
+
+def dosfases_solver(c, A, b, eq_constraints=None, ge_constraints=None, minimize=False, track_iterations=False,
+                    callback=None, stats=None, pivot_tol=PIVOT_TOL, feas_tol=FEAS_TOL,
+                    refresh_every=REFRESH_EVERY, residual_tol=RESIDUAL_TOL, scale=True, crash=True,
+                    phase1_cache=True):
     """
     Solves linear programming problems using the Two-Phase Method.
     
@@ -29,6 +117,33 @@ def dosfases_solver(c, A, b, eq_constraints=None, ge_constraints=None, minimize=
         ge_constraints: List of indices for >= constraints
         minimize: Whether to minimize (True) or maximize (False)
         track_iterations: Whether to track tableau iterations
+        callback: Optional ``callback(k, row, col, tableau)`` forwarded to
+            ``solve_tableau`` for every phase
+        stats: Optional dict filled with 'iterations' (pivots over both
+            phases), 'basis' (basic column of each constraint row in the
+            final tableau: variables, then slack/surplus columns) and the
+            PivotMonitor counters summed over both phases. With
+            track_iterations it also gets 'tableau_phases' (0 for Phase 1,
+            1 for Phase 2, one per history tableau) and 'tableau_pivots'
+            (the (row, col) pivot applied to each history tableau, or None
+            when the next tableau is not a pivot away, e.g. across phases).
+            When there is no solution 'status' says why: 'infeasible',
+            'unbounded' or 'iteration_limit'
+        pivot_tol, feas_tol: Harris ratio test tolerances (see
+            pivoting.leaving_row), used in both phases
+        refresh_every, residual_tol: tableau reinversion settings (see
+            pivoting.Reinverter); 'refreshes' and 'refresh_seconds' are
+            added to `stats`
+        scale: Scale A, b and c before building the tableaus (see
+            scaling.py). The solution, history and callback tableaus are
+            given in the original scale
+        crash: Let structural or surplus columns start as basic in >= / =
+            rows (see crash.py) so those rows need no artificial; 'crash_columns'
+            and 'artificials' are added to `stats`. When the crash covers every
+            row Phase 1 is skipped
+        phase1_cache: Reuse the Phase 1 basis of an earlier solve with the same
+            A, b and row types (only c or minimize changed) and go straight to
+            Phase 2; `stats['phase1_cache']` is 'hit' or 'miss'
     
     Returns:
         If track_iterations=False:
@@ -39,15 +154,33 @@ def dosfases_solver(c, A, b, eq_constraints=None, ge_constraints=None, minimize=
     c = np.array(c, dtype=float)
     A = np.array(A, dtype=float)
     b = np.array(b, dtype=float)
+    A_orig, b_orig = A, b
     
     if minimize:
         c = -c
     
     m, n = A.shape
+    scaling = None
+    if scale:
+        c, A, b, row_scale, col_scale = scale_problem(c, A, b)
+        scaling = (row_scale, col_scale)
     
     # Initialize tracking lists if needed
     tableau_history = [] if track_iterations else None
     pivot_history = [] if track_iterations else None
+    tableau_phases = [] if track_iterations else None
+    tableau_pivots = [] if track_iterations else None
+    if track_iterations and stats is not None:
+        stats['tableau_phases'] = tableau_phases
+        stats['tableau_pivots'] = tableau_pivots
+
+    def record(history, pivots, phase):
+        # pivots[k] takes history[k] to history[k + 1]; the last tableau of a
+        # block has no pivot of its own
+        tableau_history.extend(history)
+        pivot_history.extend(pivots)
+        tableau_phases.extend([phase] * len(history))
+        tableau_pivots.extend(list(pivots) + [None] * (len(history) - len(pivots)))
     
     # Initialize constraint types
     if eq_constraints is None:
@@ -95,86 +228,165 @@ def dosfases_solver(c, A, b, eq_constraints=None, ge_constraints=None, minimize=
     
     if not artificial_needed:
         # No artificial variables needed - can solve directly
-        solution, optimal_value, phase_tableau_history, phase_pivot_history = solve_standard_form(
-            c, A_with_slack, b_std, minimize, track_iterations=True
-        )        
+        phase = solve_standard_form(
+            c, A_with_slack, b_std, track_iterations=track_iterations, callback=callback,
+            stats=stats, pivot_tol=pivot_tol, feas_tol=feas_tol,
+            refresh_every=refresh_every, residual_tol=residual_tol, scaling=scaling
+        )
+        solution, optimal_value = phase[:2]
         if track_iterations and solution is not None:
-            tableau_history.extend(phase_tableau_history)
-            pivot_history.extend(phase_pivot_history)
+            record(phase[2], phase[3], 1)
+        if minimize and optimal_value is not None:
+            optimal_value = -optimal_value
+        if scale and solution is not None:
+            solution = solution * col_scale
         
         if track_iterations:
             return solution, optimal_value, tableau_history, pivot_history
         return solution, optimal_value
     
-    # Phase 1: Add artificial variables
-    num_artificial = len(artificial_needed)
-    artificial_matrix = np.zeros((m, num_artificial))
-    
-    for idx, constraint_idx in enumerate(artificial_needed):
-        artificial_matrix[constraint_idx, idx] = 1
-    
-    A_phase1 = np.hstack([A_with_slack, artificial_matrix])
-    
-    # Phase 1 objective: minimize sum of artificial variables
-    c_phase1 = np.zeros(A_phase1.shape[1])
-    for i in range(num_artificial):
-        c_phase1[n + m + i] = 1  # Coefficients for artificial variables
-    
-    # Create Phase 1 tableau
-    tableau1 = create_tableau(c_phase1, A_phase1, b_std, maximize=False)
-    
-    # Set up initial basic variables
-    basic_vars = []
-    for i in range(m):
-        if i in artificial_needed:
-            # Find the artificial variable for this constraint
-            art_idx = artificial_needed.index(i)
-            basic_vars.append(n + m + art_idx)
-        else:
-            # Use slack variable
-            basic_vars.append(n + i)
-    
-    # Make artificial variables basic in objective function by eliminating them
-    for i, constraint_idx in enumerate(artificial_needed):
-        art_var_col = n + m + i
-        if abs(tableau1[-1, art_var_col]) > 1e-10:
-            # Subtract the constraint row from objective row to make artificial var coefficient 0
-            tableau1[-1] -= tableau1[-1, art_var_col] * tableau1[constraint_idx]
-    
-    if track_iterations:
-        tableau_history.append(tableau1.copy())      # Solve Phase 1
-    solution1, optimal_value1, phase1_tableau_history, phase1_pivot_history = solve_tableau(
-        tableau1, basic_vars, track_iterations=True, minimize=True  # Fase 1 siempre es minimización
-    )
-    
-    if track_iterations and solution1 is not None:
-        tableau_history.extend(phase1_tableau_history)
-        pivot_history.extend(phase1_pivot_history)
+    # Phase 1 cache: the same feasible region (A, b, row types) gives the same
+    # Phase 1 basis whatever the objective, so Phase 2 can start from it
+    phase1_key = None
+    tableau2 = None
+    if phase1_cache:
+        phase1_key = phase1_cache_key(A_orig, b_orig, eq_constraints, ge_constraints, scale, crash)
+        cached = _phase1_cache_get(phase1_key)
+        if cached is not None:
+            keep, basic_vars_phase2, start_stats = cached
+            tableau2 = phase2_tableau(A_with_slack, b_std, keep, basic_vars_phase2, feas_tol)
+        if stats is not None:
+            stats['phase1_cache'] = 'hit' if tableau2 is not None else 'miss'
+            if tableau2 is not None:
+                stats.update(start_stats)
+
+    if tableau2 is None:
+        # Crash basis: rows with a usable structural or surplus column get no artificial
+        crash_cols = {}
+        if crash:
+            candidate_cols = list(range(n)) + [n + i for i in range(m) if slack_types[i] == 'surplus']
+            crash_cols = {
+                i: candidate_cols[k]
+                for i, k in crash_basis(A_with_slack[:, candidate_cols], b_std, artificial_needed).items()
+            }
+            artificial_needed = [i for i in artificial_needed if i not in crash_cols]
+        basic_vars = [crash_cols.get(i, n + i) for i in range(m)]
+        start_stats = {'crash_columns': len(crash_cols), 'artificials': len(artificial_needed)}
+        if stats is not None:
+            stats.update(start_stats)
+
+    if tableau2 is None and not artificial_needed:
+        # The crash covered every >= / = row, so its basis is already feasible:
+        # skip Phase 1 and start Phase 2 from it
+        tableau2 = create_tableau(np.zeros(n + m), A_with_slack, b_std)
+        pivot_in(tableau2, crash_cols)
+        basic_vars_phase2 = basic_vars
+        if phase1_key is not None:
+            _phase1_cache_put(phase1_key, (list(range(m)), list(basic_vars_phase2), start_stats))
+    elif tableau2 is None:
+        # Phase 1: Add artificial variables
+        num_artificial = len(artificial_needed)
+        artificial_matrix = np.zeros((m, num_artificial))
+    
+        for idx, constraint_idx in enumerate(artificial_needed):
+            artificial_matrix[constraint_idx, idx] = 1
+    
+        A_phase1 = np.hstack([A_with_slack, artificial_matrix])
+    
+        # Phase 1 objective: minimize sum of artificial variables
+        c_phase1 = np.zeros(A_phase1.shape[1])
+        for i in range(num_artificial):
+            c_phase1[n + m + i] = 1  # Coefficients for artificial variables
+            if scale:
+                # Scaled artificial i is r_i times the original one
+                c_phase1[n + m + i] /= row_scale[artificial_needed[i]]
+    
+        # Create Phase 1 tableau
+        tableau1 = create_tableau(c_phase1, A_phase1, b_std, maximize=False)
+    
+        factors1 = column_scale(tableau1[:-1], *scaling) if scale else None
+    
+        # Rows without a crash column start with their artificial as basic
+        for art_idx, constraint_idx in enumerate(artificial_needed):
+            basic_vars[constraint_idx] = n + m + art_idx
+        pivot_in(tableau1, crash_cols)
+    
+        # Make artificial variables basic in objective function by eliminating them
+        for i, constraint_idx in enumerate(artificial_needed):
+            art_var_col = n + m + i
+            if abs(tableau1[-1, art_var_col]) > 1e-10:
+                # Subtract the constraint row from objective row to make artificial var coefficient 0
+                tableau1[-1] -= tableau1[-1, art_var_col] * tableau1[constraint_idx]
     
-    if solution1 is None or optimal_value1 > 1e-8:
         if track_iterations:
-            return None, None, tableau_history, pivot_history
-        return None, None  # Infeasible
+            record([unscale_tableau(tableau1, basic_vars, factors1, 'last', copy=True)], [], 0)
+        # Solve Phase 1
+        phase1 = solve_tableau(
+            tableau1, basic_vars, track_iterations=track_iterations, callback=callback, stats=stats,
+            pivot_tol=pivot_tol, feas_tol=feas_tol,
+            refresh_every=refresh_every, residual_tol=residual_tol, column_factors=factors1
+        )
+        solution1, optimal_value1 = phase1[:2]
+    
+        if track_iterations and solution1 is not None:
+            record(phase1[2], phase1[3], 0)
+    
+        if solution1 is None or optimal_value1 > 1e-8:
+            # Phase 1 is bounded below by 0: short of the iteration limit,
+            # failing it means the problem is infeasible
+            if stats is not None and stats.get('status') != 'iteration_limit':
+                stats['status'] = 'infeasible'
+            if track_iterations:
+                return None, None, tableau_history, pivot_history
+            return None, None  # Infeasible
     
-    # Check if artificial variables are zero
-    artificial_sum = sum(solution1[n + m + i] for i in range(num_artificial))
-    if artificial_sum > 1e-8:
-        if track_iterations:
-            return None, None, tableau_history, pivot_history
-        return None, None  # Infeasible      # Phase 2: Remove artificial variables and solve original problem
-    A_phase2 = A_phase1[:, :n + m]  # Remove artificial variable columns
+        # Check if artificial variables are zero
+        artificial_sum = sum(solution1[n + m + i] for i in range(num_artificial))
+        if artificial_sum > 1e-8:
+            if stats is not None:
+                stats['status'] = 'infeasible'
+            if track_iterations:
+                return None, None, tableau_history, pivot_history
+            return None, None  # Infeasible      # Phase 2: Remove artificial variables and solve original problem
+        A_phase2 = A_phase1[:, :n + m]  # Remove artificial variable columns
     
-    # Get the final tableau from Phase 1
-    final_tableau1 = tableau_history[-1] if track_iterations else tableau1
+        # Get the final tableau from Phase 1 (solved in place, in the scaled problem)
+        final_tableau1 = tableau1
     
-    # Extract the Phase 2 tableau from the Phase 1 final tableau
-    # Remove artificial variable columns but keep constraint and RHS structure
-    tableau2 = np.zeros((m + 1, n + m + 1))
+        # Extract the Phase 2 tableau from the Phase 1 final tableau
+        # Remove artificial variable columns but keep constraint and RHS structure
+        tableau2 = np.zeros((m + 1, n + m + 1))
     
-    # Copy constraint rows (excluding artificial variable columns)
-    tableau2[:-1, :n + m] = final_tableau1[:-1, :n + m]
-    tableau2[:-1, -1] = final_tableau1[:-1, -1]  # Copy RHS
-      # Set up Phase 2 objective function
+        # Copy constraint rows (excluding artificial variable columns)
+        tableau2[:-1, :n + m] = final_tableau1[:-1, :n + m]
+        tableau2[:-1, -1] = final_tableau1[:-1, -1]  # Copy RHS
+
+        # Phase 2 starts from the Phase 1 basis. Artificials still basic (at zero
+        # level) are pivoted out on any non-artificial column of their row; a row
+        # with no such entry is redundant and is dropped.
+        basic_vars_phase2 = list(basic_vars)
+        keep = []
+        for i, basic_var in enumerate(basic_vars_phase2):
+            if basic_var < n + m:
+                keep.append(i)
+                continue
+            candidates = np.flatnonzero(np.abs(tableau2[i, :n + m]) > 1e-8)
+            if candidates.size == 0:
+                continue
+            col = int(candidates[0])
+            tableau2[i] /= tableau2[i, col]
+            for k in range(m):
+                if k != i:
+                    tableau2[k] -= tableau2[k, col] * tableau2[i]
+            basic_vars_phase2[i] = col
+            keep.append(i)
+        if len(keep) < m:
+            tableau2 = tableau2[keep + [m]]
+            basic_vars_phase2 = [basic_vars_phase2[i] for i in keep]
+        if phase1_key is not None:
+            _phase1_cache_put(phase1_key, (keep, list(basic_vars_phase2), start_stats))
+
+    # Set up Phase 2 objective function
     c_phase2 = np.zeros(n + m)
     c_phase2[:n] = c  # Original objective coefficients (already negated if minimize=True)
     
@@ -184,55 +396,25 @@ def dosfases_solver(c, A, b, eq_constraints=None, ge_constraints=None, minimize=
     tableau2[-1, :n + m] = -c_phase2  # Always negate for maximization form
     tableau2[-1, -1] = 0  # Initial objective value
     
-    # Find current basic variables from Phase 1 solution (excluding artificial vars)
-    basic_vars_phase2 = []
-    for i in range(m):
-        found_basic = False
-        # Check each non-artificial variable to see if it's basic in row i
-        for j in range(n + m):
-            # Check if variable j is basic in constraint i
-            if abs(final_tableau1[i, j] - 1.0) < 1e-8:
-                # Check if it's the only non-zero in its column (among constraint rows)
-                is_basic = True
-                for k in range(m):
-                    if k != i and abs(final_tableau1[k, j]) > 1e-8:
-                        is_basic = False
-                        break
-                if is_basic:
-                    basic_vars_phase2.append(j)
-                    found_basic = True
-                    break
-        
-        if not found_basic:
-            # If no basic variable found for this row, use slack if available
-            if n + i < n + m:
-                basic_vars_phase2.append(n + i)
-    
-    # Ensure we have exactly m basic variables
-    while len(basic_vars_phase2) < m:
-        # Add missing slack variables if needed
-        for i in range(m):
-            slack_var = n + i
-            if slack_var not in basic_vars_phase2 and len(basic_vars_phase2) < m:
-                basic_vars_phase2.append(slack_var)
-                break
-    basic_vars_phase2 = basic_vars_phase2[:m]
-    
     # Make basic variables have zero coefficients in objective
     for i, basic_var in enumerate(basic_vars_phase2):
         if basic_var < n + m and abs(tableau2[-1, basic_var]) > 1e-8:
             # Eliminate this basic variable from objective row
             tableau2[-1] -= tableau2[-1, basic_var] * tableau2[i]
     
+    factors2 = column_scale(np.hstack([A_with_slack, b_std[:, None]]), *scaling) if scale else None
     if track_iterations:
-        tableau_history.append(tableau2.copy())    # Solve Phase 2
-    solution2, optimal_value2, phase2_tableau_history, phase2_pivot_history = solve_tableau(
-        tableau2, basic_vars_phase2, track_iterations=True, minimize=minimize  # Use original minimize flag
+        record([unscale_tableau(tableau2, basic_vars_phase2, factors2, 'last', copy=True)], [], 1)
+    # Solve Phase 2
+    phase2 = solve_tableau(
+        tableau2, basic_vars_phase2, track_iterations=track_iterations, callback=callback, stats=stats,
+        pivot_tol=pivot_tol, feas_tol=feas_tol,
+        refresh_every=refresh_every, residual_tol=residual_tol, column_factors=factors2
     )
+    solution2, optimal_value2 = phase2[:2]
     
     if track_iterations and solution2 is not None:
-        tableau_history.extend(phase2_tableau_history)
-        pivot_history.extend(phase2_pivot_history)
+        record(phase2[2], phase2[3], 1)
     
     if solution2 is None:
         if track_iterations:
@@ -241,6 +423,8 @@ def dosfases_solver(c, A, b, eq_constraints=None, ge_constraints=None, minimize=
     
     # Extract original variables
     x = solution2[:n]
+    if scale:
+        x = x * col_scale
     final_value = optimal_value2
     
     if minimize:
@@ -251,8 +435,15 @@ def dosfases_solver(c, A, b, eq_constraints=None, ge_constraints=None, minimize=
     return x, final_value
 
 
-def solve_standard_form(c, A, b, minimize=False, track_iterations=False):
-    """Solve LP in standard form without artificial variables."""
+def solve_standard_form(c, A, b, track_iterations=False, callback=None, stats=None,
+                        pivot_tol=PIVOT_TOL, feas_tol=FEAS_TOL, refresh_every=REFRESH_EVERY,
+                        residual_tol=RESIDUAL_TOL, scaling=None):
+    """
+    Solve LP in standard form without artificial variables.
+
+    `scaling` is the (row, col) pair from scaling.scale_problem when c, A, b
+    are already scaled; it is only used to unscale the reported tableaus.
+    """
     # c is the original objective function coefficients (possibly negated if original problem was MIN)
     # A is A_with_slack (original variables + slack variables)
     
@@ -263,21 +454,22 @@ def solve_standard_form(c, A, b, minimize=False, track_iterations=False):
     c_tableau = np.zeros(n_total_vars_in_A)
     c_tableau[:n_orig] = c
     
-    # When calling create_tableau:
-    # If original problem is MAX (minimize=False), then c_tableau is c_orig_padded, and maximize=True for create_tableau.
-    #   create_tableau will use -c_tableau in the objective row.
-    # If original problem is MIN (minimize=True), then c_tableau is -c_orig_padded, and maximize=False for create_tableau.
-    #   create_tableau will use c_tableau (which is already -c_orig_padded) in the objective row.
-    # This ensures the objective row is correctly set for maximization form of simplex.
-    tableau = create_tableau(c_tableau, A, b, maximize=not minimize)
+    # c_tableau is always the objective to maximize (already negated for MIN), so the
+    # objective row is -c_tableau: z_j - c_j, improved by negative entries
+    tableau = create_tableau(c_tableau, A, b, maximize=True)
     
     m, n_total_tableau_cols = tableau.shape # n_total_tableau_cols includes RHS
     
     # Initial basic variables (slack variables)
-    basic_vars = list(range(n_orig, n_total_vars_in_A))      # Solve the tableau
-    solution, optimal_value, tableau_history, pivot_history = solve_tableau(
-        tableau, basic_vars, track_iterations=True, minimize=minimize
+    basic_vars = list(range(n_orig, n_total_vars_in_A))
+    factors = column_scale(tableau[:-1], *scaling) if scaling is not None else None
+    # Solve the tableau
+    result = solve_tableau(
+        tableau, basic_vars, track_iterations=track_iterations, callback=callback, stats=stats,
+        pivot_tol=pivot_tol, feas_tol=feas_tol,
+        refresh_every=refresh_every, residual_tol=residual_tol, column_factors=factors
     )
+    solution, optimal_value = result[:2]
     
     if solution is None:
         if track_iterations:
@@ -288,10 +480,23 @@ def solve_standard_form(c, A, b, minimize=False, track_iterations=False):
     x = solution[:n_orig]
     
     if track_iterations:
-        return x, optimal_value, tableau_history, pivot_history
+        return x, optimal_value, result[2], result[3]
     return x, optimal_value
 
 
+def pivot_in(tableau, columns):
+    """
+    Pivot each crash column in on its row (``columns`` maps row -> column),
+    in the order they were chosen, which keeps each pivot element untouched
+    by the previous ones.
+    """
+    for i, col in columns.items():
+        tableau[i] /= tableau[i, col]
+        for k in range(tableau.shape[0]):
+            if k != i:
+                tableau[k] -= tableau[k, col] * tableau[i]
+
+
 def create_tableau(c, A, b, maximize=True):
     """Create simplex tableau."""
     m, n = A.shape
@@ -310,16 +515,36 @@ def create_tableau(c, A, b, maximize=True):
     return tableau
 
 
-def solve_tableau(tableau, basic_vars, track_iterations=False, minimize=False):
+def solve_tableau(tableau, basic_vars, track_iterations=False, callback=None, stats=None, max_iter=1000,
+                  pivot_tol=PIVOT_TOL, feas_tol=FEAS_TOL, refresh_every=REFRESH_EVERY, residual_tol=RESIDUAL_TOL,
+                  column_factors=None):
     """
     Solve a linear programming problem in tableau form.
-    
+
+    The objective row is the last one and holds reduced costs that improve
+    the objective when negative (c_j - z_j for the Phase 1 minimization,
+    z_j - c_j for the Phase 2 maximization), so both phases use the same
+    rule: Dantzig's most negative entry and Harris's ratio test, switching to
+    Bland's rule when a PivotMonitor sees the solve stalling.
+
     Args:
         tableau: The initial tableau
         basic_vars: List of basic variable indices
         track_iterations: Whether to track tableau and pivot history
-        minimize: Whether this is a minimization problem
-    
+        callback: Optional ``callback(k, row, col, tableau)`` called with the
+            initial tableau (k=0, row=col=None) and after every pivot. The
+            tableau is passed without copying.
+        stats: Optional dict; 'iterations' is incremented on every pivot,
+            'basis' is set to ``basic_vars`` (updated in place), the
+            PivotMonitor counters are accumulated and 'status' is set to
+            'unbounded' or 'iteration_limit' when there is no solution
+        max_iter: Safety limit on pivots
+        pivot_tol, feas_tol: Harris ratio test tolerances
+        refresh_every, residual_tol: Reinverter settings
+        column_factors: Column factors of a scaled tableau (see
+            scaling.column_scale); history and callback tableaus are
+            unscaled with them. The returned solution stays scaled
+
     Returns:
         If track_iterations=False:
             tuple: (solution vector, optimal value)
@@ -328,77 +553,76 @@ def solve_tableau(tableau, basic_vars, track_iterations=False, minimize=False):
     """
     m, n = tableau.shape
     n = n - 1  # Adjust for RHS column
-    max_iterations = 100  # Safety limit
-    iteration = 0
-    
+
     tableau_history = [] if track_iterations else None
     pivot_history = [] if track_iterations else None
-    
+
     if track_iterations:
-        tableau_history.append(tableau.copy())
-    
-    while iteration < max_iterations:
-        # Find entering variable based on optimization type
-        z_row = tableau[-1, :-1]
-        
-        if minimize:
-            # For minimization: look for most negative coefficient (can improve solution)
-            entering_col = np.argmin(z_row)
-            optimal_condition = z_row[entering_col] >= -1e-10  # No negative coefficients
-        else:
-            # For maximization: look for most positive coefficient (can improve solution)
-            entering_col = np.argmax(z_row)
-            optimal_condition = z_row[entering_col] <= 1e-10  # No positive coefficients
-        
-        if optimal_condition:  # Optimal solution found
+        tableau_history.append(unscale_tableau(tableau, basic_vars, column_factors, 'last', copy=True))
+    if callback is not None:
+        callback(0, None, None, unscale_tableau(tableau, basic_vars, column_factors, 'last'))
+    if stats is not None:
+        stats.setdefault('iterations', 0)
+        stats['basis'] = basic_vars
+    monitor = PivotMonitor(basic_vars, stats, 1e-10)
+    reinverter = Reinverter(tableau, 'last', stats, refresh_every, residual_tol)
+
+    for iteration in range(1, max_iter + 1):
+        entering_col = entering_column(tableau[-1, :-1], 1e-10, monitor.bland)
+
+        if entering_col is None:  # Optimal solution found
             # Extract solution
             solution = np.zeros(n)
             for i, basic_var in enumerate(basic_vars):
                 if basic_var < n:  # Only store original variables
                     solution[basic_var] = tableau[i, -1]
-            
+
             # Get optimal value from tableau
             optimal_value = tableau[-1, -1]
-            
+
             if track_iterations:
                 return solution, optimal_value, tableau_history, pivot_history
             return solution, optimal_value
-        
+
         # Find leaving variable (minimum ratio test)
-        pivot_ratios = []
-        for i in range(m-1):  # Skip objective row
-            if tableau[i, entering_col] > 1e-10:
-                ratio = tableau[i, -1] / tableau[i, entering_col]
-                pivot_ratios.append((ratio, i))
-        
-        if not pivot_ratios:  # Unbounded solution
+        pivot_row, theta = leaving_row(tableau[:-1, entering_col], tableau[:-1, -1], basic_vars, monitor.bland,
+                                       pivot_tol, feas_tol)
+
+        if pivot_row is None:  # Unbounded solution
+            if stats is not None:
+                stats['status'] = 'unbounded'
             if track_iterations:
                 return None, None, tableau_history, pivot_history
             return None, None
-        
-        # Choose row with minimum positive ratio
-        pivot_row = min(pivot_ratios)[1]
-        
+
         if track_iterations:
             pivot_history.append((pivot_row, entering_col))
-        
+
         # Pivot operation
         pivot_element = tableau[pivot_row, entering_col]
         tableau[pivot_row] /= pivot_element
-        
+
         for i in range(m):
             if i != pivot_row:
                 tableau[i] -= tableau[i, entering_col] * tableau[pivot_row]
-        
+
         # Update basic variables
-        basic_vars[pivot_row] = entering_col
-        
+        basic_vars[pivot_row] = int(entering_col)
+        monitor.record(basic_vars, theta)
+        reinverter.after_pivot(tableau, basic_vars)
+
         if track_iterations:
-            tableau_history.append(tableau.copy())
-        
-        iteration += 1
-    
+            tableau_history.append(unscale_tableau(tableau, basic_vars, column_factors, 'last', copy=True))
+
+        if stats is not None:
+            stats['iterations'] += 1
+        if callback is not None:
+            callback(iteration, pivot_row, entering_col,
+                     unscale_tableau(tableau, basic_vars, column_factors, 'last'))
+
     # Max iterations reached
+    if stats is not None:
+        stats['status'] = 'iteration_limit'
     if track_iterations:
         return None, None, tableau_history, pivot_history
     return None, None
@@ -0,0 +1,87 @@
+import numpy as np
+
+from .simplex_solver import SimplexError, UnboundedError
+from .pivoting import (
+    PIVOT_TOL, FEAS_TOL, PivotMonitor, entering_column, leaving_row, dual_leaving_row, dual_entering_column
+)
+
+
+class DualSimplexError(SimplexError):
+    """Base exception for dual simplex errors."""
+    pass
+
+
+class InfeasibleError(DualSimplexError):
+    """Exception raised when no primal feasible point exists."""
+    pass
+
+
+# Los tableaus de este módulo usan la misma disposición que simplex():
+# fila 0 = costos reducidos (z_j - c_j) y valor de Z en la última columna,
+# filas 1..m = B⁻¹[A | b]. basis[i] es la columna básica de la fila i + 1.
+# Las reglas de pivoteo son las de pivoting.py: Dantzig y razón de Harris,
+# con un PivotMonitor que pasa a Bland ante ciclos o estancamiento.
+
+def pivot(tableau, basis, row, col):
+    """Pivotea en (fila, columna) y actualiza `basis` (fila incluye Z)."""
+    tableau[row] /= tableau[row, col]
+    factors = tableau[:, col].copy()
+    factors[row] = 0.0
+    tableau -= np.outer(factors, tableau[row])
+    basis[row - 1] = int(col)
+
+
+def primal_simplex(tableau, basis, tol=1e-9, max_iter=1000, stats=None, pivot_tol=PIVOT_TOL, feas_tol=FEAS_TOL):
+    """
+    Simplex primal desde una base factible (todos los b̄ ≥ 0).
+
+    `stats` recibe 'iterations' y los contadores de PivotMonitor.
+
+    Raises:
+        UnboundedError: Si una columna entrante no tiene razón válida
+        RuntimeError: Si se alcanza max_iter
+    """
+    monitor = PivotMonitor(basis, stats, tol)
+    for _ in range(max_iter):
+        col = entering_column(tableau[0, :-1], tol, monitor.bland)
+        if col is None:
+            return
+        row, theta = leaving_row(tableau[1:, col], tableau[1:, -1], basis, monitor.bland, pivot_tol, feas_tol)
+        if row is None:
+            raise UnboundedError("Problema no acotado")
+        pivot(tableau, basis, row + 1, col)
+        monitor.record(basis, theta)
+        if stats is not None:
+            stats['iterations'] = stats.get('iterations', 0) + 1
+    raise RuntimeError("Se alcanzó max_iter sin converger")
+
+
+def dual_simplex(tableau, basis, tol=1e-9, max_iter=1000, stats=None, pivot_tol=PIVOT_TOL, feas_tol=FEAS_TOL):
+    """
+    Simplex dual desde una base dual factible (fila Z ≥ 0).
+
+    Usa la misma prueba de razón que el arranque dual de simplex(): sale la
+    fila con b̄ más negativo (pivoting.dual_leaving_row) y entra la columna
+    de la razón de Harris sobre las a_rj < 0 (pivoting.dual_entering_column),
+    de modo que la fila Z sigue siendo no negativa.
+
+    `stats` recibe 'iterations' y los contadores de PivotMonitor.
+
+    Raises:
+        InfeasibleError: Si una fila con b̄ < 0 no tiene entradas negativas
+        RuntimeError: Si se alcanza max_iter
+    """
+    monitor = PivotMonitor(basis, stats, tol)
+    for _ in range(max_iter):
+        row = dual_leaving_row(tableau[1:, -1], basis, tol, monitor.bland)
+        if row is None:
+            return
+        col, theta = dual_entering_column(tableau[row + 1, :-1], tableau[0, :-1], monitor.bland,
+                                          pivot_tol, feas_tol)
+        if col is None:
+            raise InfeasibleError("El problema no tiene solución factible")
+        pivot(tableau, basis, row + 1, col)
+        monitor.record(basis, theta)
+        if stats is not None:
+            stats['iterations'] = stats.get('iterations', 0) + 1
+    raise RuntimeError("Se alcanzó max_iter sin converger")
@@ -1,5 +1,11 @@
 import numpy as np
 
+from .crash import crash_basis
+from .scaling import scale_problem, column_scale, unscale_tableau
+from .pivoting import (
+    PIVOT_TOL, FEAS_TOL, REFRESH_EVERY, RESIDUAL_TOL, PivotMonitor, Reinverter, entering_column, leaving_row
+)
+
 # ──────────────────── Excepciones ────────────────────────
 class GranMError(Exception):
 	"""Base exception for Gran M algorithm errors."""
@@ -13,9 +19,45 @@ class UnboundedError(GranMError):
 	"""LP is unbounded."""
 	pass
 
+class InfeasibleError(GranMError):
+	"""LP has no feasible point (an artificial stays positive)."""
+	pass
+
 # ──────────────────── Solver Big-M ───────────────────────
 def granm_solver(c, A, b, sense=None, eq_constraints=None,
-                 minimize=False, track_iterations=False, M=1e6):
+                 minimize=False, track_iterations=False, M=1e6, callback=None, stats=None,
+                 pivot_tol=PIVOT_TOL, feas_tol=FEAS_TOL, refresh_every=REFRESH_EVERY, residual_tol=RESIDUAL_TOL,
+                 scale=True, crash=True, max_iter=1000):
+    """
+    Método de la Gran M.
+
+    callback(k, fila, columna, tableau) se invoca con el tableau inicial
+    (k=0, fila=columna=None) y después de cada pivote, sin copiar el tableau
+    salvo para desescalarlo.
+
+    Si se pasa el dict `stats`, al terminar contiene 'iterations' y 'basis'
+    (columna básica de cada fila de restricción en el tableau: variables,
+    holguras, excesos y artificiales, en ese orden), además de los contadores
+    de PivotMonitor.
+
+    `pivot_tol` y `feas_tol` son las tolerancias de la prueba de razón de
+    Harris (ver pivoting.leaving_row); `refresh_every` y `residual_tol`
+    controlan la reinversión del tableau (ver pivoting.Reinverter).
+
+    Con `scale` A, b y c se escalan antes de armar el tableau (ver
+    scaling.py), de modo que M queda grande respecto de coeficientes de orden
+    1; la solución y los tableaus que se muestran están en la escala original.
+
+    Con `crash` las filas ≥ / = que tienen una columna utilizable como básica
+    (ver crash.py) no llevan artificial; stats recibe 'crash_columns' y
+    'artificials'. Las columnas del crash se pivotean antes de cargar M en la
+    fila Z: así las filas de las artificiales ya tienen 0 en esas columnas y
+    al restar M·fila la fila Z queda en forma canónica para toda la base (0
+    en las columnas del crash y en las artificiales).
+
+    Si tras `max_iter` pivotes no se alcanzó el óptimo se lanza RuntimeError,
+    como en simplex().
+    """
 
     c = np.asarray(c, dtype=float)
     A = np.asarray(A, dtype=float)
@@ -33,17 +75,28 @@ def granm_solver(c, A, b, sense=None, eq_constraints=None,
             for idx in eq_constraints:
                 sense[idx] = '='
 
+    c_orig = c
+    if scale:
+        c, A, b, row_scale, col_scale = scale_problem(c, A, b)
+
+    # Crash: columnas (variables o excesos) que hacen de básica en filas ≥ / =
+    ge_rows = [i for i, s in enumerate(sense) if s == '≥']
+    crash_cols = {}
+    if crash:
+        candidates = np.hstack([A, -np.eye(n_constraints)[:, ge_rows]])
+        crash_cols = crash_basis(candidates, b, [i for i, s in enumerate(sense) if s in ('≥', '=')])
+
     slack = 0
     surplus = 0
     artificial = 0
-    for s in sense:
+    for i, s in enumerate(sense):
         if s == '≤':
             slack += 1
         elif s == '≥':
             surplus += 1
-            artificial += 1
+            artificial += i not in crash_cols
         elif s == '=':
-            artificial += 1
+            artificial += i not in crash_cols
 
     total_vars = n_vars + slack + surplus + artificial
     tableau = np.zeros((n_constraints + 1, total_vars + 1))
@@ -53,6 +106,7 @@ def granm_solver(c, A, b, sense=None, eq_constraints=None,
     artificial_idx = surplus_idx + surplus
 
     art_map = {}
+    basis = []
 
     for i in range(n_constraints):
         tableau[i+1, :n_vars] = A[i]
@@ -60,49 +114,67 @@ def granm_solver(c, A, b, sense=None, eq_constraints=None,
 
         if sense[i] == '≤':
             tableau[i+1, slack_idx] = 1
+            basis.append(slack_idx)
             slack_idx += 1
-        elif sense[i] == '≥':
+            continue
+        if sense[i] == '≥':
             tableau[i+1, surplus_idx] = -1
             surplus_idx += 1
+        if i in crash_cols:
+            # Candidatas: variables y luego los excesos en orden de fila
+            j = crash_cols[i]
+            basis.append(j if j < n_vars else n_vars + slack + (j - n_vars))
+        else:
             tableau[i+1, artificial_idx] = 1
             art_map[artificial_idx] = i + 1
-            artificial_idx += 1
-        elif sense[i] == '=':
-            tableau[i+1, artificial_idx] = 1
-            art_map[artificial_idx] = i + 1
+            basis.append(artificial_idx)
             artificial_idx += 1
 
-    tableau[0, :n_vars] = c if minimize else -c
+    if stats is not None:
+        stats['iterations'] = 0
+        stats['basis'] = basis   # se actualiza en cada pivote
+        stats['crash_columns'] = len(crash_cols)
+        stats['artificials'] = len(art_map)
+    monitor = PivotMonitor(basis, stats, 1e-8)
+    d = column_scale(tableau[1:], row_scale, col_scale) if scale else None
+
+    # La fila Z guarda z_j - c_j: se mejora con negativos al maximizar y con
+    # positivos al minimizar
+    tableau[0, :n_vars] = -c
+
+    # Columnas del crash: se pivotean en el orden en que se eligieron, que
+    # deja intacto el pivote de cada una
+    for i in crash_cols:
+        r, j = i + 1, basis[i]
+        tableau[r] /= tableau[r, j]
+        for k in range(tableau.shape[0]):
+            if k != r:
+                tableau[k] -= tableau[k, j] * tableau[r]
 
     for j, row in art_map.items():
         sign = -1 if minimize else 1
         tableau[0, j] = sign * M
         tableau[0] -= sign * M * tableau[row]
+    reinverter = Reinverter(tableau, 'first', stats, refresh_every, residual_tol)
 
     if track_iterations:
-        tableau_history = [tableau.copy()]
+        tableau_history = [unscale_tableau(tableau, basis, d, copy=True)]
         pivot_history = []
+    if callback is not None:
+        callback(0, None, None, unscale_tableau(tableau, basis, d))
 
-    max_iter = 1000
-    for _ in range(max_iter):
+    for it in range(max_iter):
         cost_row = tableau[0, :-1]
-        if minimize:
-            col_candidates = np.where(cost_row > 1e-8)[0]
-        else:
-            col_candidates = np.where(cost_row < -1e-8)[0]
-
-        if col_candidates.size == 0:
+        pivot_col = entering_column(-cost_row if minimize else cost_row, 1e-8, monitor.bland)
+        if pivot_col is None:
             break
 
-        pivot_col = col_candidates[0]
-        col = tableau[1:, pivot_col]
-        rhs = tableau[1:, -1]
-        ratios = np.where(col > 1e-8, rhs / col, np.inf)
-
-        if np.all(np.isinf(ratios)):
+        row, theta = leaving_row(tableau[1:, pivot_col], tableau[1:, -1], basis, monitor.bland,
+                                 pivot_tol, feas_tol)
+        if row is None:
             raise UnboundedError("Problem is unbounded")
 
-        pivot_row = np.argmin(ratios) + 1
+        pivot_row = row + 1
 
         if track_iterations:
             pivot_history.append((pivot_row, pivot_col))
@@ -111,18 +183,32 @@ def granm_solver(c, A, b, sense=None, eq_constraints=None,
         for r in range(tableau.shape[0]):
             if r != pivot_row:
                 tableau[r] -= tableau[r, pivot_col] * tableau[pivot_row]
+        basis[pivot_row - 1] = int(pivot_col)
+        monitor.record(basis, theta)
+        reinverter.after_pivot(tableau, basis)
+        if stats is not None:
+            stats['iterations'] = it + 1
 
         if track_iterations:
-            tableau_history.append(tableau.copy())
+            tableau_history.append(unscale_tableau(tableau, basis, d, copy=True))
+        if callback is not None:
+            callback(it + 1, pivot_row, pivot_col, unscale_tableau(tableau, basis, d))
+    else:
+        raise RuntimeError("Se alcanzó max_iter sin converger")
+
+    # Una artificial básica con valor positivo: el problema no es factible
+    rhs = tableau[1:, -1]
+    if any(j in art_map and rhs[i] > 1e-6 for i, j in enumerate(basis)):
+        raise InfeasibleError("El problema no tiene solución factible")
 
     solution = np.zeros(n_vars)
-    for j in range(n_vars):
-        col = tableau[1:, j]
-        if np.count_nonzero(np.abs(col - 1) < 1e-8) == 1 and np.count_nonzero(col > 1e-8) == 1:
-            row = np.where(np.abs(col - 1) < 1e-8)[0][0] + 1
-            solution[j] = tableau[row, -1]
+    for i, j in enumerate(basis):
+        if j < n_vars:
+            solution[j] = rhs[i]
+    if scale:
+        solution *= col_scale
 
-    z_opt = np.dot(c, solution)
+    z_opt = np.dot(c_orig, solution)
 
     if track_iterations:
         return solution, z_opt, tableau_history, pivot_history
@@ -0,0 +1,227 @@
+import time
+
+import numpy as np
+
+
+# ──────────────────── Reglas de pivoteo ───────────────────
+# Los tres solvers eligen la columna entrante con Dantzig (costo reducido más
+# negativo) y la fila saliente con la prueba de Harris, que entre razones casi
+# empatadas prefiere el pivote más grande. En cuanto detectan estancamiento
+# (una base repetida o demasiados pivotes degenerados seguidos) pasan a la
+# regla de Bland: menor índice que mejora y, en la razón mínima, la fila cuya
+# básica tiene menor índice. Bland garantiza que el simplex termina aunque el
+# problema sea degenerado.
+
+# Pivotes degenerados seguidos antes de pasar a Bland
+STALL_LIMIT = 20
+
+# Prueba de razón de Harris: entradas menores que PIVOT_TOL no se usan como
+# pivote y las básicas pueden quedar hasta FEAS_TOL por debajo de 0
+PIVOT_TOL = 1e-9
+FEAS_TOL = 1e-9
+
+# Reinversión: el tableau se recalcula desde el original cada REFRESH_EVERY
+# pivotes o cuando el residuo relativo de B·x_B = b supera RESIDUAL_TOL
+REFRESH_EVERY = 50
+RESIDUAL_TOL = 1e-9
+
+
+def entering_column(scores, tol, bland=False, eligible=None):
+    """
+    Columna entrante; `scores` negativo significa que la columna mejora.
+
+    Returns:
+        int o None si ninguna columna mejora
+    """
+    candidates = scores < -tol
+    if eligible is not None:
+        candidates &= eligible
+    idx = np.flatnonzero(candidates)
+    if idx.size == 0:
+        return None
+    if bland:
+        return int(idx[0])
+    return int(idx[np.argmin(scores[idx])])
+
+
+def leaving_row(column, rhs, basis, bland=False, pivot_tol=PIVOT_TOL, feas_tol=FEAS_TOL):
+    """
+    Fila saliente con la prueba de razón de Harris en dos pasadas.
+
+    Solo cuentan como pivote las entradas > pivot_tol. La primera pasada
+    calcula el paso máximo permitiendo que las básicas queden hasta feas_tol
+    por debajo de 0; la segunda elige, entre las filas cuya razón no supera
+    ese paso, la de mayor pivote. Con `bland` se usa la razón mínima exacta
+    y, entre empates, la fila cuya básica tiene menor índice.
+
+    Returns:
+        tuple: (fila, razón) o (None, None) si la columna no tiene entradas
+        positivas (problema no acotado en esa dirección). La razón se acota
+        en 0 cuando el RHS de la fila elegida es ligeramente negativo.
+    """
+    valid = column > pivot_tol
+    if not np.any(valid):
+        return None, None
+    idx = np.flatnonzero(valid)
+    pivots = column[idx]
+    ratios = rhs[idx] / pivots
+
+    if bland:
+        tied = idx[ratios <= ratios.min() + pivot_tol]
+        row = int(tied[np.argmin(np.asarray(basis)[tied])])
+    else:
+        bound = np.min((rhs[idx] + feas_tol) / pivots)
+        candidates = ratios <= bound
+        row = int(idx[candidates][np.argmax(pivots[candidates])])
+    return row, max(rhs[row] / column[row], 0.0)
+
+
+def dual_leaving_row(rhs, basis, tol, bland=False):
+    """
+    Fila saliente del simplex dual: la de RHS más negativo, o con `bland` la
+    primera (por índice de su básica) con RHS < -tol.
+
+    Returns:
+        int o None si la base ya es primal factible
+    """
+    idx = np.flatnonzero(rhs < -tol)
+    if idx.size == 0:
+        return None
+    if bland:
+        return int(idx[np.argmin(np.asarray(basis)[idx])])
+    return int(idx[np.argmin(rhs[idx])])
+
+
+def dual_entering_column(row, z_row, bland=False, pivot_tol=PIVOT_TOL, feas_tol=FEAS_TOL):
+    """
+    Columna entrante del simplex dual con la razón de Harris en dos pasadas.
+
+    Candidatas: entradas de la fila saliente < -pivot_tol. La primera pasada
+    acota el paso dual permitiendo costos reducidos hasta -feas_tol; la
+    segunda elige, entre las columnas que no lo superan, la de mayor |a_rj|.
+    Con `bland`, la de menor índice entre las de razón mínima exacta.
+
+    Returns:
+        tuple: (columna, razón) o (None, None) si la fila no tiene entradas
+        negativas (el problema no es factible)
+    """
+    valid = row < -pivot_tol
+    if not np.any(valid):
+        return None, None
+    idx = np.flatnonzero(valid)
+    pivots = -row[idx]
+    ratios = z_row[idx] / pivots
+
+    if bland:
+        col = int(idx[np.flatnonzero(ratios <= ratios.min() + pivot_tol)[0]])
+    else:
+        bound = np.min((z_row[idx] + feas_tol) / pivots)
+        candidates = ratios <= bound
+        col = int(idx[candidates][np.argmax(pivots[candidates])])
+    return col, max(z_row[col] / -row[col], 0.0)
+
+
+class PivotMonitor:
+    """
+    Cuenta pivotes degenerados y bases visitadas durante un solve.
+
+    Cada base visitada se guarda como hash de sus índices ordenados; volver a
+    una base ya vista es un ciclo. Ante un ciclo o `stall_limit` pivotes
+    degenerados seguidos, `bland` pasa a True hasta el final del solve.
+
+    Los contadores se acumulan en `stats` (si se pasa), de modo que varias
+    fases comparten el mismo dict: 'degenerate_pivots', 'cycles_detected' y
+    'bland_switches'.
+    """
+
+    def __init__(self, basis, stats=None, tol=1e-10, stall_limit=STALL_LIMIT):
+        self.tol = tol
+        self.stall_limit = stall_limit
+        self.bland = False
+        self.streak = 0
+        self.stats = stats if stats is not None else {}
+        for key in ('degenerate_pivots', 'cycles_detected', 'bland_switches'):
+            self.stats.setdefault(key, 0)
+        self.seen = {self._key(basis)}
+
+    @staticmethod
+    def _key(basis):
+        return hash(tuple(sorted(int(j) for j in basis)))
+
+    def record(self, basis, theta):
+        """Registra un pivote de paso `theta` que llevó a `basis`."""
+        if theta <= self.tol:
+            self.stats['degenerate_pivots'] += 1
+            self.streak += 1
+        else:
+            self.streak = 0
+
+        if self.bland:
+            # Bland no cicla; volver a bases vistas antes del cambio no es un ciclo
+            return
+
+        key = self._key(basis)
+        cycled = key in self.seen
+        self.seen.add(key)
+        if cycled:
+            self.stats['cycles_detected'] += 1
+
+        if cycled or self.streak >= self.stall_limit:
+            self.bland = True
+            self.stats['bland_switches'] += 1
+
+
+class Reinverter:
+    """
+    Recalcula el tableau desde el inicial y la base actual para acotar el
+    error que acumulan las actualizaciones de rango 1 de cada pivote.
+
+    Los pivotes son operaciones de fila, así que el tableau en curso es
+    equivalente por filas al inicial: las restricciones valen B⁻¹·R (R las
+    filas iniciales, B sus columnas básicas) y la fila Z vale z₀ - z₀[B]·B⁻¹·R.
+    Se recalcula cada `every` pivotes (None lo desactiva) o cuando el residuo
+    de B·x_B = b, que cuesta O(m²), supera `residual_tol` (None lo desactiva).
+
+    En `stats` se acumulan 'refreshes' y 'refresh_seconds'.
+    """
+
+    def __init__(self, tableau, z_row='first', stats=None, every=REFRESH_EVERY, residual_tol=RESIDUAL_TOL):
+        self.reference = tableau.copy()
+        self.z = 0 if z_row == 'first' else -1
+        self.rows = slice(1, None) if z_row == 'first' else slice(None, -1)
+        self.every = every
+        self.residual_tol = residual_tol
+        self.since = 0
+        self.stats = stats if stats is not None else {}
+        self.stats.setdefault('refreshes', 0)
+        self.stats.setdefault('refresh_seconds', 0.0)
+
+    def after_pivot(self, tableau, basis):
+        """Recalcula `tableau` en sitio si corresponde; devuelve True si lo hizo."""
+        self.since += 1
+        R = self.reference[self.rows]
+        B = R[:, basis]
+
+        due = self.every is not None and self.since >= self.every
+        if not due and self.residual_tol is not None:
+            b = R[:, -1]
+            residual = np.abs(B @ tableau[self.rows, -1] - b).max()
+            due = residual > self.residual_tol * (1.0 + np.abs(b).max())
+        if not due:
+            return False
+
+        start = time.perf_counter()
+        try:
+            body = np.linalg.solve(B, R)
+        except np.linalg.LinAlgError:
+            return False
+        body[:, basis] = np.eye(len(basis))
+        z = self.reference[self.z] - self.reference[self.z, basis] @ body
+        z[basis] = 0.0
+        tableau[self.rows] = body
+        tableau[self.z] = z
+
+        self.since = 0
+        self.stats['refreshes'] += 1
+        self.stats['refresh_seconds'] += time.perf_counter() - start
+        return True
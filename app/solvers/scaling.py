@@ -0,0 +1,96 @@
+import numpy as np
+
+
+# ──────────────────── Escalado ───────────────────────────
+# Antes de armar el tableau se escala A por filas y columnas: Ã = R·A·S con
+# R, S diagonales. Primero varias pasadas de media geométrica (cada fila y
+# cada columna se divide por √(min·max) de sus entradas no nulas) y luego
+# equilibrado (máximo 1 por fila y después por columna). Los factores se
+# redondean a potencias de 2 para que escalar y desescalar sean exactos.
+#
+# El problema escalado tiene b̃ = R·b, c̃ = S·c y variables x̃ = S⁻¹·x; el
+# valor óptimo no cambia. Las columnas auxiliares (holguras, excesos,
+# artificiales) son ±e_i en ambos problemas, así que equivalen a escalar la
+# columna por 1/r_i.
+
+# Pasadas de media geométrica
+GEOMETRIC_PASSES = 4
+
+
+def scale_factors(A, passes=GEOMETRIC_PASSES):
+    """
+    Factores de fila y columna para A.
+
+    Returns:
+        tuple: (row, col) con Ã = row[:, None] * A * col
+    """
+    A = np.abs(np.asarray(A, dtype=float))
+    m, n = A.shape
+    row, col = np.ones(m), np.ones(n)
+    nonzero = A > 0
+    if not np.any(nonzero):
+        return row, col
+
+    def extremes(S, axis):
+        low = np.where(nonzero, S, np.inf).min(axis=axis)
+        high = S.max(axis=axis)
+        return low, high
+
+    for _ in range(passes):
+        low, high = extremes(A * row[:, None] * col, 1)
+        has = high > 0
+        row[has] /= np.sqrt(low[has] * high[has])
+        low, high = extremes(A * row[:, None] * col, 0)
+        has = high > 0
+        col[has] /= np.sqrt(low[has] * high[has])
+
+    high = (A * row[:, None] * col).max(axis=1)
+    row[high > 0] /= high[high > 0]
+    high = (A * row[:, None] * col).max(axis=0)
+    col[high > 0] /= high[high > 0]
+
+    return np.exp2(np.round(np.log2(row))), np.exp2(np.round(np.log2(col)))
+
+
+def scale_problem(c, A, b, passes=GEOMETRIC_PASSES):
+    """
+    Returns:
+        tuple: (c̃, Ã, b̃, row, col)
+    """
+    c = np.asarray(c, dtype=float)
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    row, col = scale_factors(A, passes)
+    return c * col, A * row[:, None] * col, b * row, row, col
+
+
+def column_scale(rows, row, col):
+    """
+    Factor de cada columna de un tableau inicial (RHS incluido, con 1).
+
+    `rows` son las filas de restricción del tableau sin pivotear: las
+    primeras len(col) columnas son las variables y el resto columnas ±e_i.
+    """
+    n_cols = rows.shape[1]
+    d = np.ones(n_cols)
+    n = len(col)
+    d[:n] = col
+    for j in range(n, n_cols - 1):
+        d[j] = 1.0 / row[int(np.argmax(np.abs(rows[:, j])))]
+    return d
+
+
+def unscale_tableau(tableau, basis, d, z_row='first', copy=False):
+    """
+    Tableau del problema original a partir del escalado.
+
+    Si T̃ = B̃⁻¹·[Ã | I | b̃], el original es T = D_B·T̃·D⁻¹: cada columna se
+    divide por su factor y cada fila de restricción se multiplica por el de
+    su variable básica. Con d=None devuelve el mismo tableau (o una copia).
+    """
+    if d is None:
+        return tableau.copy() if copy else tableau
+    shown = tableau / d
+    rows = slice(1, None) if z_row == 'first' else slice(None, -1)
+    shown[rows] *= d[np.asarray(basis, dtype=int)][:, None]
+    return shown
@@ -1,5 +1,11 @@
 import numpy as np
 
+from .scaling import scale_problem, column_scale, unscale_tableau
+from .pivoting import (
+    PIVOT_TOL, FEAS_TOL, REFRESH_EVERY, RESIDUAL_TOL, PivotMonitor, Reinverter, entering_column, leaving_row,
+    dual_leaving_row, dual_entering_column
+)
+
 class SimplexError(Exception):
     """Base exception for Simplex algorithm errors."""
     pass
@@ -16,11 +22,60 @@ class UnboundedError(SimplexError):
     """Exception raised when problem is unbounded."""
     pass
 
-def simplex(c, A, b, minimize=False, track_iterations=False, tol=1e-10, max_iter=100):
+class InfeasibleError(SimplexError):
+    """Exception raised when the dual simplex start finds no feasible point."""
+    pass
+
+# Formulación dual automática: con m > DUAL_RATIO·n se resuelve el dual, cuya
+# base tiene n filas en lugar de m
+DUAL_RATIO = 4
+
+
+def choose_formulation(m, n):
+    """'dual' si las restricciones superan DUAL_RATIO veces a las variables."""
+    return 'dual' if m > DUAL_RATIO * n else 'primal'
+
+
+def simplex(c, A, b, minimize=False, track_iterations=False, tol=1e-10, max_iter=1000,
+            callback=None, stats=None, pivot_tol=PIVOT_TOL, feas_tol=FEAS_TOL,
+            refresh_every=REFRESH_EVERY, residual_tol=RESIDUAL_TOL, scale=True, formulation='primal'):
     """
     Simplex clásico para restricciones tipo ≤ y c ≥ 0.
-    Si alguna columna NO tiene coeficiente positivo, la salta
-    (evita falsos 'unbounded' y permite detectar múltipl. óptimos).
+    Si la columna entrante no tiene ninguna entrada > pivot_tol (la prueba
+    de razón no tiene fila) el problema es no acotado y se lanza
+    UnboundedError.
+
+    Si b tiene valores negativos pero la base de holguras es dual factible
+    (c ≤ 0 al maximizar, c ≥ 0 al minimizar), parte con simplex dual desde
+    esa base en lugar de exigir Dos Fases o Gran M; los pivotes duales quedan
+    en el mismo historial y stats['start'] vale 'dual'. Si no es dual
+    factible se lanza NegativeBError.
+
+    `formulation` es 'primal', 'dual' o 'auto' (dual si choose_formulation
+    lo indica). Con b ≥ 0 el dual se resuelve con simplex y se traducen la
+    solución, el valor y la base (ver _simplex_via_dual); con b negativo se
+    usa siempre el primal. Como los pivotes del dual no se traducen, 'auto'
+    elige el primal si se pide el historial o hay callback.
+    stats['formulation'] indica cuál se resolvió.
+
+    callback(k, fila, columna, tableau) se invoca con el tableau inicial
+    (k=0, fila=columna=None) y después de cada pivote. El tableau se pasa
+    sin copiar: si el callback lo conserva debe copiarlo.
+
+    Si se pasa el dict `stats`, al terminar contiene 'iterations' (pivotes
+    realizados) y 'basis' (columna básica de cada fila de restricción, en la
+    numeración del tableau: 0..n-1 variables, n..n+m-1 holguras), además de
+    los contadores de PivotMonitor ('degenerate_pivots', 'cycles_detected',
+    'bland_switches').
+
+    `pivot_tol` y `feas_tol` son las tolerancias de la prueba de razón de
+    Harris (ver pivoting.leaving_row); `refresh_every` y `residual_tol`
+    controlan la reinversión del tableau (ver pivoting.Reinverter), cuyo costo
+    queda en stats['refreshes'] y stats['refresh_seconds'].
+
+    Con `scale` el problema se escala antes de armar el tableau (ver
+    scaling.py); la solución, el historial y lo que recibe `callback` están
+    en la escala original.
     """
     c = np.asarray(c, dtype=float)
     A = np.asarray(A, dtype=float)
@@ -30,68 +85,105 @@ def simplex(c, A, b, minimize=False, track_iterations=False, tol=1e-10, max_iter
     if len(b) != m or len(c) != n:
         raise DimensionError("Dimensiones incompatibles")
 
-    if np.any(b < -tol):
-        raise NegativeBError("b no puede contener valores negativos (en esta versión)")
+    if formulation == 'auto':
+        iterations = track_iterations or callback is not None
+        formulation = 'primal' if iterations else choose_formulation(m, n)
+    if formulation == 'dual' and np.all(b >= -tol):
+        return _simplex_via_dual(c, A, b, minimize, track_iterations, callback, stats, tol=tol,
+                                 max_iter=max_iter, pivot_tol=pivot_tol, feas_tol=feas_tol,
+                                 refresh_every=refresh_every, residual_tol=residual_tol, scale=scale)
+    if stats is not None:
+        stats['formulation'] = 'primal'
 
     # Maximizar ⇒ Z fila con -c
     if minimize:
         c = -c
 
+    if scale:
+        c, A, b, row_scale, col_scale = scale_problem(c, A, b)
+
     # ─ construir tableau inicial ─
     tableau = np.zeros((m + 1, n + m + 1))
     tableau[0, :n]    = -c
     tableau[1:, :n]   = A
     tableau[1:, n:n+m] = np.eye(m)
     tableau[1:, -1]   = b
+    d = column_scale(tableau[1:], row_scale, col_scale) if scale else None
+
+    # b negativo: solo se admite si la base de holguras es dual factible
+    dual_phase = bool(np.any(b < -tol))
+    if dual_phase and np.any(tableau[0, :-1] < -tol):
+        raise NegativeBError("b tiene valores negativos y la base de holguras no es dual factible; "
+                             "usar Dos Fases o Gran M")
+
+    basis = list(range(n, n + m))
+    if stats is not None:
+        stats['iterations'] = 0
+        stats['basis'] = basis   # se actualiza en cada pivote
+        stats['start'] = 'dual' if dual_phase else 'primal'
+    monitor = PivotMonitor(basis, stats, tol)
+    reinverter = Reinverter(tableau, 'first', stats, refresh_every, residual_tol)
 
     if track_iterations:
-        T_hist = [tableau.copy()]
+        T_hist = [unscale_tableau(tableau, basis, d, copy=True)]
         pivots = []
+    if callback is not None:
+        callback(0, None, None, unscale_tableau(tableau, basis, d))
 
     # ─ bucle principal ─
-    for _ in range(max_iter):
-        # 1. columna entrante (costo reducido más negativo QUE TENGA ALGO > 0)
-        pivot_col = None
-        z_row = tableau[0, :-1]
-
-        for j in np.argsort(z_row):          # de más negativo a menos
-            if z_row[j] >= -tol:
-                break                        # no hay más negativos
-            if np.any(tableau[1:, j] > tol):
-                pivot_col = j
+    for it in range(max_iter):
+        # 0. simplex dual mientras quede b̄ < 0: la fila Z sigue ≥ 0, así que
+        #    al volverse primal factible la base ya es óptima
+        row = None
+        if dual_phase:
+            row = dual_leaving_row(tableau[1:, -1], basis, feas_tol, monitor.bland)
+            dual_phase = row is not None
+        if dual_phase:
+            pivot_col, theta = dual_entering_column(tableau[row + 1, :-1], tableau[0, :-1], monitor.bland,
+                                                    pivot_tol, feas_tol)
+            if pivot_col is None:
+                raise InfeasibleError("El problema no tiene solución factible")
+        else:
+            # 1. columna entrante: Dantzig, o Bland si el monitor detectó
+            #    estancamiento. Una columna que mejora sin entradas > 0 es un
+            #    rayo: no se salta, el problema es no acotado (paso 2)
+            pivot_col = entering_column(tableau[0, :-1], tol, monitor.bland)
+            if pivot_col is None:                # óptimo alcanzado
                 break
-        if pivot_col is None:                # óptimo alcanzado
-            break
-
-        # 2. fila pivote (razón mínima)
-        col      = tableau[1:, pivot_col]
-        rhs      = tableau[1:, -1]
-        valid    = col > tol
-        if not np.any(valid):
-            raise UnboundedError("Problema no acotado")
 
-        ratios   = rhs[valid] / col[valid]
-        pivot_row = np.where(valid)[0][np.argmin(ratios)] + 1  # +1 por fila Z
+            # 2. fila pivote (razón mínima)
+            row, theta = leaving_row(tableau[1:, pivot_col], tableau[1:, -1], basis, monitor.bland,
+                                     pivot_tol, feas_tol)
+            if row is None:
+                raise UnboundedError("Problema no acotado")
+        pivot_row = row + 1  # +1 por fila Z
 
         # 3. pivotear
         tableau[pivot_row] /= tableau[pivot_row, pivot_col]
         for r in range(tableau.shape[0]):
             if r != pivot_row:
                 tableau[r] -= tableau[r, pivot_col] * tableau[pivot_row]
+        basis[pivot_row - 1] = int(pivot_col)
+        monitor.record(basis, theta)
+        reinverter.after_pivot(tableau, basis)
+        if stats is not None:
+            stats['iterations'] = it + 1
 
         if track_iterations:
             pivots.append((pivot_row, pivot_col))
-            T_hist.append(tableau.copy())
+            T_hist.append(unscale_tableau(tableau, basis, d, copy=True))
+        if callback is not None:
+            callback(it + 1, pivot_row, pivot_col, unscale_tableau(tableau, basis, d))
     else:
         raise RuntimeError("Se alcanzó max_iter sin converger")
 
     # ─ extraer solución ─
     solution = np.zeros(n)
-    for j in range(n):
-        col = tableau[1:, j]
-        if np.count_nonzero(col) == 1 and np.isclose(col.max(), 1.0, atol=tol):
-            row_bas = np.where(np.isclose(col, 1.0, atol=tol))[0][0] + 1
-            solution[j] = tableau[row_bas, -1]
+    for i, j in enumerate(basis):
+        if j < n:
+            solution[j] = tableau[i + 1, -1]
+    if scale:
+        solution *= col_scale
 
     z_opt = tableau[0, -1]
     if minimize:
@@ -100,3 +192,58 @@ def simplex(c, A, b, minimize=False, track_iterations=False, tol=1e-10, max_iter
     if track_iterations:
         return solution, z_opt, T_hist, pivots
     return solution, z_opt
+
+
+def _simplex_via_dual(c, A, b, minimize, track_iterations, callback, stats, tol, **options):
+    """
+    Resuelve max cᵀx s.a. Ax ≤ b, x ≥ 0 (b ≥ 0) a través de su dual.
+
+    El dual en forma ≤ es  max -bᵀy  s.a.  -Aᵀy ≤ -c, y ≥ 0: como -b ≤ 0 la
+    base de holguras es dual factible y simplex() lo resuelve con el arranque
+    dual, con tableaus de n + 1 filas. Los multiplicadores del dual son la
+    solución primal (x = c'_B·B'⁻¹, un sistema n × n) y la base primal óptima
+    es la complementaria: x_j básica si la holgura j del dual no lo es, s_i
+    básica si y_i no lo es.
+
+    El tableau final del primal (m × m) solo se arma si se pide el historial
+    o hay callback; el historial tiene entonces solo ese tableau.
+    """
+    m, n = A.shape
+    cost = -c if minimize else c
+
+    dual_stats = {}
+    try:
+        simplex(-b, -A.T, -cost, stats=dual_stats, tol=tol, **options)
+    except InfeasibleError:
+        # Dual infactible con primal factible (x = 0): primal no acotado
+        raise UnboundedError("Problema no acotado")
+
+    dual_basis = list(dual_stats['basis'])
+    dual_cols = np.hstack([-A.T, np.eye(n)])
+    dual_cost = np.concatenate([-b, np.zeros(n)])
+    solution = np.linalg.solve(dual_cols[:, dual_basis].T, dual_cost[dual_basis])
+    solution[np.abs(solution) <= tol] = 0.0
+
+    in_dual = set(dual_basis)
+    basis = [j for j in range(n) if m + j not in in_dual] + [n + i for i in range(m) if i not in in_dual]
+
+    if stats is not None:
+        stats.update({k: v for k, v in dual_stats.items() if k not in ('basis', 'start')})
+        stats['basis'] = basis
+        stats['formulation'] = 'dual'
+
+    z_opt = float(np.dot(c, solution))
+    if not track_iterations and callback is None:
+        return solution, z_opt
+
+    M = np.hstack([A, np.eye(m)])
+    body = np.linalg.solve(M[:, basis], np.hstack([M, b[:, None]]))
+    body[:, basis] = np.eye(m)
+    full_cost = np.concatenate([cost, np.zeros(m + 1)])
+    tableau = np.vstack([full_cost[basis] @ body - full_cost, body])
+    tableau[0, basis] = 0.0
+    if callback is not None:
+        callback(0, None, None, tableau)
+    if track_iterations:
+        return solution, z_opt, [tableau], []
+    return solution, z_opt
@@ -0,0 +1,147 @@
+import numpy as np
+
+from .dual_simplex import primal_simplex, dual_simplex
+
+
+# ──────────────────── Forma ≤ ─────────────────────────────
+# Todo problema se lleva a  max cᵀx  s.a.  A'x + s = b',  x, s ≥ 0:
+# las filas ≥ se niegan y las = se separan en una ≤ y una ≥.
+# Cada fila de A' se etiqueta (i, '≤'|'≥') con i la fila original, y cada
+# columna como ('x', j) o ('s', i, '≤'|'≥'), de modo que una base puede
+# trasladarse entre un problema y otro que solo difiera en pocas filas.
+
+def inequality_row_labels(sense):
+    """Etiquetas (i, '≤'|'≥') de las filas de A' para el vector de sentidos."""
+    labels = []
+    for i, s in enumerate(sense):
+        if s in ('≤', '='):
+            labels.append((i, '≤'))
+        if s in ('≥', '='):
+            labels.append((i, '≥'))
+    return labels
+
+
+def inequality_form(c, A, b, sense=None, minimize=False):
+    """
+    Returns:
+        tuple: (costo a maximizar, A', b', etiquetas de fila)
+    """
+    c = np.asarray(c, dtype=float)
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if sense is None:
+        sense = ['≤'] * len(b)
+
+    labels = inequality_row_labels(sense)
+    rows = [A[i] if kind == '≤' else -A[i] for i, kind in labels]
+    rhs = [b[i] if kind == '≤' else -b[i] for i, kind in labels]
+    A_le = np.array(rows, dtype=float).reshape(len(rows), len(c))
+    return (-c if minimize else c), A_le, np.array(rhs, dtype=float), labels
+
+
+def column_labels(n, row_labels):
+    """Etiquetas de las columnas de [A' | I]."""
+    return [('x', j) for j in range(n)] + [('s', i, kind) for i, kind in row_labels]
+
+
+def tableau_from_basis(cost, A_le, b_le, basis, tol=1e-9):
+    """
+    Tableau (disposición de simplex()) correspondiente a la base `basis`.
+
+    Returns:
+        ndarray o None si la base es singular o está mal condicionada
+    """
+    m, n = A_le.shape
+    M = np.hstack([A_le, np.eye(m)])
+    B = M[:, basis]
+    if len(set(basis)) != m or np.linalg.cond(B) > 1 / tol:
+        return None
+
+    full_cost = np.concatenate([cost, np.zeros(m)])
+    tableau = np.zeros((m + 1, n + m + 1))
+    tableau[1:] = np.linalg.solve(B, np.hstack([M, b_le[:, None]]))
+    tableau[1:, basis] = np.eye(m)
+    cB = full_cost[basis]
+    tableau[0, :-1] = cB @ tableau[1:, :-1] - full_cost
+    tableau[0, -1] = cB @ tableau[1:, -1]
+    tableau[0, basis] = 0.0
+    return tableau
+
+
+def solve_from_basis(c, A, b, sense=None, minimize=False, basis=None, tol=1e-9, max_iter=1000,
+                     stats=None):
+    """
+    Resuelve el PL partiendo de `basis` (índices de columnas de [A' | I]).
+
+    Según la base de partida usa:
+        - nada, si ya es óptima
+        - simplex primal, si es primal factible (p. ej. cambió c o se agregó
+          una columna: solo esa columna puede entrar)
+        - simplex dual, si es dual factible (p. ej. cambió b o se agregó una
+          fila)
+        - dos fases, si no es ninguna: fase 1 con simplex dual sobre costos
+          ficticios (1 en cada no básica, que hacen la base dual factible sin
+          razones nulas) y fase 2 con simplex primal desde la base factible
+
+    Sin base (o si es singular) parte de las holguras.
+
+    Args:
+        stats: dict opcional; recibe 'iterations', 'basis' (índices finales),
+            'warm_start' con la estrategia usada y los contadores de
+            PivotMonitor
+
+    Returns:
+        tuple: (solution, optimal_value)
+
+    Raises:
+        UnboundedError / InfeasibleError
+        RuntimeError: Si algún simplex alcanza max_iter
+    """
+    cost, A_le, b_le, _ = inequality_form(c, A, b, sense, minimize)
+    m, n = A_le.shape
+    if stats is None:
+        stats = {}
+    stats['iterations'] = 0
+
+    tableau = None
+    if basis is not None and len(basis) == m and all(0 <= j < n + m for j in basis):
+        basis = [int(j) for j in basis]
+        tableau = tableau_from_basis(cost, A_le, b_le, basis, tol)
+    if tableau is None:
+        basis = list(range(n, n + m))
+        tableau = tableau_from_basis(cost, A_le, b_le, basis, tol)
+
+    primal_feasible = np.all(tableau[1:, -1] >= -tol)
+    dual_feasible = np.all(tableau[0, :-1] >= -tol)
+
+    if primal_feasible and dual_feasible:
+        stats['warm_start'] = 'optimal'
+    elif primal_feasible:
+        stats['warm_start'] = 'primal'
+        primal_simplex(tableau, basis, tol, max_iter, stats)
+    elif dual_feasible:
+        stats['warm_start'] = 'dual'
+        dual_simplex(tableau, basis, tol, max_iter, stats)
+    else:
+        stats['warm_start'] = 'two_phase'
+        # Con costo cero toda razón dual es 0 y cada pivote es degenerado
+        tableau[0] = 1.0
+        tableau[0, basis] = 0.0
+        dual_simplex(tableau, basis, tol, max_iter, stats)
+        # Fase 2: se recalcula la fila Z de la base factible encontrada
+        full_cost = np.concatenate([cost, np.zeros(m)])
+        cB = full_cost[basis]
+        tableau[0, :-1] = cB @ tableau[1:, :-1] - full_cost
+        tableau[0, -1] = cB @ tableau[1:, -1]
+        primal_simplex(tableau, basis, tol, max_iter, stats)
+
+    solution = np.zeros(n)
+    for i, j in enumerate(basis):
+        if j < n:
+            solution[j] = tableau[i + 1, -1]
+    z_opt = tableau[0, -1]
+    if minimize:
+        z_opt = 0.0 - z_opt
+
+    stats['basis'] = list(basis)
+    return solution, z_opt
@@ -336,10 +336,23 @@ function loadExample(method, exampleIndex) {
         return;
     }
 
+    fillExampleFields(method, example);
+}
+
+// Convierte listas (casos guardados vía API) al formato de texto del formulario
+function toFieldText(value) {
+    if (Array.isArray(value)) {
+        return value.map(item => Array.isArray(item) ? item.join(',') : item).join(Array.isArray(value[0]) ? '\n' : ',');
+    }
+    return value === undefined || value === null ? '' : String(value);
+}
+
+// Llena el formulario con un ejemplo (predefinido o guardado en el servidor)
+function fillExampleFields(method, example) {
     // Llenar campos comunes
-    document.getElementById('c').value = example.c || '';
-    document.getElementById('A').value = example.A || '';
-    document.getElementById('b').value = example.b || '';
+    document.getElementById('c').value = toFieldText(example.c);
+    document.getElementById('A').value = toFieldText(example.A);
+    document.getElementById('b').value = toFieldText(example.b);
 
     // Manejar checkbox de minimizar
     const minimizeCheckbox = document.getElementById('minimize');
@@ -350,13 +363,13 @@ function loadExample(method, exampleIndex) {
     // Manejar campo de restricciones de igualdad (para Gran M y Dos Fases)
     const eqConstraintsField = document.getElementById('eq_constraints');
     if (eqConstraintsField) {
-        eqConstraintsField.value = example.eq_constraints || '';
+        eqConstraintsField.value = toFieldText(example.eq_constraints);
     }
 
     // Manejar campo de restricciones >= (para Gran M y Dos Fases)
     const geConstraintsField = document.getElementById('ge_constraints');
     if (geConstraintsField) {
-        geConstraintsField.value = example.ge_constraints || '';
+        geConstraintsField.value = toFieldText(example.ge_constraints);
     }
 
     // Manejar campo M específico para Gran M
@@ -376,6 +389,87 @@ function loadExample(method, exampleIndex) {
     showNotification(`Ejemplo cargado: ${example.name}`, 'success');
 }
 
+// ===== Casos guardados en el servidor (/api/casos) =====
+// Se piden por páginas, filtrados por método y solo con los campos del formulario.
+// El servidor responde con ETag, así que las visitas repetidas reciben 304.
+const SAVED_CASES_PAGE_SIZE = 20;
+const SAVED_CASES_FIELDS = 'name,description,c,A,b,minimize,eq_constraints,ge_constraints,M';
+const savedCases = {};
+
+function loadSavedCases(method, cursor = null) {
+    const params = new URLSearchParams({
+        method: method,
+        limit: SAVED_CASES_PAGE_SIZE,
+        fields: SAVED_CASES_FIELDS
+    });
+    if (cursor !== null) {
+        params.set('cursor', cursor);
+    }
+
+    return fetch(`/api/casos?${params}`)
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}`);
+            }
+            const nextCursor = response.headers.get('X-Next-Cursor');
+            return response.json().then(casos => ({ casos, nextCursor }));
+        })
+        .then(({ casos, nextCursor }) => renderSavedCases(method, casos, nextCursor, cursor === null))
+        .catch(error => console.warn('No se pudieron cargar los casos guardados:', error));
+}
+
+function renderSavedCases(method, casos, nextCursor, firstPage) {
+    const form = document.querySelector('form');
+    if (!form || (firstPage && casos.length === 0)) return;
+
+    let container = document.getElementById('saved-cases');
+    if (!container) {
+        container = document.createElement('div');
+        container.id = 'saved-cases';
+        container.className = 'mb-3';
+        container.innerHTML = `
+            <label class="form-label fw-bold">
+                <i class="fas fa-database text-info me-1"></i>Casos Guardados:
+            </label>
+            <div class="d-flex flex-wrap gap-2 saved-cases-list"></div>
+        `;
+        const firstFormGroup = form.querySelector('.mb-3');
+        form.insertBefore(container, firstFormGroup ? firstFormGroup.nextSibling : form.firstChild);
+    }
+
+    const list = container.querySelector('.saved-cases-list');
+    const moreButton = list.querySelector('.saved-cases-more');
+    if (moreButton) moreButton.remove();
+
+    casos.forEach(caso => {
+        savedCases[caso.id] = caso;
+        const button = document.createElement('button');
+        button.type = 'button';
+        button.className = 'btn btn-outline-info btn-sm';
+        button.title = caso.description || '';
+        button.innerHTML = '<i class="fas fa-folder-open me-1"></i>';
+        button.appendChild(document.createTextNode(caso.name || `Caso ${caso.id}`));
+        button.onclick = () => loadSavedCase(method, caso.id);
+        list.appendChild(button);
+    });
+
+    if (nextCursor !== null) {
+        const more = document.createElement('button');
+        more.type = 'button';
+        more.className = 'btn btn-link btn-sm saved-cases-more';
+        more.textContent = 'Cargar más…';
+        more.onclick = () => loadSavedCases(method, nextCursor);
+        list.appendChild(more);
+    }
+}
+
+function loadSavedCase(method, casoId) {
+    const caso = savedCases[casoId];
+    if (!caso) return;
+    fillExampleFields(method, caso);
+    showNotification(`Caso cargado: ${caso.name || casoId}`, 'success');
+}
+
 // Función para mostrar notificaciones
 function showNotification(message, type = 'info') {
     // Crear elemento de notificación
@@ -655,5 +749,6 @@ document.addEventListener('DOMContentLoaded', function () {
     if (currentMethod) {
         loadFormData(currentMethod);
         setupMethodFeatures(currentMethod);
+        loadSavedCases(currentMethod);
     }
 });
@@ -0,0 +1,52 @@
+// Navegación por las iteraciones intermedias de un resultado.
+// La página solo trae la primera y la última iteración; el resto se pide
+// como fragmento HTML a /resultado/<id>/iteracion/<k> al mostrarla.
+
+function setupIterationBrowser(browser) {
+    const input = browser.querySelector('input');
+    const fragment = browser.querySelector('.iteration-fragment');
+    const first = parseInt(browser.dataset.first, 10);
+    const last = parseInt(browser.dataset.last, 10);
+    // La URL se genera con k=0; se sustituye el último segmento
+    const baseUrl = browser.dataset.url.replace(/\/0$/, '/');
+    const cache = new Map();
+    let loaded = null;
+
+    async function show(number) {
+        number = Math.min(Math.max(number, first), last);
+        input.value = number;
+        if (loaded === number) return;
+        loaded = number;
+
+        if (!cache.has(number)) {
+            fragment.innerHTML = '<div class="text-muted small">Cargando…</div>';
+            const response = await fetch(baseUrl + (number - 1));
+            if (!response.ok) {
+                fragment.innerHTML = '<div class="text-danger small">No se pudo cargar la iteración</div>';
+                loaded = null;
+                return;
+            }
+            cache.set(number, await response.text());
+        }
+        if (loaded === number) {
+            fragment.innerHTML = cache.get(number);
+        }
+    }
+
+    browser.querySelectorAll('[data-step]').forEach(button => {
+        button.addEventListener('click', () => show(parseInt(input.value, 10) + parseInt(button.dataset.step, 10)));
+    });
+    input.addEventListener('change', () => show(parseInt(input.value, 10) || first));
+
+    // Solo se pide la primera intermedia cuando se despliega la sección
+    const collapse = browser.closest('.accordion-collapse');
+    if (collapse) {
+        collapse.addEventListener('show.bs.collapse', () => show(parseInt(input.value, 10)), { once: true });
+    } else {
+        show(first);
+    }
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+    document.querySelectorAll('.iteration-browser').forEach(setupIterationBrowser);
+});
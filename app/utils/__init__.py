@@ -3,27 +3,62 @@ Módulo de utilidades de la aplicación.
 Contiene funciones helper y utilitarios comunes.
 """
 
-from .data_processing import convert_numpy_types, ensure_casos_file, load_casos, save_casos, _to_list
-from .validation import validate_dimensions, validate_form_data
+from .data_processing import ensure_casos_file, load_casos, save_casos, case_store, _to_list
+from .validation import validate_dimensions, validate_form_data, parse_vector, parse_matrix, to_vector, to_matrix
 from .multiple_solutions import (
     detect_multiple_solutions, 
     format_multiple_solutions_result,
     generate_alternative_solutions,
     generate_alternative_solutions_from_slack,
-    generate_solutions_from_equal_coefficients
+    basis_state,
+    enumerate_optimal_face
+)
+from .streaming import iter_solver_events, iter_pivot_events, sse_message
+from .binary_encoding import BINARY_ENCODERS, available_binary_mimetypes
+from .case_import import import_cases
+from .case_solutions import solve_case, schedule_case_solutions
+from .problem_registry import get_problem_registry, senses_from_indices
+from .problem_deltas import apply_changes, transfer_basis
+from .result_store import get_result_store
+from .history_export import (
+    csv_chunks, write_parquet, parquet_available, has_history, iteration_summary, load_iteration
 )
 
 __all__ = [
-    'convert_numpy_types',
     '_to_list',
     'ensure_casos_file', 
     'load_casos',
     'save_casos',
+    'case_store',
     'validate_dimensions',
     'validate_form_data',
+    'parse_vector',
+    'parse_matrix',
+    'to_vector',
+    'to_matrix',
     'detect_multiple_solutions',
     'format_multiple_solutions_result',
     'generate_alternative_solutions',
     'generate_alternative_solutions_from_slack',
-    'generate_solutions_from_equal_coefficients'
+    'basis_state',
+    'enumerate_optimal_face',
+    'iter_solver_events',
+    'iter_pivot_events',
+    'sse_message',
+    'BINARY_ENCODERS',
+    'available_binary_mimetypes',
+    'import_cases',
+    'solve_case',
+    'schedule_case_solutions',
+    'get_problem_registry',
+    'senses_from_indices',
+    'apply_changes',
+    'transfer_basis',
+    'get_result_store',
+    'csv_chunks',
+    'write_parquet',
+    'parquet_available',
+    'has_history',
+    'iteration_summary',
+    'load_iteration'
 ]
@@ -0,0 +1,102 @@
+"""
+Módulo para codificar resultados de los solvers en formatos binarios.
+
+Los arreglos se escriben directamente desde los buffers de NumPy, sin pasar
+por listas de Python.
+"""
+
+import io
+import numpy as np
+
+from .history_export import history_phases, aligned_pivots
+
+NPZ_MIMETYPE = 'application/x-npz'
+MSGPACK_MIMETYPE = 'application/msgpack'
+
+try:
+    import msgpack
+except ImportError:  # msgpack es opcional: sin él solo se ofrece .npz
+    msgpack = None
+
+
+def available_binary_mimetypes():
+    """Formatos binarios que este servidor puede producir."""
+    if msgpack is None:
+        return [NPZ_MIMETYPE]
+    return [NPZ_MIMETYPE, MSGPACK_MIMETYPE]
+
+
+def _tableau_stacks(tableau_history, phases):
+    """Agrupa tableaus consecutivos de igual fase y forma en arreglos 3D.
+
+    Dos Fases tiene dos fases (que pueden tener la misma forma), por eso
+    puede haber varios grupos.
+    """
+    stacks = []
+    group = []
+    for T, phase in zip(tableau_history, phases):
+        if group and (group[-1][1] != phase or group[-1][0].shape != T.shape):
+            stacks.append(np.stack([t for t, _ in group]))
+            group = []
+        group.append((T, phase))
+    if group:
+        stacks.append(np.stack([t for t, _ in group]))
+    return stacks
+
+
+def _result_arrays(solution, optimal_value, tableau_history=None, pivot_history=None, phases=None, steps=None):
+    """
+    Diccionario nombre → ndarray con el contenido del resultado.
+
+    Con historial incluye 'phases' (fase de cada tableau) y 'tableau_pivots'
+    (pivote aplicado a cada tableau o (-1, -1)), ver history_export.
+    """
+    arrays = {
+        'solution': np.asarray(solution, dtype=float),
+        'optimal_value': np.asarray(optimal_value, dtype=float),
+    }
+    if tableau_history is not None:
+        phases = history_phases(tableau_history, phases)
+        stacks = _tableau_stacks(tableau_history, phases)
+        if len(stacks) == 1:
+            arrays['tableaus'] = stacks[0]
+        else:
+            for k, stack in enumerate(stacks):
+                arrays[f'tableaus_{k}'] = stack
+        arrays['pivots'] = np.asarray(pivot_history, dtype=np.int64).reshape(-1, 2)
+        arrays['phases'] = np.asarray(phases, dtype=np.int64)
+        arrays['tableau_pivots'] = aligned_pivots(tableau_history, pivot_history, steps)
+    return arrays
+
+
+def encode_npz(solution, optimal_value, tableau_history=None, pivot_history=None, phases=None, steps=None):
+    """Empaqueta el resultado como un archivo .npz (bytes)."""
+    buffer = io.BytesIO()
+    np.savez(buffer, **_result_arrays(solution, optimal_value, tableau_history, pivot_history, phases, steps))
+    return buffer.getvalue()
+
+
+def encode_msgpack(solution, optimal_value, tableau_history=None, pivot_history=None, phases=None, steps=None):
+    """Empaqueta el resultado como msgpack.
+
+    Cada arreglo es un mapa {'dtype', 'shape', 'data'} con `data` en bytes
+    crudos (orden C), legible con `np.frombuffer(data, dtype).reshape(shape)`.
+    """
+    if msgpack is None:
+        raise RuntimeError('msgpack no está instalado')
+    payload = {}
+    for name, arr in _result_arrays(solution, optimal_value, tableau_history, pivot_history, phases,
+                                    steps).items():
+        arr = np.require(arr, requirements='C')
+        payload[name] = {
+            'dtype': arr.dtype.str,
+            'shape': list(arr.shape),
+            'data': memoryview(arr).cast('B'),
+        }
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+BINARY_ENCODERS = {
+    NPZ_MIMETYPE: encode_npz,
+    MSGPACK_MIMETYPE: encode_msgpack,
+}
@@ -0,0 +1,244 @@
+"""
+Importación incremental de bibliotecas de casos.
+
+Lee un arreglo JSON de nivel superior o NDJSON (un caso por línea) elemento a
+elemento, de modo que solo hay en memoria el bloque leído y el caso actual.
+Cada caso se valida por separado y se inserta en lotes; los errores se
+reportan por índice sin abortar el resto de la importación.
+"""
+
+import codecs
+import json
+import logging
+
+from .validation import to_vector, to_matrix, validate_dimensions
+from ..solvers import DimensionError
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+# Tamaño máximo de un caso individual (texto JSON)
+MAX_ITEM_CHARS = 8 * 1024 * 1024
+BATCH_SIZE = 500
+# Errores detallados que se devuelven (el resto solo se cuentan)
+MAX_REPORTED_ERRORS = 100
+
+_WHITESPACE = ' \t\r\n'
+
+
+class ImportFormatError(ValueError):
+    """Error de sintaxis que impide seguir leyendo el archivo."""
+
+    def __init__(self, message, index):
+        super().__init__(message)
+        self.index = index
+
+
+def _chunks(stream, chunk_size):
+    """Bloques de texto UTF-8 (tolera BOM y caracteres partidos entre bloques)."""
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    while True:
+        data = stream.read(chunk_size)
+        if not data:
+            tail = decoder.decode(b'', final=True)
+            if tail:
+                yield tail
+            return
+        if isinstance(data, str):
+            yield data
+        else:
+            text = decoder.decode(data)
+            if text:
+                yield text
+
+
+def iter_json_items(stream, chunk_size=CHUNK_SIZE, max_item_chars=MAX_ITEM_CHARS):
+    """
+    Genera los elementos de un arreglo JSON o de un archivo NDJSON.
+
+    Yields:
+        tuple: (índice, elemento, error). `error` es un mensaje cuando la
+        línea NDJSON no es JSON válido (el elemento es None) y la lectura
+        continúa con la siguiente.
+
+    Raises:
+        ImportFormatError: Si el arreglo JSON está mal formado; a partir de
+            ese punto no se puede seguir leyendo.
+    """
+    decoder = json.JSONDecoder()
+    chunks = _chunks(stream, chunk_size)
+    buf = ''
+    eof = False
+
+    def fill():
+        nonlocal buf, eof
+        # Se lee al menos lo que ya hay en el buffer para que un caso grande
+        # no se reintente decodificar una vez por bloque
+        wanted = max(chunk_size, len(buf))
+        read = 0
+        while read < wanted:
+            chunk = next(chunks, None)
+            if chunk is None:
+                eof = True
+                break
+            buf += chunk
+            read += len(chunk)
+
+    def skip_whitespace(pos):
+        """Avanza hasta el siguiente carácter significativo (descarta lo consumido)."""
+        nonlocal buf
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buf) or eof:
+                return pos
+            buf = ''
+            pos = 0
+            fill()
+
+    fill()
+    pos = skip_whitespace(0)
+    if pos >= len(buf):
+        return
+
+    if buf[pos] != '[':
+        yield from _iter_ndjson(buf[pos:], chunks, max_item_chars)
+        return
+
+    pos += 1
+    index = 0
+    expect_item = True
+    while True:
+        pos = skip_whitespace(pos)
+        if pos >= len(buf):
+            raise ImportFormatError('El arreglo JSON está incompleto (falta "]")', index)
+        if buf[pos] == ']' and (not expect_item or index == 0):
+            break
+        if not expect_item:
+            if buf[pos] != ',':
+                raise ImportFormatError(f'Se esperaba "," o "]" después del caso {index - 1}', index)
+            pos += 1
+            expect_item = True
+            continue
+
+        buf = buf[pos:]
+        pos = 0
+        while True:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+                # Un valor que termina justo al final del buffer puede seguir
+                # (p. ej. un número partido entre dos bloques)
+                if end < len(buf) or eof:
+                    break
+            except json.JSONDecodeError as e:
+                if eof:
+                    raise ImportFormatError(f'JSON inválido en el caso {index}: {e.msg}', index)
+            if len(buf) > max_item_chars:
+                raise ImportFormatError(
+                    f'El caso {index} supera el tamaño máximo de {max_item_chars} caracteres', index)
+            fill()
+        yield index, item, None
+        index += 1
+        pos = end
+        expect_item = False
+
+
+def _iter_ndjson(buf, chunks, max_item_chars):
+    """Elementos de un archivo NDJSON; las líneas vacías se ignoran."""
+    index = 0
+    pending = buf
+    while True:
+        chunk = next(chunks, None)
+        if chunk is not None:
+            pending += chunk
+        lines = pending.split('\n')
+        pending = lines.pop() if chunk is not None else ''
+        if len(pending) > max_item_chars:
+            raise ImportFormatError(
+                f'La línea del caso {index} supera el tamaño máximo de {max_item_chars} caracteres', index)
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield index, json.loads(line), None
+            except json.JSONDecodeError as e:
+                yield index, None, f'JSON inválido: {e.msg}'
+            index += 1
+        if chunk is None:
+            return
+
+
+def validate_case(caso):
+    """
+    Comprueba que un caso importado tenga c, A y b con dimensiones coherentes.
+
+    Raises:
+        ValueError: Si falta un campo o hay valores no numéricos
+        DimensionError: Si las dimensiones no son consistentes
+    """
+    if not isinstance(caso, dict):
+        raise ValueError('Cada caso debe ser un objeto JSON')
+    for field in ('c', 'A', 'b'):
+        if caso.get(field) in (None, '', []):
+            raise ValueError(f"El campo '{field}' es requerido")
+    c = to_vector(caso['c'], 'c')
+    b = to_vector(caso['b'], 'b')
+    A = to_matrix(caso['A'], 'A')
+    validate_dimensions(A, b, c)
+
+
+def import_cases(store, stream, replace=False, batch_size=BATCH_SIZE):
+    """
+    Importa casos desde `stream` (archivo binario o de texto) a `store`.
+
+    Por defecto los casos válidos se agregan a la biblioteca en transacciones
+    de `batch_size`. Con `replace=True` todo ocurre en una sola transacción
+    que solo sustituye la biblioteca si el archivo se leyó completo.
+
+    Returns:
+        dict: imported, failed, errors ([{'index', 'error'}], como mucho
+        MAX_REPORTED_ERRORS) y, si el archivo estaba mal formado, 'aborted'
+        con el mensaje del error de sintaxis.
+    """
+    report = {'imported': 0, 'failed': 0, 'errors': []}
+
+    def fail(index, message):
+        report['failed'] += 1
+        if len(report['errors']) < MAX_REPORTED_ERRORS:
+            report['errors'].append({'index': index, 'error': message})
+
+    def valid_cases():
+        index = -1
+        for index, caso, error in iter_json_items(stream):
+            if error is None:
+                try:
+                    validate_case(caso)
+                except (ValueError, DimensionError) as e:
+                    error = str(e)
+            if error is not None:
+                fail(index, error)
+                continue
+            yield caso
+        if replace and report['failed'] == index + 1:
+            # Nada válido: no se sustituye la biblioteca por una vacía
+            raise ImportFormatError('El archivo no contiene casos válidos', index + 1)
+
+    try:
+        if replace:
+            report['imported'] = store.replace_all(valid_cases())
+        else:
+            batch = []
+            for caso in valid_cases():
+                batch.append(caso)
+                if len(batch) >= batch_size:
+                    report['imported'] += store.insert_many(batch)
+                    batch = []
+            if batch:
+                report['imported'] += store.insert_many(batch)
+    except ImportFormatError as e:
+        logger.warning(f"Importación interrumpida en el caso {e.index}: {e}")
+        report['aborted'] = str(e)
+        if replace:
+            report['imported'] = 0
+    return report
@@ -0,0 +1,175 @@
+"""
+Soluciones precalculadas de los casos guardados.
+
+Al guardar o importar casos se programa un barrido en segundo plano que
+resuelve los casos sin solución con el método (o métodos) aplicable y guarda
+solución, valor óptimo, base final e iteraciones en la tabla `soluciones`.
+Así `GET /api/casos/<id>?with_solution=1` no tiene que resolver nada.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .validation import to_vector, to_matrix, validate_dimensions
+from ..solvers import simplex, granm_solver, dosfases_solver
+from ..solvers import SimplexError, UnboundedError, GranMUnboundedError
+
+logger = logging.getLogger(__name__)
+
+METHODS = ('simplex', 'granm', 'dosfases')
+SWEEP_BATCH = 100
+
+
+def _indices(value):
+    """Índices de restricción dados como lista o como texto "0,2"."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [int(x) for x in value.split(',') if x.strip().isdigit()]
+    return [int(x) for x in value]
+
+
+def case_senses(caso, m):
+    """Vector de sentidos ('≤', '≥', '=') de un caso guardado."""
+    if caso.get('sense'):
+        return list(caso['sense'])
+    sense = ['≤'] * m
+    for i in _indices(caso.get('eq_constraints')):
+        if 0 <= i < m:
+            sense[i] = '='
+    for i in _indices(caso.get('ge_constraints')):
+        if 0 <= i < m:
+            sense[i] = '≥'
+    return sense
+
+
+def applicable_methods(caso, sense, b):
+    """El método declarado en el caso o, si no hay, los que pueden resolverlo."""
+    method = caso.get('method') or caso.get('metodo')
+    if isinstance(method, str) and method.lower() in METHODS:
+        return [method.lower()]
+    if all(s == '≤' for s in sense) and np.all(b >= 0):
+        return ['simplex']
+    return ['granm', 'dosfases']
+
+
+def _run(method, c, A, b, sense, minimize, M):
+    stats = {}
+    if method == 'simplex':
+        solution, z = simplex(c, A, b, minimize=minimize, stats=stats)
+    elif method == 'granm':
+        solution, z = granm_solver(c, A, b, sense, minimize=minimize, M=M, stats=stats)
+    else:
+        solution, z = dosfases_solver(
+            c, A, b,
+            eq_constraints=[i for i, s in enumerate(sense) if s == '='],
+            ge_constraints=[i for i, s in enumerate(sense) if s == '≥'],
+            minimize=minimize, stats=stats
+        )
+    if solution is None:
+        # Dos Fases no lanza excepciones: deja el motivo en stats['status']
+        return {'status': stats.get('status', 'infeasible'), 'iterations': stats.get('iterations')}
+    return {
+        'status': 'optimal',
+        'solution': np.asarray(solution, dtype=float).tolist(),
+        'optimal_value': float(z),
+        'basis': [int(j) for j in stats.get('basis', [])],
+        'iterations': stats.get('iterations'),
+    }
+
+
+def solve_case(caso):
+    """
+    Resuelve un caso guardado con sus métodos aplicables.
+
+    Returns:
+        dict: {método: {'status', 'solution', 'optimal_value', 'basis',
+        'iterations'}}; los errores quedan como {'status': 'error', 'error'}
+        para no reintentarlos en cada barrido.
+    """
+    try:
+        c = to_vector(caso.get('c'), 'c')
+        b = to_vector(caso.get('b'), 'b')
+        A = to_matrix(caso.get('A'), 'A')
+        validate_dimensions(A, b, c)
+        sense = case_senses(caso, len(b))
+        M = float(caso.get('M') or 1e6)
+    except (ValueError, TypeError, SimplexError) as e:
+        method = (caso.get('method') or caso.get('metodo') or 'simplex')
+        return {str(method).lower(): {'status': 'error', 'error': str(e)}}
+
+    minimize = bool(caso.get('minimize'))
+    results = {}
+    for method in applicable_methods(caso, sense, b):
+        try:
+            results[method] = _run(method, c, A, b, sense, minimize, M)
+        except (UnboundedError, GranMUnboundedError) as e:
+            results[method] = {'status': 'unbounded', 'error': str(e)}
+        except Exception as e:
+            # Un caso que rompe el solver no debe detener el barrido
+            logger.warning(f"No se pudo resolver el caso con {method}: {e}")
+            results[method] = {'status': 'error', 'error': str(e)}
+    return results
+
+
+class CaseSolver:
+    """Barrido en segundo plano (un hilo) que resuelve los casos pendientes.
+
+    Las llamadas a `schedule` mientras un barrido está en marcha se agrupan:
+    el barrido en curso vuelve a consultar los pendientes al terminar.
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='case-solver')
+        self._lock = threading.Lock()
+        self._running = set()   # almacenes con barrido en curso
+        self._again = set()     # almacenes con casos nuevos durante el barrido
+
+    def schedule(self, store):
+        """Programa la resolución de los casos sin solución de `store`."""
+        with self._lock:
+            if store in self._running:
+                self._again.add(store)
+                return None
+            self._running.add(store)
+        return self._executor.submit(self._sweep, store)
+
+    def _sweep(self, store):
+        solved = 0
+        try:
+            while True:
+                ids = store.unsolved_ids(SWEEP_BATCH)
+                if not ids:
+                    with self._lock:
+                        if store not in self._again:
+                            self._running.discard(store)
+                            return solved
+                        self._again.discard(store)
+                    continue
+                for caso_id in ids:
+                    caso = store.get(caso_id)
+                    if caso is not None:
+                        store.save_solutions(caso_id, solve_case(caso))
+                        solved += 1
+        except Exception:
+            logger.exception("Error al resolver casos en segundo plano")
+            with self._lock:
+                self._running.discard(store)
+                self._again.discard(store)
+            raise
+
+
+_solver = None
+_solver_lock = threading.Lock()
+
+
+def schedule_case_solutions(store):
+    """Resuelve en segundo plano los casos de `store` que aún no tienen solución."""
+    global _solver
+    with _solver_lock:
+        if _solver is None:
+            _solver = CaseSolver()
+    return _solver.schedule(store)
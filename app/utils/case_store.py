@@ -0,0 +1,403 @@
+"""
+Almacén de casos en SQLite.
+
+Reemplaza la reescritura completa de casos.json: cada caso tiene un id
+estable y las operaciones de lectura, inserción y borrado tocan una sola
+fila. La base usa WAL para que varios workers lean y escriban a la vez.
+
+Cada proceso mantiene una copia ya parseada e indexada por id. Toda
+escritura incrementa un contador `version` en la tabla meta; las lecturas
+solo comparan ese contador y recargan la copia cuando otro worker cambió
+la base.
+"""
+
+import bisect
+import itertools
+import json
+import os
+import sqlite3
+import threading
+import time
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS casos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    method TEXT,
+    n_vars INTEGER,
+    n_constraints INTEGER,
+    minimize INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_casos_method ON casos(method);
+CREATE INDEX IF NOT EXISTS idx_casos_dims ON casos(n_vars, n_constraints);
+CREATE INDEX IF NOT EXISTS idx_casos_created_at ON casos(created_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS soluciones (
+    caso_id INTEGER NOT NULL,
+    method TEXT NOT NULL,
+    solved_at REAL NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (caso_id, method)
+);
+"""
+
+
+def _count_entries(value):
+    """Número de valores de un vector dado como lista o como texto "1,2,3"."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return len([x for x in value.split(',') if x.strip()])
+    try:
+        return len(value)
+    except TypeError:
+        return None
+
+
+def case_metadata(caso):
+    """Columnas indexadas de un caso: método, dimensiones y sentido."""
+    method = caso.get('method') or caso.get('metodo')
+    return {
+        'method': method.lower() if isinstance(method, str) else None,
+        'n_vars': _count_entries(caso.get('c')),
+        'n_constraints': _count_entries(caso.get('b')),
+        'minimize': 1 if caso.get('minimize') else 0,
+    }
+
+
+def _discard(ids, caso_id):
+    """Quita `caso_id` de una lista ordenada de ids."""
+    k = bisect.bisect_left(ids, caso_id)
+    if k < len(ids) and ids[k] == caso_id:
+        del ids[k]
+
+
+class _CaseIndex:
+    """Casos en memoria con índices secundarios por columna filtrable.
+
+    `postings[campo][valor]` es la lista ordenada de ids con ese valor, así
+    que una consulta recorre solo la lista más corta de sus filtros. `put` y
+    `remove` actualizan solo las listas del caso afectado; los ids nuevos son
+    siempre los mayores, así que insertar es un append.
+    """
+
+    FIELDS = ('method', 'n_vars', 'n_constraints', 'minimize')
+
+    def __init__(self, casos, meta):
+        self.casos = casos
+        self.meta = meta
+        self.ids = sorted(casos)
+        self.postings = {field: {} for field in self.FIELDS}
+        for caso_id in self.ids:
+            for field in self.FIELDS:
+                self.postings[field].setdefault(meta[caso_id][field], []).append(caso_id)
+
+    def put(self, caso_id, caso, meta):
+        """Agrega o reemplaza un caso (un reemplazo conserva su posición)."""
+        old = self.meta.get(caso_id)
+        if old is None:
+            bisect.insort(self.ids, caso_id)
+        else:
+            self._unpost(caso_id, old)
+        self.casos[caso_id] = caso
+        self.meta[caso_id] = meta
+        for field in self.FIELDS:
+            bisect.insort(self.postings[field].setdefault(meta[field], []), caso_id)
+
+    def remove(self, caso_id):
+        meta = self.meta.pop(caso_id, None)
+        if meta is None:
+            return
+        del self.casos[caso_id]
+        _discard(self.ids, caso_id)
+        self._unpost(caso_id, meta)
+
+    def _unpost(self, caso_id, meta):
+        for field in self.FIELDS:
+            posting = self.postings[field][meta[field]]
+            _discard(posting, caso_id)
+            if not posting:
+                del self.postings[field][meta[field]]
+
+    def query(self, filters, after=None, limit=None):
+        """Ids (ascendentes) que cumplen `filters`, a partir del cursor `after`."""
+        candidates = self.ids
+        for field, value in filters.items():
+            posting = self.postings[field].get(value, [])
+            if len(posting) < len(candidates):
+                candidates = posting
+        start = 0 if after is None else bisect.bisect_right(candidates, after)
+
+        result = []
+        for caso_id in itertools.islice(candidates, start, None):
+            meta = self.meta[caso_id]
+            if all(meta[field] == value for field, value in filters.items()):
+                result.append(caso_id)
+                if limit is not None and len(result) >= limit:
+                    break
+        return result
+
+
+class CaseStore:
+    """Casos guardados con ids estables sobre SQLite (modo WAL)."""
+
+    def __init__(self, path, legacy_json_path=None):
+        self.path = path
+        self.legacy_json_path = legacy_json_path
+        self._local = threading.local()
+        self._cache = None          # {id: caso} en orden de inserción
+        self._cache_version = None
+        self._cache_lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        conn = self._conn()
+        conn.executescript(_SCHEMA)
+        self._migrate_from_json()
+
+    def _conn(self):
+        """Una conexión por hilo (los workers gthread comparten el proceso)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    # ── migración ──────────────────────────────────────────
+    def _migrate_from_json(self):
+        """Importa casos.json una sola vez (la marca queda en la tabla meta)."""
+        with self._transaction() as conn:
+            if conn.execute("SELECT 1 FROM meta WHERE key = 'json_migrated'").fetchone():
+                return
+            casos = []
+            if self.legacy_json_path and os.path.exists(self.legacy_json_path):
+                try:
+                    with open(self.legacy_json_path, 'r') as f:
+                        casos = json.load(f)
+                except (json.JSONDecodeError, OSError) as e:
+                    logger.warning(f"No se pudo migrar {self.legacy_json_path}: {e}")
+                    casos = []
+            if isinstance(casos, list):
+                self._insert_many(conn, casos)
+                if casos:
+                    logger.info(f"Migrados {len(casos)} casos desde {self.legacy_json_path}")
+            conn.execute("INSERT INTO meta (key, value) VALUES ('json_migrated', ?)", (str(time.time()),))
+            self._bump_version(conn)
+
+    # ── helpers ────────────────────────────────────────────
+    @staticmethod
+    def _row_to_caso(row):
+        caso = json.loads(row['data'])
+        caso['id'] = row['id']
+        return caso
+
+    @staticmethod
+    def _insert_many(conn, casos):
+        """Inserta `casos` (cualquier iterable, se consume fila a fila) y devuelve cuántos."""
+        now = time.time()
+
+        def rows():
+            for caso in casos:
+                caso = {k: v for k, v in caso.items() if k != 'id'}
+                meta = case_metadata(caso)
+                yield (meta['method'], meta['n_vars'], meta['n_constraints'], meta['minimize'],
+                       now, json.dumps(caso, ensure_ascii=False))
+
+        cursor = conn.executemany(
+            'INSERT INTO casos (method, n_vars, n_constraints, minimize, created_at, data) '
+            'VALUES (?, ?, ?, ?, ?, ?)', rows()
+        )
+        return max(cursor.rowcount, 0)
+
+    # ── caché en memoria ───────────────────────────────────
+    @staticmethod
+    def _bump_version(conn):
+        """Incrementa el contador de versión dentro de la transacción actual."""
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES ('version', '1') "
+            "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+        )
+        return int(conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()[0])
+
+    def version(self):
+        """Versión actual de la base (cambia con cada escritura de cualquier worker)."""
+        row = self._conn().execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return int(row[0]) if row else 0
+
+    @contextmanager
+    def _cached(self):
+        """
+        Índice en memoria de todos los casos, recargado solo si cambió la versión.
+
+        Se usa con el lock tomado porque las escrituras propias lo actualizan
+        en sitio.
+        """
+        version = self.version()
+        with self._cache_lock:
+            if self._cache is None or self._cache_version != version:
+                rows = self._conn().execute(
+                    'SELECT id, method, n_vars, n_constraints, minimize, data FROM casos ORDER BY id'
+                ).fetchall()
+                self._cache = _CaseIndex(
+                    {row['id']: self._row_to_caso(row) for row in rows},
+                    {row['id']: {f: row[f] for f in _CaseIndex.FIELDS} for row in rows}
+                )
+                self._cache_version = version
+            yield self._cache
+
+    def _apply_local_write(self, version, caso_id, caso=None):
+        """Aplica una escritura propia a la caché sin recargarla.
+
+        Solo es válido si la caché estaba justo en la versión anterior; si
+        otro worker escribió entremedio se recargará en la próxima lectura.
+        Solo se tocan las listas del caso afectado.
+        """
+        with self._cache_lock:
+            if self._cache is not None and self._cache_version == version - 1:
+                if caso is None:
+                    self._cache.remove(caso_id)
+                else:
+                    self._cache.put(caso_id, caso, case_metadata(caso))
+                self._cache_version = version
+
+    # ── API pública ────────────────────────────────────────
+    def all(self):
+        """Todos los casos en orden de inserción, cada uno con su 'id'."""
+        with self._cached() as index:
+            return list(index.casos.values())
+
+    def get(self, caso_id):
+        """Caso por id o None."""
+        with self._cached() as index:
+            return index.casos.get(caso_id)
+
+    def query(self, filters=None, after=None, limit=None):
+        """
+        Página de casos que cumplen `filters`, con id mayor que `after`.
+
+        Args:
+            filters: dict con valores exactos para method, n_vars,
+                n_constraints y/o minimize
+            after: cursor (último id de la página anterior)
+            limit: tamaño máximo de página
+
+        Returns:
+            tuple: (lista de casos, cursor siguiente o None)
+        """
+        with self._cached() as index:
+            ids = index.query(filters or {}, after, None if limit is None else limit + 1)
+            next_cursor = None
+            if limit is not None and len(ids) > limit:
+                ids = ids[:limit]
+                next_cursor = ids[-1]
+            return [index.casos[i] for i in ids], next_cursor
+
+    def insert(self, caso):
+        """Guarda un caso nuevo y devuelve su id."""
+        with self._transaction() as conn:
+            self._insert_many(conn, [caso])
+            caso_id = conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+            row = conn.execute('SELECT id, data FROM casos WHERE id = ?', (caso_id,)).fetchone()
+            version = self._bump_version(conn)
+        self._apply_local_write(version, caso_id, self._row_to_caso(row))
+        return caso_id
+
+    def delete(self, caso_id):
+        """Elimina un caso y lo devuelve (None si no existía)."""
+        with self._transaction() as conn:
+            row = conn.execute('SELECT id, data FROM casos WHERE id = ?', (caso_id,)).fetchone()
+            if row is None:
+                return None
+            conn.execute('DELETE FROM casos WHERE id = ?', (caso_id,))
+            conn.execute('DELETE FROM soluciones WHERE caso_id = ?', (caso_id,))
+            version = self._bump_version(conn)
+        self._apply_local_write(version, caso_id)
+        return self._row_to_caso(row)
+
+    def insert_many(self, casos):
+        """Guarda varios casos en una sola transacción y devuelve cuántos."""
+        with self._transaction() as conn:
+            count = self._insert_many(conn, casos)
+            if count:
+                self._bump_version(conn)
+        return count
+
+    def replace_all(self, casos):
+        """
+        Sustituye la biblioteca completa en una sola transacción.
+
+        `casos` puede ser un generador: si lanza una excepción a mitad de
+        camino se hace ROLLBACK y la biblioteca anterior queda intacta.
+        """
+        with self._transaction() as conn:
+            conn.execute('DELETE FROM casos')
+            conn.execute('DELETE FROM soluciones')
+            count = self._insert_many(conn, casos)
+            self._bump_version(conn)
+        return count
+
+    # ── soluciones precalculadas ───────────────────────────
+    # No cambian la versión: guardar una solución no altera la lista de casos.
+    def unsolved_ids(self, limit=100):
+        """Ids de casos que aún no tienen ninguna solución guardada."""
+        rows = self._conn().execute(
+            'SELECT id FROM casos WHERE NOT EXISTS '
+            '(SELECT 1 FROM soluciones WHERE caso_id = casos.id) ORDER BY id LIMIT ?', (limit,)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def save_solutions(self, caso_id, solutions):
+        """Guarda {método: resultado} de un caso (se ignora si el caso ya no existe)."""
+        now = time.time()
+        with self._transaction() as conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO soluciones (caso_id, method, solved_at, data) '
+                'SELECT ?, ?, ?, ? WHERE EXISTS (SELECT 1 FROM casos WHERE id = ?)',
+                [(caso_id, method, now, json.dumps(data), caso_id) for method, data in solutions.items()]
+            )
+
+    def solutions(self, caso_id):
+        """
+        Soluciones guardadas de un caso.
+
+        Returns:
+            tuple: ({método: resultado}, instante de la última o None)
+        """
+        rows = self._conn().execute(
+            'SELECT method, solved_at, data FROM soluciones WHERE caso_id = ? ORDER BY method', (caso_id,)
+        ).fetchall()
+        solved_at = max((row['solved_at'] for row in rows), default=None)
+        return {row['method']: json.loads(row['data']) for row in rows}, solved_at
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_case_store(path, legacy_json_path=None):
+    """Instancia compartida del almacén para `path` (una por proceso)."""
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = CaseStore(path, legacy_json_path)
+        return store
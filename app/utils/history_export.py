@@ -0,0 +1,243 @@
+"""
+Exportación del historial de iteraciones en formato largo.
+
+Cada celda de cada tableau es una fila (iteration, row, column, value, pivot),
+donde `pivot` marca el elemento sobre el que se pivoteó para pasar a la
+iteración siguiente. El historial se guarda como pilas .npy (una por fase o
+forma de tableau) y se recorre con memory-map por bloques, así que ni el CSV
+ni el Parquet necesitan el historial completo en memoria.
+
+Los solvers que lo registran (Dos Fases: stats['tableau_phases'] y
+stats['tableau_pivots']) dan la fase y el pivote de cada tableau; sin ellos
+se deducen de los cambios de forma y de los tableaus repetidos.
+"""
+
+import os
+import io
+import re
+import tempfile
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow es opcional; sin él solo hay CSV
+    pa = pq = None
+
+COLUMNS = ('iteration', 'row', 'column', 'value', 'pivot')
+# Celdas por bloque al generar las filas largas
+CHUNK_CELLS = 1 << 18
+
+_STACK = re.compile(r'^tableaus_(\d+)\.npy$')
+
+
+def aligned_pivots(tableau_history, pivot_history, steps=None):
+    """
+    Pivote aplicado a cada tableau del historial, o (-1, -1).
+
+    `steps` es el pivote de cada tableau registrado por el solver (None si
+    el siguiente no está a un pivote). Sin él se deduce: los historiales de
+    dos fases repiten el tableau inicial de cada fase, así que un pivote solo
+    se asigna entre tableaus consecutivos de igual forma que difieren.
+    """
+    pivots = np.full((len(tableau_history), 2), -1, dtype=np.int64)
+    if steps is not None:
+        for k, step in enumerate(steps):
+            if step is not None:
+                pivots[k] = [int(step[0]), int(step[1])]
+        return pivots
+    remaining = iter(pivot_history)
+    for k in range(len(tableau_history) - 1):
+        current, following = tableau_history[k], tableau_history[k + 1]
+        if np.shape(current) == np.shape(following) and not np.array_equal(current, following):
+            step = next(remaining, None)
+            if step is None:
+                break
+            pivots[k] = [int(step[0]), int(step[1])]
+    return pivots
+
+
+def history_phases(tableau_history, phases=None):
+    """Fase de cada tableau: la registrada o una nueva en cada cambio de forma."""
+    if phases is not None:
+        return [int(p) for p in phases]
+    shapes = [np.shape(t) for t in tableau_history]
+    phase = [0] if shapes else []
+    for k in range(1, len(shapes)):
+        phase.append(phase[-1] + (shapes[k] != shapes[k - 1]))
+    return phase
+
+
+def save_history(directory, tableau_history, pivot_history, phases=None, steps=None):
+    """
+    Guarda el historial en `directory` como tableaus_<g>.npy (un grupo por
+    fase y forma), phases.npy y pivots.npy.
+    """
+    phase = history_phases(tableau_history, phases)
+    group = 0
+    start = 0
+    while start < len(tableau_history):
+        key = (phase[start], np.shape(tableau_history[start]))
+        end = start
+        while end < len(tableau_history) and (phase[end], np.shape(tableau_history[end])) == key:
+            end += 1
+        shape = key[1]
+        stack = np.lib.format.open_memmap(os.path.join(directory, f'tableaus_{group}.npy'),
+                                          mode='w+', dtype=np.float64, shape=(end - start,) + shape)
+        for k in range(start, end):
+            stack[k - start] = tableau_history[k]
+        stack.flush()
+        del stack
+        group += 1
+        start = end
+    np.save(os.path.join(directory, 'phases.npy'), np.asarray(phase, dtype=np.int64))
+    np.save(os.path.join(directory, 'pivots.npy'), aligned_pivots(tableau_history, pivot_history, steps))
+
+
+def iteration_summary(tableau_history, pivot_history, phases=None, steps=None):
+    """
+    Primera y última iteración del historial, para mostrarlas sin recorrerlo.
+
+    Returns:
+        dict: 'total', 'phases' (número de fases) y 'first' / 'last' con
+        'index', 'tableau', 'pivot' y 'phase'
+    """
+    phase = history_phases(tableau_history, phases)
+    pivots = aligned_pivots(tableau_history, pivot_history or [], steps)
+
+    def entry(k):
+        row, col = pivots[k]
+        return {'index': k, 'tableau': tableau_history[k], 'phase': phase[k],
+                'pivot': (int(row), int(col)) if row >= 0 else None}
+
+    return {'total': len(tableau_history), 'phases': len(set(phase)),
+            'first': entry(0), 'last': entry(len(tableau_history) - 1)}
+
+
+def has_history(directory):
+    return os.path.exists(os.path.join(directory, 'pivots.npy'))
+
+
+def _stacks(directory):
+    return [os.path.join(directory, name) for _, name in
+            sorted((int(m.group(1)), name) for name in os.listdir(directory)
+                   for m in [_STACK.match(name)] if m)]
+
+
+def load_iteration(directory, k):
+    """
+    Una sola iteración del historial guardado.
+
+    Returns:
+        dict: 'index', 'tableau', 'pivot', 'phase', 'phases' y 'total'
+
+    Raises:
+        IndexError: Si k está fuera del historial
+    """
+    stacks = [np.load(path, mmap_mode='r') for path in _stacks(directory)]
+    total = sum(len(stack) for stack in stacks)
+    if not 0 <= k < total:
+        raise IndexError(f"La iteración {k} no existe (hay {total})")
+
+    offset = k
+    for group, stack in enumerate(stacks):
+        if offset < len(stack):
+            break
+        offset -= len(stack)
+    phases_path = os.path.join(directory, 'phases.npy')
+    if os.path.exists(phases_path):
+        phases = np.load(phases_path)
+        phase, n_phases = int(phases[k]), len(np.unique(phases))
+    else:  # historiales guardados antes de registrar la fase
+        phase, n_phases = group, len(stacks)
+    row, col = np.load(os.path.join(directory, 'pivots.npy'), mmap_mode='r')[k]
+    return {'index': k, 'tableau': np.array(stack[offset]), 'phase': phase, 'phases': n_phases,
+            'total': total, 'pivot': (int(row), int(col)) if row >= 0 else None}
+
+
+def iter_tableaus(directory):
+    """Genera (iteración, tableau, (fila, columna) del pivote o None) con memory-map."""
+    pivots = np.load(os.path.join(directory, 'pivots.npy'), mmap_mode='r')
+    iteration = 0
+    for path in _stacks(directory):
+        stack = np.load(path, mmap_mode='r')
+        for tableau in stack:
+            row, col = pivots[iteration]
+            yield iteration, tableau, (int(row), int(col)) if row >= 0 else None
+            iteration += 1
+
+
+def long_format_chunks(directory, chunk_cells=CHUNK_CELLS):
+    """
+    Genera bloques del historial en formato largo.
+
+    Returns:
+        generator: dicts columna → ndarray con las columnas de COLUMNS
+    """
+    pending, cells = [], 0
+    for item in iter_tableaus(directory):
+        pending.append(item)
+        cells += item[1].size
+        if cells >= chunk_cells:
+            yield _long_block(pending)
+            pending, cells = [], 0
+    if pending:
+        yield _long_block(pending)
+
+
+def _long_block(items):
+    iterations, rows, cols, values, flags = [], [], [], [], []
+    for iteration, tableau, pivot in items:
+        n_rows, n_cols = tableau.shape
+        iterations.append(np.full(tableau.size, iteration, dtype=np.int64))
+        rows.append(np.repeat(np.arange(n_rows, dtype=np.int64), n_cols))
+        cols.append(np.tile(np.arange(n_cols, dtype=np.int64), n_rows))
+        values.append(np.asarray(tableau, dtype=np.float64).ravel())
+        flag = np.zeros(tableau.size, dtype=bool)
+        if pivot is not None:
+            flag[pivot[0] * n_cols + pivot[1]] = True
+        flags.append(flag)
+    return dict(zip(COLUMNS, map(np.concatenate, (iterations, rows, cols, values, flags))))
+
+
+def csv_chunks(directory, chunk_cells=CHUNK_CELLS):
+    """Genera el CSV (con cabecera) como bloques de texto."""
+    yield ','.join(COLUMNS) + '\n'
+    for block in long_format_chunks(directory, chunk_cells):
+        buffer = io.StringIO()
+        np.savetxt(buffer, np.column_stack([block[name] for name in COLUMNS]),
+                   fmt=('%d', '%d', '%d', '%.17g', '%d'), delimiter=',')
+        yield buffer.getvalue()
+
+
+def parquet_available():
+    return pq is not None
+
+
+def write_parquet(directory, path, chunk_cells=CHUNK_CELLS):
+    """
+    Escribe el historial como Parquet en `path`, un row group por bloque.
+
+    Se escribe en un temporal único del mismo directorio y se renombra con
+    os.replace, así que una descarga concurrente nunca lee un archivo a
+    medio escribir.
+
+    Raises:
+        RuntimeError: Si pyarrow no está instalado
+    """
+    if pq is None:
+        raise RuntimeError("La exportación a Parquet requiere pyarrow")
+
+    schema = pa.schema([('iteration', pa.int64()), ('row', pa.int64()), ('column', pa.int64()),
+                        ('value', pa.float64()), ('pivot', pa.bool_())])
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    os.close(fd)
+    try:
+        with pq.ParquetWriter(tmp, schema) as writer:
+            for block in long_format_chunks(directory, chunk_cells):
+                writer.write_table(pa.table(block, schema=schema))
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
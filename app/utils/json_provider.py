@@ -0,0 +1,49 @@
+"""
+Proveedor JSON de Flask que serializa tipos de NumPy de forma nativa.
+
+Con `orjson` instalado los ndarray se codifican directamente desde su buffer
+(sin crear un objeto Python por elemento); sin él se usa el módulo `json`
+estándar con `ndarray.tolist()` como respaldo.
+"""
+
+import numpy as np
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional
+    orjson = None
+
+
+def _numpy_default(obj):
+    """Convierte ndarray y escalares de NumPy a tipos serializables."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return DefaultJSONProvider.default(obj)
+
+
+class NumpyJSONProvider(DefaultJSONProvider):
+    """DefaultJSONProvider que entiende ndarray y escalares de NumPy."""
+
+    default = staticmethod(_numpy_default)
+
+    # Opciones de json.dumps que orjson puede reproducir
+    _ORJSON_KWARGS = {'default', 'ensure_ascii', 'sort_keys', 'indent'}
+
+    def dumps(self, obj, **kwargs):
+        kwargs.setdefault('default', self.default)
+        kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        if orjson is not None and set(kwargs) <= self._ORJSON_KWARGS and kwargs.get('indent') in (None, 2):
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if kwargs['sort_keys']:
+                option |= orjson.OPT_SORT_KEYS
+            if kwargs.get('indent') == 2:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(obj, default=kwargs['default'], option=option).decode()
+            except TypeError:
+                pass  # p. ej. enteros fuera de 64 bits: lo resuelve json estándar
+        return super().dumps(obj, **kwargs)
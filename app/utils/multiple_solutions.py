@@ -1,17 +1,205 @@
 """
 Módulo para detección y manejo de soluciones múltiples.
+
+El estado de la base (máscaras de básicas / no básicas, fila de cada básica
+y costos reducidos nulos) se calcula una sola vez a partir del tableau final
+y, si el solver la registró en `stats['basis']`, de su base. Los vértices
+adyacentes se derivan de ese estado sin pivotear (al entrar la columna j con
+paso θ, las básicas pasan a x_B - θ·a_j y x_j a θ) y la cara óptima completa
+se enumera pivoteando solo en columnas de costo reducido 0.
 """
 
-import numpy as np
+import time
 import logging
+from collections import deque
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Límites de la enumeración de la cara óptima en cada resolución
+MAX_OPTIMAL_VERTICES = 50
+FACE_TIME_LIMIT = 0.1  # segundos
+
+
+def basis_state(final_tableau, n_vars, basis=None, z_row='first', tol=1e-8):
+    """
+    Estado de la base del tableau final.
+
+    Args:
+        basis: columna básica de cada fila de restricción (stats['basis'] de
+            los solvers). Sin ella se deduce de las columnas unitarias.
+        z_row: 'first' (simplex, Gran M) o 'last' (Dos Fases)
+
+    Returns:
+        dict: 'rows' (restricciones sin RHS), 'rhs', 'reduced_costs', 'basis',
+        'basic' (máscara), 'zero_cost' (índices no básicos con costo
+        reducido nulo) y 'solution' (valores de las n_vars originales)
+    """
+    T = np.asarray(final_tableau, dtype=float)
+    if z_row == 'first':
+        z, body = T[0], T[1:]
+    else:
+        z, body = T[-1], T[:-1]
+    rows, rhs = body[:, :-1], body[:, -1]
+    m, n_cols = rows.shape
+
+    if basis is None:
+        # Columnas unitarias: un 1 y el resto ceros; una por fila
+        near_zero = np.abs(rows) <= tol
+        unit = (near_zero.sum(axis=0) == m - 1) & np.isclose(rows.max(axis=0), 1.0, atol=tol)
+        unit_row = np.argmax(rows, axis=0)
+        basis = np.full(m, -1, dtype=int)
+        for j in np.flatnonzero(unit)[::-1]:
+            basis[unit_row[j]] = j
+    else:
+        basis = np.asarray(basis, dtype=int)
+
+    basic = np.zeros(n_cols, dtype=bool)
+    basic[basis[basis >= 0]] = True
+    zero_cost = np.flatnonzero(~basic & (np.abs(z[:-1]) <= tol))
+
+    solution = np.zeros(n_vars)
+    original = (basis >= 0) & (basis < n_vars)
+    solution[basis[original]] = rhs[original]
+
+    return {'rows': rows, 'rhs': rhs, 'reduced_costs': z[:-1], 'basis': basis, 'basic': basic,
+            'zero_cost': zero_cost, 'solution': solution, 'tol': tol}
+
+
+def enumerate_optimal_face(final_tableau, n_vars, basis=None, z_row='first',
+                           max_vertices=MAX_OPTIMAL_VERTICES, time_limit=FACE_TIME_LIMIT, tol=1e-8):
+    """
+    Enumera los vértices óptimos recorriendo en anchura las bases óptimas
+    adyacentes.
+
+    Solo se pivotea en columnas con costo reducido 0, de modo que la fila Z
+    no cambia y toda base alcanzada sigue siendo óptima. En pasos degenerados
+    se prueban todas las filas empatadas en la razón mínima; las bases ya
+    visitadas se descartan con un conjunto de hashes.
+
+    Returns:
+        dict: 'vertices' (lista de dicts con 'solution' y, salvo el de
+        partida, 'entering_var' / 'pivot_row' del pivote que lo alcanzó),
+        'rays' (direcciones óptimas no acotadas), 'dimension' de la cara,
+        'complete' (False si se cortó por límite) y 'bases_explored'
+    """
+    state = basis_state(final_tableau, n_vars, basis, z_row, tol)
+    return _explore_optimal_face(state, max_vertices, time_limit)
+
+
+def _explore_optimal_face(state, max_vertices, time_limit):
+    tol = state['tol']
+    n_vars = len(state['solution'])
+    start = state['basis']
+    current = {'solution': state['solution'].tolist()}
+    if np.any(start < 0):
+        # Sin base completa no se puede pivotear con seguridad
+        return {'vertices': [current], 'rays': [], 'dimension': 0, 'complete': False, 'bases_explored': 1}
+
+    zero = np.flatnonzero(np.abs(state['reduced_costs']) <= tol)
+    tableau = np.hstack([state['rows'], state['rhs'][:, None]])
+    seen = {frozenset(start.tolist())}
+    queue = deque([(tableau, start, None)])
+    vertices, rays = {}, {}
+    deadline = time.perf_counter() + time_limit
+    complete = True
+
+    while queue:
+        if vertices and (len(vertices) >= max_vertices or time.perf_counter() > deadline):
+            complete = False
+            break
+        T, B, reached_by = queue.popleft()
+        original = B < n_vars
+
+        point = np.zeros(n_vars)
+        point[B[original]] = T[original, -1]
+        point[np.abs(point) <= tol] = 0.0
+        key = tuple(np.round(point, 9) + 0.0)
+        if key not in vertices:
+            vertex = {'solution': point.tolist()}
+            if reached_by is not None:
+                vertex['entering_var'], vertex['pivot_row'] = reached_by
+            vertices[key] = vertex
+
+        in_basis = set(B.tolist())
+        for j in zero:
+            if j in in_basis:
+                continue
+            col = T[:, j]
+            positive = col > tol
+            if not np.any(positive):
+                direction = np.zeros(n_vars)
+                direction[B[original]] = -col[original]
+                if j < n_vars:
+                    direction[j] = 1.0
+                norm = np.abs(direction).max()
+                if norm > tol:
+                    rays.setdefault(tuple(np.round(direction / norm, 9) + 0.0), (direction / norm).tolist())
+                continue
+
+            ratios = np.full(col.shape, np.inf)
+            ratios[positive] = T[positive, -1] / col[positive]
+            theta = ratios.min()
+            for r in np.flatnonzero(ratios <= theta + tol):
+                B_next = B.copy()
+                B_next[r] = j
+                signature = frozenset(B_next.tolist())
+                if signature in seen:
+                    continue
+                seen.add(signature)
+                T_next = T.copy()
+                T_next[r] /= T_next[r, j]
+                factors = T_next[:, j].copy()
+                factors[r] = 0.0
+                T_next -= np.outer(factors, T_next[r])
+                queue.append((T_next, B_next, (int(j), int(r))))
+
+    points = np.array([v['solution'] for v in vertices.values()])
+    span = np.vstack([points[1:] - points[0]] + [np.atleast_2d(ray) for ray in rays.values()])
+    dimension = int(np.linalg.matrix_rank(span, tol=1e-7)) if span.size else 0
+
+    return {'vertices': list(vertices.values()), 'rays': list(rays.values()), 'dimension': dimension,
+            'complete': complete, 'bases_explored': len(seen)}
+
+
+def alternative_from_column(state, j):
+    """
+    Vértice adyacente al entrar la columna j (razón mínima).
 
-def generate_alternative_solutions(final_tableau, n_vars, tol=1e-8):
+    Returns:
+        dict o None si la columna no tiene razón válida (rayo) o el paso es
+        degenerado y lleva al mismo punto
     """
-    Recorre cada variable NO básica con costo reducido 0,
-    pivotea (Bland: razón mínima) y devuelve las soluciones alternativas.
+    tol = state['tol']
+    col = state['rows'][:, j]
+    positive = col > tol
+    if not np.any(positive):
+        return None
+
+    ratios = np.full(col.shape, np.inf)
+    ratios[positive] = state['rhs'][positive] / col[positive]
+    row = int(np.argmin(ratios))
+    theta = ratios[row]
+    if theta <= tol:
+        return None
+
+    basis = state['basis']
+    solution = state['solution'].copy()
+    n_vars = len(solution)
+    original = (basis >= 0) & (basis < n_vars)
+    solution[basis[original]] -= theta * col[original]
+    if j < n_vars:
+        solution[j] = theta
+    solution[np.abs(solution) <= tol] = 0.0
+
+    return {'solution': solution.tolist(), 'entering_var': int(j), 'pivot_row': row}
+
+
+def generate_alternative_solutions(final_tableau, n_vars, tol=1e-8, basis=None, z_row='first'):
+    """
+    Soluciones alternativas al entrar cada variable no básica con costo
+    reducido 0.
 
     Returns
     -------
@@ -21,263 +209,83 @@ def generate_alternative_solutions(final_tableau, n_vars, tol=1e-8):
         'pivot_row'   : int         # fila (0-based, sin contar Z)
     }
     """
-    alternatives = []
-    z_row  = final_tableau[0, :-1]
-    m_rows = final_tableau.shape[0] - 1     # sin la fila Z
-
-    for j in range(n_vars):
-        col = final_tableau[1:, j]
-
-        # (a) var NO básica  → columna no unitaria
-        is_basic = (np.count_nonzero(col) == 1 and np.isclose(col.max(), 1.0, atol=tol))
-        # (b) costo reducido ≈ 0
-        zero_cost = np.isclose(z_row[j], 0.0, atol=tol)
-
-        if is_basic or not zero_cost:
-            continue
-
-        # filas con coeficiente positivo
-        positive = np.where(col > tol)[0]
-        if positive.size == 0:
-            continue
-
-        # razón mínima (Bland)
-        rhs      = final_tableau[1:, -1][positive]
-        ratios   = rhs / col[positive]
-        p_row    = positive[np.argmin(ratios)] + 1   # +1 para incluir fila Z
-
-        # --- pivotar en una copia ---
-        T = final_tableau.copy()
-        T[p_row] /= T[p_row, j]               # normaliza
-        for r in range(T.shape[0]):
-            if r != p_row:
-                T[r] -= T[r, j] * T[p_row]
-
-        # --- extraer solución de la copia ---
-        alt_sol = np.zeros(n_vars)
-        for k in range(n_vars):
-            col_k = T[1:, k]
-            if np.count_nonzero(col_k) == 1 and np.isclose(col_k.max(), 1.0, atol=tol):
-                basic_row = np.where(np.isclose(col_k, 1.0, atol=tol))[0][0] + 1
-                alt_sol[k] = T[basic_row, -1]
-
-        alternatives.append({
-            'solution'    : alt_sol.tolist(),
-            'entering_var': j,
-            'pivot_row'   : p_row - 1        })
+    state = basis_state(final_tableau, n_vars, basis, z_row, tol)
+    return _alternatives(state, state['zero_cost'])
+
 
+def generate_alternative_solutions_from_slack(final_tableau, n_orig_vars, slack_candidates, tol=1e-8,
+                                              basis=None, z_row='first'):
+    """
+    Soluciones alternativas al entrar las holguras indicadas.
+    """
+    state = basis_state(final_tableau, n_orig_vars, basis, z_row, tol)
+    return _alternatives(state, slack_candidates)
+
+
+def _alternatives(state, columns):
+    alternatives = []
+    for j in columns:
+        alternative = alternative_from_column(state, j)
+        if alternative is not None:
+            alternatives.append(alternative)
     return alternatives
 
 
-def detect_multiple_solutions(final_tableau, n_orig_vars, c, minimize=False):
+def detect_multiple_solutions(final_tableau, n_orig_vars, c=None, minimize=False, basis=None,
+                              z_row='first', tol=1e-8, max_vertices=MAX_OPTIMAL_VERTICES,
+                              time_limit=FACE_TIME_LIMIT):
     """
-    Detecta soluciones múltiples óptimas con método mejorado.
-    
-    Métodos de detección:
-    1. Variables no básicas con costo reducido cero (método clásico)
-    2. Análisis de degeneración y variables básicas con costo cero
-    3. Verificación geométrica cuando todas las variables son básicas
+    Detecta soluciones óptimas múltiples a partir del tableau final.
+
+    Si alguna variable no básica tiene costo reducido 0 se enumera la cara
+    óptima (ver enumerate_optimal_face); hay óptimos múltiples si su
+    dimensión es mayor que 0.
+
+    'variables_with_zero_cost' son las variables originales no básicas con
+    costo reducido 0 y 'varying_variables' las que toman más de un valor en
+    la cara óptima (vértices o rayos).
+
+    Args:
+        basis: base registrada por el solver (stats['basis'])
+        z_row: 'first' (simplex, Gran M) o 'last' (Dos Fases)
     """
     info = {
         'has_multiple_solutions': False,
         'variables_with_zero_cost': [],
+        'varying_variables': [],
         'alternative_solutions': [],
         'detection_method': 'none'
     }
 
-    z_row = final_tableau[0, :-1]
-    tol = 1e-8
-    
-    # Método 1: Variables no básicas con costo reducido 0 (método clásico)
-    for j in range(n_orig_vars):
-        col = final_tableau[1:, j]
-        is_basic = (np.count_nonzero(col) == 1 and np.isclose(col.max(), 1.0, atol=tol))
-        zero_cost = np.isclose(z_row[j], 0.0, atol=tol)
-        
-        if not is_basic and zero_cost:
-            info['variables_with_zero_cost'].append(j)
-    
-    if info['variables_with_zero_cost']:
-        info['has_multiple_solutions'] = True
-        info['detection_method'] = 'nonbasic_zero_cost'
-        info['alternative_solutions'] = generate_alternative_solutions(
-            final_tableau, n_orig_vars
-        )
+    state = basis_state(final_tableau, n_orig_vars, basis, z_row, tol)
+    if state['zero_cost'].size == 0:
         return info
+    zero_cost = state['zero_cost']
+    info['variables_with_zero_cost'] = zero_cost[zero_cost < n_orig_vars].tolist()
 
-    # Método 2: Verificar si todas las variables originales son básicas con costo 0
-    # Esto puede indicar que estamos en un vértice donde múltiples aristas son óptimas
-    all_basic_zero_cost = True
-    basic_vars_count = 0
-    
-    for j in range(n_orig_vars):
-        col = final_tableau[1:, j]
-        is_basic = (np.count_nonzero(col) == 1 and np.isclose(col.max(), 1.0, atol=tol))
-        zero_cost = np.isclose(z_row[j], 0.0, atol=tol)
-        
-        if is_basic:
-            basic_vars_count += 1
-            if not zero_cost:
-                all_basic_zero_cost = False
-        # Note: we don't set all_basic_zero_cost to False for non-basic variables
-        # because we only care about whether basic variables have zero cost
-    
-    # Si todas las variables básicas tienen costo 0, verificar variables de holgura
-    if all_basic_zero_cost and basic_vars_count > 0:
-        # Buscar variables de holgura no básicas con costo cero
-        slack_candidates = []
-        for j in range(n_orig_vars, len(z_row)):
-            col = final_tableau[1:, j]
-            is_basic = (np.count_nonzero(col) == 1 and np.isclose(col.max(), 1.0, atol=tol))
-            zero_cost = np.isclose(z_row[j], 0.0, atol=tol)
-            if not is_basic and zero_cost:
-                slack_candidates.append(j)
-        
-        if slack_candidates:
-            info['has_multiple_solutions'] = True
-            info['detection_method'] = 'slack_zero_cost'
-            info['alternative_solutions'] = generate_alternative_solutions_from_slack(
-                final_tableau, n_orig_vars, slack_candidates
-            )
-            return info
-    
-    # Método 3: Verificación especial para casos donde todas las variables originales son básicas
-    # pero los coeficientes de la función objetivo son iguales (indicador fuerte de soluciones múltiples)
-    if basic_vars_count >= 2:
-        # Verificar si los coeficientes originales son iguales o proporcionales
-        c_array = np.array(c)
-        if len(set(np.abs(c_array))) == 1 and c_array[0] != 0:
-            info['has_multiple_solutions'] = True
-            info['detection_method'] = 'equal_coefficients'
-            info['alternative_solutions'] = generate_solutions_from_equal_coefficients(
-                final_tableau, n_orig_vars, c
-            )
-            return info
-
-    return info
+    face = _explore_optimal_face(state, max_vertices, time_limit)
+    if face['dimension'] == 0:
+        return info
 
+    points = np.array([v['solution'] for v in face['vertices']])
+    varying = np.ptp(points, axis=0) > tol
+    for ray in face['rays']:
+        varying |= np.abs(ray) > tol
 
-def format_multiple_solutions_result(info):
-    """
-    Simple pass-through (aquí podrías dar formato distinto si tu UI lo requiere)
-    """
+    info['has_multiple_solutions'] = True
+    info['varying_variables'] = np.flatnonzero(varying).tolist()
+    info['alternative_solutions'] = face['vertices'][1:]
+    info['detection_method'] = 'optimal_face'
+    info['optimal_vertices'] = [v['solution'] for v in face['vertices']]
+    info['optimal_rays'] = face['rays']
+    info['face_dimension'] = face['dimension']
+    info['face_complete'] = face['complete']
     return info
 
 
-def generate_alternative_solutions_from_slack(final_tableau, n_orig_vars, slack_candidates, tol=1e-8):
-    """
-    Genera soluciones alternativas cuando variables de holgura no básicas tienen costo reducido cero.
-    """
-    alternatives = []
-    
-    for slack_var in slack_candidates:
-        # Verificar si podemos hacer básica esta variable de holgura
-        col = final_tableau[1:, slack_var]
-        rhs = final_tableau[1:, -1]
-        
-        # Buscar filas donde el coeficiente de la variable de holgura es positivo
-        positive_indices = np.where(col > tol)[0]
-        
-        if len(positive_indices) == 0:
-            continue
-            
-        # Calcular ratios para determinar la fila pivote
-        ratios = []
-        valid_rows = []
-        
-        for i in positive_indices:
-            if rhs[i] >= 0:  # Solo considerar filas factibles
-                ratios.append(rhs[i] / col[i])
-                valid_rows.append(i)
-        
-        if not ratios:
-            continue
-            
-        # Seleccionar la fila con menor ratio
-        min_ratio_idx = np.argmin(ratios)
-        pivot_row = valid_rows[min_ratio_idx] + 1  # +1 para incluir fila Z
-        
-        # Crear tableau alternativo pivoteando
-        T = final_tableau.copy()
-        T[pivot_row] /= T[pivot_row, slack_var]
-        
-        for r in range(T.shape[0]):
-            if r != pivot_row:
-                T[r] -= T[r, slack_var] * T[pivot_row]
-        
-        # Extraer solución alternativa
-        alt_sol = np.zeros(n_orig_vars)
-        for k in range(n_orig_vars):
-            col_k = T[1:, k]
-            if np.count_nonzero(col_k) == 1 and np.isclose(col_k.max(), 1.0, atol=tol):
-                basic_row = np.where(np.isclose(col_k, 1.0, atol=tol))[0][0] + 1
-                alt_sol[k] = T[basic_row, -1]
-
-        # Verificar que es una solución diferente y factible
-        current_sol = np.zeros(n_orig_vars)
-        for k in range(n_orig_vars):
-            col_k = final_tableau[1:, k]
-            if np.count_nonzero(col_k) == 1 and np.isclose(col_k.max(), 1.0, atol=tol):
-                basic_row = np.where(np.isclose(col_k, 1.0, atol=tol))[0][0] + 1
-                current_sol[k] = final_tableau[basic_row, -1]
-        
-        if not np.allclose(alt_sol, current_sol, atol=tol) and np.all(alt_sol >= -tol):
-            alternatives.append({
-                'solution': alt_sol.tolist(),
-                'entering_var': slack_var,
-                'pivot_row': pivot_row - 1
-            })
-    
-    return alternatives
-
-
-def generate_solutions_from_equal_coefficients(final_tableau, n_orig_vars, c, tol=1e-8):
+def format_multiple_solutions_result(info):
     """
-    Genera soluciones alternativas cuando los coeficientes de la función objetivo son iguales,
-    lo que geométricamente indica que múltiples vértices son óptimos.
+    Agrega `multiple_solution_vars` (las variables que varían en la cara
+    óptima), el nombre que usan las plantillas.
     """
-    alternatives = []
-    
-    # Obtener la solución actual
-    current_sol = np.zeros(n_orig_vars)
-    basic_vars = []
-    
-    for k in range(n_orig_vars):
-        col_k = final_tableau[1:, k]
-        if np.count_nonzero(col_k) == 1 and np.isclose(col_k.max(), 1.0, atol=tol):
-            basic_row = np.where(np.isclose(col_k, 1.0, atol=tol))[0][0] + 1
-            current_sol[k] = final_tableau[basic_row, -1]
-            basic_vars.append(k)
-    
-    # Cuando los coeficientes son iguales, cualquier combinación convexa de vértices
-    # con el mismo valor objetivo es óptima
-    if len(basic_vars) >= 2:
-        # Generar algunas soluciones convexas alternativas
-        for i in range(len(basic_vars)):
-            alt_sol = current_sol.copy()
-            # Intercambiar valores entre variables básicas
-            if i + 1 < len(basic_vars):
-                var1, var2 = basic_vars[i], basic_vars[i + 1]
-                alt_sol[var1], alt_sol[var2] = alt_sol[var2], alt_sol[var1]
-                
-                if not np.allclose(alt_sol, current_sol, atol=tol):
-                    alternatives.append({
-                        'solution': alt_sol.tolist(),
-                        'entering_var': var2,
-                        'pivot_row': -1  # Indicador especial para combinación convexa
-                    })
-    
-    # También generar combinaciones convexas más sofisticadas
-    if len(basic_vars) >= 2:
-        # Generar algunas combinaciones convexas con diferentes pesos
-        weights = [0.25, 0.5, 0.75]
-        for w in weights:
-            alt_sol = current_sol * w + current_sol * (1 - w)  # Combinación convexa simple
-            alternatives.append({
-                'solution': alt_sol.tolist(),
-                'entering_var': -1,  # Indicador especial
-                'pivot_row': -1,
-                'weight': w
-            })
-    
-    return alternatives
+    return {**info, 'multiple_solution_vars': info['varying_variables']}
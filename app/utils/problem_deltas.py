@@ -0,0 +1,127 @@
+"""
+Cambios incrementales sobre problemas registrados.
+
+Un cambio es uno de:
+    {"op": "set", "field": "A", "index": [i, j], "value": v}
+    {"op": "set", "field": "b" | "c" | "sense", "index": k, "value": v}
+    {"op": "add_row", "coefficients": [...], "rhs": v, "sense": "≤"}
+    {"op": "remove_row", "index": i}
+    {"op": "add_column", "coefficients": [...], "cost": v}
+
+Además de aplicar los cambios, se lleva la identidad de cada fila para
+trasladar la base óptima del problema original al modificado.
+"""
+
+import numpy as np
+
+from ..solvers import inequality_row_labels, column_labels
+from .problem_registry import SENSES
+
+
+def _sense(value):
+    if value not in SENSES:
+        raise ValueError(f"sense debe ser uno de {', '.join(SENSES)}")
+    return value
+
+
+def apply_changes(problem, changes):
+    """
+    Aplica `changes` sobre una copia de c, A, b y sense.
+
+    Returns:
+        tuple: (c, A, b, sense, row_ids) donde row_ids[i] es el índice de la
+        fila en el problema original, o ('new', k) si la fila es nueva o
+        cambió de sentido.
+
+    Raises:
+        ValueError / IndexError / KeyError: Si un cambio no es válido
+    """
+    c = np.array(problem['c'], dtype=float)
+    A = np.array(problem['A'], dtype=float)
+    b = np.array(problem['b'], dtype=float)
+    sense = list(problem['sense'])
+    row_ids = list(range(len(b)))
+    new_rows = 0
+
+    for change in changes:
+        op = change.get('op')
+        if op == 'set':
+            field, index = change['field'], change['index']
+            if field == 'A':
+                i, j = int(index[0]), int(index[1])
+                if not (0 <= i < A.shape[0] and 0 <= j < A.shape[1]):
+                    raise IndexError(f"No existe el coeficiente A[{i}, {j}]")
+                A[i, j] = float(change['value'])
+            elif field in ('b', 'c'):
+                vector = b if field == 'b' else c
+                k = int(index)
+                if not 0 <= k < len(vector):
+                    raise IndexError(f"No existe {field}[{k}]")
+                vector[k] = float(change['value'])
+            elif field == 'sense':
+                i = int(index)
+                if not 0 <= i < len(sense):
+                    raise IndexError(f"No existe la fila {i}")
+                sense[i] = _sense(change['value'])
+                row_ids[i] = ('new', new_rows)
+                new_rows += 1
+            else:
+                raise ValueError(f"Campo desconocido: {field}")
+        elif op == 'add_row':
+            row = np.asarray(change['coefficients'], dtype=float)
+            if row.shape != (len(c),):
+                raise ValueError(f"La fila nueva debe tener {len(c)} coeficientes")
+            A = np.vstack([A, row])
+            b = np.append(b, float(change['rhs']))
+            sense.append(_sense(change.get('sense', '≤')))
+            row_ids.append(('new', new_rows))
+            new_rows += 1
+        elif op == 'remove_row':
+            i = int(change['index'])
+            if not 0 <= i < len(b):
+                raise IndexError(f"No existe la fila {i}")
+            if len(b) == 1:
+                raise ValueError("El problema debe conservar al menos una restricción")
+            A = np.delete(A, i, axis=0)
+            b = np.delete(b, i)
+            del sense[i]
+            del row_ids[i]
+        elif op == 'add_column':
+            column = np.asarray(change['coefficients'], dtype=float)
+            if column.shape != (len(b),):
+                raise ValueError(f"La columna nueva debe tener {len(b)} coeficientes")
+            A = np.hstack([A, column[:, None]])
+            c = np.append(c, float(change.get('cost', 0.0)))
+        else:
+            raise ValueError(f"Operación desconocida: {op}")
+
+    return c, A, b, sense, row_ids
+
+
+def transfer_basis(basis, n_old, sense_old, n_new, sense_new, row_ids):
+    """
+    Traslada una base de la forma ≤ del problema original a la del modificado.
+
+    Las columnas agregadas entran como no básicas; las filas nuevas aportan
+    su holgura como básica. Devuelve None si la base no se puede trasladar
+    (p. ej. se quitó una fila cuya holgura no era básica) y hay que partir
+    de cero.
+    """
+    old_labels = column_labels(n_old, inequality_row_labels(sense_old))
+    position = {rid: i for i, rid in enumerate(row_ids)}
+
+    labels = []
+    for j in basis:
+        label = old_labels[j]
+        if label[0] == 'x':
+            labels.append(label)
+        elif label[1] in position:
+            labels.append(('s', position[label[1]], label[2]))
+
+    new_rows = inequality_row_labels(sense_new)
+    labels.extend(('s', i, kind) for i, kind in new_rows if isinstance(row_ids[i], tuple))
+
+    index = {label: k for k, label in enumerate(column_labels(n_new, new_rows))}
+    if len(labels) != len(new_rows) or any(label not in index for label in labels):
+        return None
+    return [index[label] for label in labels]
@@ -0,0 +1,174 @@
+"""
+Registro de problemas grandes por hash de contenido.
+
+c, A y b se guardan una sola vez como archivos .npy en
+`<raíz>/<problem_id>/` y se cargan con memory-map, de modo que las
+peticiones de resolución solo envían `problem_id` y cambios pequeños.
+El id es el SHA-256 de los datos, así que registrar dos veces el mismo
+problema devuelve el mismo id.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .validation import to_vector, to_matrix, validate_dimensions
+
+_PROBLEM_ID = re.compile(r'^[0-9a-f]{64}$')
+SENSES = ('≤', '≥', '=')
+# Problemas abiertos (memmaps) que se mantienen por proceso
+MAX_OPEN_PROBLEMS = 32
+
+
+def senses_from_indices(m, eq_constraints=None, ge_constraints=None):
+    """Vector de sentidos a partir de los índices de restricciones = y ≥."""
+    sense = ['≤'] * m
+    for i in eq_constraints or []:
+        sense[int(i)] = '='
+    for i in ge_constraints or []:
+        sense[int(i)] = '≥'
+    return sense
+
+
+def problem_hash(c, A, b, sense):
+    """Hash de contenido de un problema (formas, dtypes, bytes y sentidos)."""
+    h = hashlib.sha256()
+    for name, arr in (('c', c), ('A', A), ('b', b)):
+        h.update(f'{name}:{arr.dtype.str}:{arr.shape}:'.encode())
+        h.update(np.ascontiguousarray(arr).data)
+    h.update(','.join(sense).encode())
+    return h.hexdigest()
+
+
+class ProblemRegistry:
+    """Problemas de PL almacenados como .npy bajo `root`."""
+
+    def __init__(self, root):
+        self.root = root
+        self._open = OrderedDict()      # problem_id → problema cargado (LRU)
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, problem_id):
+        if not isinstance(problem_id, str) or not _PROBLEM_ID.match(problem_id):
+            raise KeyError(problem_id)
+        return os.path.join(self.root, problem_id)
+
+    def register(self, c, A, b, sense=None):
+        """
+        Valida y guarda un problema.
+
+        Returns:
+            tuple: (problem_id, info, creado) donde `creado` es False si el
+            problema ya estaba registrado.
+
+        Raises:
+            ValueError / DimensionError: Si los datos no son válidos
+        """
+        c = to_vector(c, 'c')
+        b = to_vector(b, 'b')
+        A = to_matrix(A, 'A')
+        validate_dimensions(A, b, c)
+        sense = list(sense) if sense is not None else ['≤'] * len(b)
+        if len(sense) != len(b) or any(s not in SENSES for s in sense):
+            raise ValueError(f"sense debe tener {len(b)} valores entre {', '.join(SENSES)}")
+
+        problem_id = problem_hash(c, A, b, sense)
+        path = self._path(problem_id)
+        info = {'problem_id': problem_id, 'n_vars': len(c), 'n_constraints': len(b), 'sense': sense}
+        if os.path.isdir(path):
+            return problem_id, info, False
+
+        # Se escribe en un directorio temporal y se renombra: otro proceso
+        # nunca ve un problema a medio escribir
+        tmp = tempfile.mkdtemp(dir=self.root, prefix='.tmp-')
+        try:
+            for name, arr in (('c', c), ('A', A), ('b', b)):
+                np.save(os.path.join(tmp, f'{name}.npy'), arr)
+            with open(os.path.join(tmp, 'meta.json'), 'w') as f:
+                json.dump(info, f, ensure_ascii=False)
+            os.rename(tmp, path)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            if not os.path.isdir(path):
+                raise
+        return problem_id, info, True
+
+    def info(self, problem_id):
+        """Metadatos del problema (sin cargar las matrices)."""
+        try:
+            with open(os.path.join(self._path(problem_id), 'meta.json')) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise KeyError(problem_id)
+
+    def load(self, problem_id):
+        """
+        Problema registrado con c, A y b como memmaps de solo lectura.
+
+        Raises:
+            KeyError: Si el id no existe
+        """
+        with self._lock:
+            problem = self._open.get(problem_id)
+            if problem is not None:
+                self._open.move_to_end(problem_id)
+                return problem
+
+        path = self._path(problem_id)
+        problem = self.info(problem_id)
+        for name in ('c', 'A', 'b'):
+            problem[name] = np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r')
+
+        with self._lock:
+            self._open[problem_id] = problem
+            while len(self._open) > MAX_OPEN_PROBLEMS:
+                self._open.popitem(last=False)
+        return problem
+
+    def save_basis(self, problem_id, minimize, basis):
+        """Guarda la última base óptima (forma ≤) para reanudar desde ella."""
+        path = os.path.join(self._path(problem_id), f"basis-{'min' if minimize else 'max'}.json")
+        tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp, 'w') as f:
+            json.dump([int(j) for j in basis], f)
+        os.replace(tmp, path)
+
+    def load_basis(self, problem_id, minimize):
+        """Última base óptima guardada o None."""
+        path = os.path.join(self._path(problem_id), f"basis-{'min' if minimize else 'max'}.json")
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def delete(self, problem_id):
+        """Elimina un problema; devuelve False si no existía."""
+        path = self._path(problem_id)
+        with self._lock:
+            self._open.pop(problem_id, None)
+        if not os.path.isdir(path):
+            return False
+        shutil.rmtree(path, ignore_errors=True)
+        return True
+
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+
+def get_problem_registry(root):
+    """Instancia compartida del registro para `root` (una por proceso)."""
+    with _registries_lock:
+        registry = _registries.get(root)
+        if registry is None:
+            registry = _registries[root] = ProblemRegistry(root)
+        return registry
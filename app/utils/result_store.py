@@ -0,0 +1,141 @@
+"""
+Almacén temporal de resultados para descarga.
+
+Cada resolución desde los formularios guarda su exportación JSON en disco
+bajo un id corto; la página solo enlaza `GET /descargar/<id>` en lugar de
+incrustar el resultado completo en un campo oculto que el navegador tenía
+que volver a enviar. Los resultados caducan tras `ttl` segundos y el total
+se limita a `max_bytes` (se eliminan primero los más antiguos).
+
+Cada resultado es un directorio `<id>/` con `result.json`, `meta.json` y,
+si hubo seguimiento de iteraciones, el historial de tableaus en .npy (ver
+history_export) para exportarlo sin cargarlo entero en memoria.
+"""
+
+import json
+import os
+import re
+import secrets
+import shutil
+import threading
+import time
+import logging
+
+from .history_export import save_history
+
+logger = logging.getLogger(__name__)
+
+_RESULT_ID = re.compile(r'^[A-Za-z0-9_-]{16}$')
+
+
+def _dir_size(path):
+    total = 0
+    for entry in os.scandir(path):
+        try:
+            total += entry.stat().st_size
+        except OSError:
+            pass
+    return total
+
+
+class ResultStore:
+    """Resultados serializados en `root`, con caducidad y tamaño máximo."""
+
+    def __init__(self, root, ttl=3600, max_bytes=256 * 1024 * 1024):
+        self.root = root
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def put(self, content, filename, tableau_history=None, pivot_history=None, phases=None, steps=None):
+        """
+        Guarda `content` (str o bytes) y, opcionalmente, el historial de
+        iteraciones con la fase y el pivote de cada tableau si el solver los
+        registró (ver history_export.save_history). Devuelve el id del
+        resultado.
+
+        Returns:
+            str o None si el resultado supera por sí solo `max_bytes`
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+
+        result_id = secrets.token_urlsafe(12)
+        path = os.path.join(self.root, result_id)
+        os.makedirs(path)
+        with open(os.path.join(path, 'result.json'), 'wb') as f:
+            f.write(content)
+        with open(os.path.join(path, 'meta.json'), 'w') as f:
+            json.dump({'filename': filename}, f)
+        if tableau_history:
+            save_history(path, tableau_history, pivot_history or [], phases, steps)
+
+        if _dir_size(path) > self.max_bytes:
+            logger.warning(f"Resultado {result_id} excede el máximo de descarga")
+            shutil.rmtree(path, ignore_errors=True)
+            return None
+        self._evict()
+        return result_id
+
+    def path(self, result_id):
+        """Directorio de un resultado vigente o None si no existe o caducó."""
+        if not _RESULT_ID.match(result_id or ''):
+            return None
+        path = os.path.join(self.root, result_id)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+        except OSError:
+            return None
+        return path
+
+    def get(self, result_id):
+        """
+        Ruta del JSON y nombre de descarga de un resultado vigente.
+
+        Returns:
+            tuple: (ruta, nombre de archivo) o None si no existe o caducó
+        """
+        path = self.path(result_id)
+        if path is None:
+            return None
+        try:
+            with open(os.path.join(path, 'meta.json')) as f:
+                return os.path.join(path, 'result.json'), json.load(f)['filename']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _evict(self):
+        """Borra los resultados caducados y, si hace falta, los más antiguos."""
+        with self._lock:
+            now = time.time()
+            entries = []
+            for entry in os.scandir(self.root):
+                if not entry.is_dir() or not _RESULT_ID.match(entry.name):
+                    continue
+                try:
+                    entries.append((entry.stat().st_mtime, _dir_size(entry.path), entry.path))
+                except OSError:
+                    continue
+
+            entries.sort()
+            total = sum(size for _, size, _ in entries)
+            for mtime, size, path in entries:
+                if now - mtime <= self.ttl and total <= self.max_bytes:
+                    break
+                shutil.rmtree(path, ignore_errors=True)
+                total -= size
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_result_store(root, ttl=3600, max_bytes=256 * 1024 * 1024):
+    """Instancia compartida del almacén para `root` (una por proceso)."""
+    with _stores_lock:
+        store = _stores.get(root)
+        if store is None:
+            store = _stores[root] = ResultStore(root, ttl, max_bytes)
+        return store
@@ -0,0 +1,110 @@
+"""
+Módulo para transmitir las iteraciones de los solvers mientras se ejecutan.
+"""
+
+import json
+import queue
+import threading
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class _StreamClosed(Exception):
+    """Señal interna para detener el solver cuando el consumidor se va."""
+    pass
+
+
+def iter_solver_events(solver, *args, max_pending=4, **kwargs):
+    """
+    Ejecuta `solver` en un hilo y genera sus eventos a medida que ocurren.
+
+    El solver recibe un `callback` que copia cada tableau en una cola acotada,
+    de modo que como mucho hay `max_pending` snapshots en memoria aunque el
+    consumidor sea lento.
+
+    Yields:
+        dict: {'event': 'iteration', 'iteration', 'row', 'col', 'tableau'}
+              por cada tableau, y al final {'event': 'result', 'result'}
+              con la tupla devuelta por el solver o {'event': 'error', 'error'}.
+    """
+    events = queue.Queue(maxsize=max_pending)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                events.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+        raise _StreamClosed()
+
+    def callback(k, row, col, tableau):
+        put({'event': 'iteration', 'iteration': k, 'row': row, 'col': col,
+             'tableau': tableau.copy()})
+
+    def run():
+        try:
+            result = solver(*args, callback=callback, **kwargs)
+            put({'event': 'result', 'result': result})
+        except _StreamClosed:
+            return
+        except Exception as e:
+            try:
+                put({'event': 'error', 'error': e})
+            except _StreamClosed:
+                return
+        try:
+            put(_DONE)
+        except _StreamClosed:
+            pass
+
+    worker = threading.Thread(target=run, daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = events.get()
+            if item is _DONE:
+                break
+            yield item
+    finally:
+        stop.set()
+
+
+def iter_pivot_events(events):
+    """
+    Convierte los eventos de `iter_solver_events` en eventos compactos.
+
+    El primer tableau de cada fase (pivote None) se emite completo como
+    'tableau'; los siguientes se emiten como 'pivot' con solo las entradas
+    que cambiaron respecto al anterior: [[fila, columna, valor], ...].
+    """
+    prev = None
+    seq = 0
+    for item in events:
+        if item['event'] != 'iteration':
+            yield item
+            continue
+
+        T = item['tableau']
+        if item['row'] is None or prev is None or prev.shape != T.shape:
+            payload = {'event': 'tableau', 'seq': seq, 'iteration': item['iteration'],
+                       'tableau': T.tolist()}
+        else:
+            rows, cols = np.nonzero(T != prev)
+            payload = {'event': 'pivot', 'seq': seq, 'iteration': item['iteration'],
+                       'row': int(item['row']), 'col': int(item['col']),
+                       'changes': [list(e) for e in zip(rows.tolist(), cols.tolist(),
+                                                        T[rows, cols].tolist())]}
+        prev = T
+        seq += 1
+        yield payload
+
+
+def sse_message(event, data):
+    """Formatea un mensaje Server-Sent Events."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
@@ -2,8 +2,116 @@
 Módulo para validaciones de datos de entrada.
 """
 
+import io
+import re
+import numpy as np
+
 from ..solvers import DimensionError
 
+# Comas sobrantes al final de una fila ("1,2,3,")
+_TRAILING_COMMA = re.compile(r',[ \t]*(?=\r?\n|$)')
+
+
+def _is_number(value):
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _raise_row_error(text, name):
+    """Recorre las filas para reportar cuál falló (solo en el camino de error)."""
+    width = None
+    rows = [row for row in text.splitlines() if row.strip()]
+    for i, row in enumerate(rows, start=1):
+        values = row.split(',')
+        for value in values:
+            if not _is_number(value):
+                raise ValueError(f"Fila {i} de {name}: '{value.strip()}' no es un número válido")
+        if width is None:
+            width = len(values)
+        elif len(values) != width:
+            raise DimensionError(
+                f"La fila {i} de {name} tiene {len(values)} valores, pero la fila 1 tiene {width}"
+            )
+    raise ValueError(f"La matriz {name} no tiene un formato válido")
+
+
+def parse_vector(text, name):
+    """
+    Convierte "1, 2, 3" en un arreglo float64.
+
+    Raises:
+        ValueError: Si está vacío o contiene valores no numéricos
+    """
+    values = [x for x in text.split(',') if x.strip()]
+    if not values:
+        raise ValueError(f"El vector {name} no puede estar vacío")
+    try:
+        return np.array(values, dtype=float)
+    except ValueError:
+        bad = next(x for x in values if not _is_number(x))
+        raise ValueError(f"El vector {name} contiene un valor no numérico: '{bad.strip()}'")
+
+
+def parse_matrix(text, name='A', n_rows=None, n_cols=None):
+    """
+    Convierte el texto de un textarea (filas por línea, valores separados por
+    comas) en un arreglo float64 de una sola pasada con `np.loadtxt`.
+
+    Args:
+        text: Texto de la matriz
+        name: Nombre usado en los mensajes de error
+        n_rows: Número de filas esperado (opcional)
+        n_cols: Número de columnas esperado (opcional)
+
+    Raises:
+        ValueError: Si hay valores no numéricos (indicando la fila)
+        DimensionError: Si las filas son irregulares o la forma no coincide
+    """
+    cleaned = text.strip()
+    if cleaned.endswith(',') or ',\n' in cleaned or ',\r\n' in cleaned:
+        cleaned = _TRAILING_COMMA.sub('', cleaned)
+    if not cleaned:
+        raise ValueError(f"La matriz {name} no puede estar vacía")
+    try:
+        M = np.loadtxt(io.StringIO(cleaned), delimiter=',', ndmin=2, dtype=float)
+    except ValueError:
+        _raise_row_error(cleaned, name)
+
+    if n_cols is not None and M.shape[1] != n_cols:
+        raise DimensionError(f"La matriz {name} debe tener {n_cols} columnas, pero tiene {M.shape[1]}")
+    if n_rows is not None and M.shape[0] != n_rows:
+        raise DimensionError(f"La matriz {name} tiene {M.shape[0]} filas pero se esperaban {n_rows}")
+    return M
+
+
+def to_vector(value, name):
+    """Vector float64 a partir de texto "1,2,3" o de una lista."""
+    if isinstance(value, str):
+        return parse_vector(value, name)
+    try:
+        v = np.asarray(value, dtype=float)
+    except (TypeError, ValueError):
+        raise ValueError(f"El vector {name} contiene valores no numéricos")
+    if v.ndim != 1 or v.size == 0:
+        raise DimensionError(f"El vector {name} debe ser una lista no vacía de números")
+    return v
+
+
+def to_matrix(value, name):
+    """Matriz float64 a partir del texto de un textarea o de una lista de filas."""
+    if isinstance(value, str):
+        return parse_matrix(value, name)
+    try:
+        M = np.asarray(value, dtype=float)
+    except (TypeError, ValueError):
+        raise DimensionError(f"La matriz {name} debe tener filas numéricas de igual longitud")
+    if M.ndim != 2 or M.size == 0:
+        raise DimensionError(f"La matriz {name} debe ser una lista no vacía de filas")
+    return M
+
 
 def validate_dimensions(A, b, c):
     """
@@ -20,7 +128,10 @@ def validate_dimensions(A, b, c):
     if len(A) != len(b):
         raise DimensionError(f"La matriz A tiene {len(A)} filas pero el vector b tiene {len(b)} elementos")
     
-    if any(len(row) != len(c) for row in A):
+    if isinstance(A, np.ndarray):
+        if A.ndim != 2 or A.shape[1] != len(c):
+            raise DimensionError(f"La matriz A debe tener {len(c)} columnas para coincidir con el vector c")
+    elif any(len(row) != len(c) for row in A):
         raise DimensionError(f"La matriz A debe tener {len(c)} columnas para coincidir con el vector c")
 
 
@@ -32,41 +143,25 @@ def validate_form_data(form_data):
         form_data: Diccionario con los datos del formulario
         
     Returns:
-        dict: Datos validados y procesados
+        dict: Datos validados y procesados (c, A y b como arreglos float64)
         
     Raises:
         ValueError: Si los datos no son válidos
+        DimensionError: Si la forma de A no coincide con c y b
     """
     required_fields = ['c', 'A', 'b']
     for field in required_fields:
         if field not in form_data or not form_data[field].strip():
             raise ValueError(f"El campo '{field}' es requerido")
     
-    # Procesar datos
-    try:
-        c = [float(x) for x in form_data['c'].split(',') if x.strip()]
-        A_rows = form_data['A'].strip().split('\n')
-        A = [[float(num) for num in row.split(',') if num.strip()] 
-             for row in A_rows if row.strip()]
-        b = [float(x) for x in form_data['b'].split(',') if x.strip()]
-        
-        # Validar que no estén vacíos
-        if not c:
-            raise ValueError("El vector de coeficientes c no puede estar vacío")
-        if not A:
-            raise ValueError("La matriz A no puede estar vacía")
-        if not b:
-            raise ValueError("El vector b no puede estar vacío")
-            
-        return {
-            'c': c,
-            'A': A,
-            'b': b,
-            'minimize': form_data.get('minimize', False),
-            'track_iterations': form_data.get('track_iterations', False)
-        }
+    c = parse_vector(form_data['c'], 'c')
+    b = parse_vector(form_data['b'], 'b')
+    A = parse_matrix(form_data['A'], 'A', n_rows=len(b), n_cols=len(c))
         
-    except ValueError as e:
-        if "could not convert string to float" in str(e):
-            raise ValueError("Todos los valores deben ser números válidos")
-        raise
+    return {
+        'c': c,
+        'A': A,
+        'b': b,
+        'minimize': form_data.get('minimize', False),
+        'track_iterations': form_data.get('track_iterations', False)
+    }
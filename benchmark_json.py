@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark de serialización JSON de historiales de tableaus.
+
+Compara el camino anterior (listas a mano + convert_numpy_types + json)
+con NumpyJSONProvider, con y sin orjson.
+Uso: python benchmark_json.py [--iterations 500] [--rows 50] [--cols 100]
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+from flask import Flask
+
+from app.utils import json_provider
+from app.utils.json_provider import NumpyJSONProvider
+
+
+def make_result(iterations, rows, cols):
+    """Resultado con la misma forma que devuelven las rutas con track_iterations."""
+    rng = np.random.default_rng(0)
+    history = [rng.standard_normal((rows + 1, cols + rows + 1)) for _ in range(iterations)]
+    pivots = [(np.int64(rng.integers(1, rows + 1)), np.int64(rng.integers(0, cols))) for _ in range(iterations)]
+    return {
+        'solution': rng.random(cols),
+        'optimal_value': np.float64(42.0),
+        'tableau_history': history,
+        'pivot_history': pivots,
+        'success': True
+    }
+
+
+def convert_numpy_types(obj):
+    """Conversión recursiva que hacían las rutas antes de NumpyJSONProvider."""
+    # Handle numpy scalars (including specific types like int64)
+    if isinstance(obj, (np.integer, np.int64, np.int32, np.int16, np.int8)):
+        return int(obj)
+    elif isinstance(obj, (np.floating, np.float64, np.float32)):
+        return float(obj)
+    elif isinstance(obj, np.bool_):
+        return bool(obj)
+    elif isinstance(obj, np.ndarray):
+        return obj.tolist()
+    # Handle Python built-in types with nested numpy
+    elif isinstance(obj, dict):
+        return {key: convert_numpy_types(value) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return [convert_numpy_types(item) for item in obj]
+    elif isinstance(obj, tuple):
+        return tuple(convert_numpy_types(item) for item in obj)
+    # Check if it's any numpy type we missed
+    elif hasattr(obj, 'dtype') and 'numpy' in str(type(obj)):
+        if obj.ndim == 0:
+            return obj.item()
+        else:
+            return obj.tolist()
+    # Handle any remaining numpy types by checking the type name
+    elif 'numpy' in str(type(obj)) or 'int64' in str(type(obj)):
+        try:
+            return obj.item() if hasattr(obj, 'item') else obj
+        except (ValueError, TypeError):
+            return str(obj)
+    return obj
+
+
+def legacy_dumps(result):
+    resultado = {
+        'solution': [float(x) for x in result['solution']],
+        'optimal_value': float(result['optimal_value']),
+        'tableau_history': [t.tolist() for t in result['tableau_history']],
+        'pivot_history': [[int(r), int(c)] for r, c in result['pivot_history']],
+        'success': True
+    }
+    resultado = convert_numpy_types(resultado)
+    return json.dumps(resultado, sort_keys=True)
+
+
+def timed(label, fn, repeat):
+    best = float('inf')
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = len(fn())
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<28} {best * 1000:10.1f} ms   {size / 1e6:8.2f} MB")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, default=500)
+    parser.add_argument('--rows', type=int, default=50)
+    parser.add_argument('--cols', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    result = make_result(args.iterations, args.rows, args.cols)
+    provider = NumpyJSONProvider(Flask(__name__))
+    print(f"Historial: {args.iterations} tableaus de {args.rows + 1}x{args.cols + args.rows + 1}")
+
+    base = timed('convert_numpy_types + json', lambda: legacy_dumps(result), args.repeat)
+
+    orjson = json_provider.orjson
+    json_provider.orjson = None
+    try:
+        stdlib = timed('NumpyJSONProvider (json)', lambda: provider.dumps(result), args.repeat)
+    finally:
+        json_provider.orjson = orjson
+    print(f"{'':<28} {base / stdlib:10.1f}x")
+
+    if orjson is not None:
+        fast = timed('NumpyJSONProvider (orjson)', lambda: provider.dumps(result), args.repeat)
+        print(f"{'':<28} {base / fast:10.1f}x")
+    else:
+        print("orjson no está instalado: se omite el camino rápido")
+
+
+if __name__ == '__main__':
+    main()